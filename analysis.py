@@ -1,28 +1,315 @@
 """
-토너 리뷰 인사이트 도출 분석 모듈
+리뷰 인사이트 도출 분석 모듈 (토너·세럼·크림·클렌저 등 카테고리 공통)
 10가지 핵심 인사이트를 월별 트렌드와 결합하여 분석
 """
 
+import copy
+import functools
+import threading
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from cooccurrence import CooccurrenceMatrix, feature_columns
+from text_features import load_term_matrix
+from cohort import REVIEWER_ID_COLUMNS, COHORT_ATTRIBUTES, PurchaseSequences, find_reviewer_column
+from validation import VALIDATION_COLUMNS, validate_reviews
+from masks import mask_cache, term_mask
 import warnings
 warnings.filterwarnings('ignore')
 
 
-class TinerInsightAnalysis:
-    def __init__(self, csv_path):
-        """데이터 로드 및 초기화"""
-        try:
-            self.df = pd.read_csv(csv_path, encoding='utf-8-sig')
-        except UnicodeDecodeError:
-            self.df = pd.read_csv(csv_path, encoding='cp949')
-        self.original_df = self.df.copy()
+# 분석 메서드별 필요 컬럼 레지스트리 {메서드명: [컬럼, ...]}
+COLUMN_REQUIREMENTS = {}
+
+
+def requires_columns(*columns):
+    """분석 메서드의 필요 컬럼을 등록하고 호출 전에 해당 컬럼을 확보"""
+    def decorator(method):
+        COLUMN_REQUIREMENTS[method.__name__] = list(columns)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.ensure_columns(columns)
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def columns_for(*method_names):
+    """여러 분석 메서드의 필요 컬럼 합집합"""
+    columns = []
+    for name in method_names:
+        columns.extend(COLUMN_REQUIREMENTS.get(name, []))
+    return list(dict.fromkeys(columns))
+
+
+# 원본 컬럼에서 전처리로 만들어지는 파생 컬럼 {파생 컬럼: 원본 컬럼}
+DERIVED_COLUMN_SOURCES = {'MONTH': '리뷰등록일', 'YEAR_MONTH': '리뷰등록일'}
+
+# 항상 읽는 컬럼 (제품 필터)
+ALWAYS_LOADED_COLUMNS = ['브랜드명']
+
+# 초기 로드에서 제외하고 필요할 때만 읽는 긴 텍스트 컬럼
+LAZY_TEXT_COLUMNS = ['ONE_LINE_SUMMARY', 'REVIEW_CONTENT', '리뷰내용']
+
+
+def source_columns(columns):
+    """파생 컬럼을 원본 컬럼으로 치환한 읽기 대상 컬럼"""
+    return list(dict.fromkeys(DERIVED_COLUMN_SOURCES.get(col, col) for col in columns))
+
+
+def read_review_csv_header(csv_path):
+    """리뷰 CSV 컬럼명만 읽기"""
+    try:
+        return pd.read_csv(csv_path, encoding='utf-8-sig', nrows=0).columns.tolist()
+    except UnicodeDecodeError:
+        return pd.read_csv(csv_path, encoding='cp949', nrows=0).columns.tolist()
+
+
+def read_review_csv(csv_path, usecols=None):
+    """리뷰 CSV 로드 (utf-8-sig 실패 시 cp949, usecols 지정 시 해당 컬럼만)"""
+    if usecols is not None:
+        wanted = set(usecols)
+        usecols = lambda col: col in wanted
+    try:
+        return pd.read_csv(csv_path, encoding='utf-8-sig', usecols=usecols)
+    except UnicodeDecodeError:
+        return pd.read_csv(csv_path, encoding='cp949', usecols=usecols)
+
+
+def count_months(months, mask=None):
+    """월 컬럼의 월별 건수 (mask 지정 시 해당 행만, 결측 월 제외, 건수가 있는 월만)
+
+    정수/실수 월은 np.bincount로 세어 groupby 인수분해 임시 배열(100만 행 기준 약 30MB)을 만들지 않음
+    """
+    values = months.to_numpy()
+    if values.dtype.kind not in 'iuf':
+        selected = months if mask is None else months[mask]
+        return selected.groupby(selected).size()
+    if mask is not None:
+        values = values[mask]
+    if values.dtype.kind == 'f':
+        values = values[~np.isnan(values)]
+    counts = np.bincount(values.astype(np.intp, copy=False), minlength=13)
+    present = np.flatnonzero(counts)
+    return pd.Series(counts[present], index=pd.Index(present, name='MONTH').astype(months.dtype))
+
+
+# 월별 속성 테이블 속성
+ATTRIBUTE_COLUMNS = [
+    ('ABSORPTION_SENTIMENT', '흡수'),
+    ('FINISH_SENTIMENT', '마무리'),
+    ('MOISTURE_SENTIMENT', '보습'),
+    ('TEXTURE_SENTIMENT', '제형'),
+    ('SCENT_SENTIMENT', '향'),
+    ('IRRITATION_SENTIMENT', '자극'),
+    ('SOOTHING_SENTIMENT', '진정')
+]
+
+# IDEA 10 속성 (재구매 vs 전체 긍정 비율 표준편차)
+RESILIENCE_COLUMNS = [
+    ('ABSORPTION_SENTIMENT', '흡수'),
+    ('FINISH_SENTIMENT', '마무리'),
+    ('MOISTURE_SENTIMENT', '보습'),
+    ('OVERALL_SENTIMENT', '전체')
+]
+
+
+class MonthlyInsightTables:
+    """월 × 조건 건수로 10가지 인사이트 표와 월별 속성 테이블을 만드는 공통 구현
+
+    하위 클래스가 size()로 조건 조합의 월별 건수를 제공 (분석 객체는 조건 마스크로 세고,
+    report.MonthlyCounts는 브랜드 × 월로 미리 집계한 건수 테이블에서 읽음)
+    조건 항은 masks.PREDICATES 이름 또는 '컬럼=값'이며 여러 항은 AND
+    """
+
+    def size(self, *terms):
+        """조건 조합의 월별 건수 (건수가 0인 월 제외, 항이 없으면 월별 전체 리뷰 수)"""
+        raise NotImplementedError
+
+    def total(self, *terms):
+        """조건 조합의 월별 건수 (리뷰가 있는 모든 월, 0 포함)"""
+        return self.size(*terms).reindex(self.size().index, fill_value=0)
+
+    def positive_rate(self, *terms, column):
+        """조건 조합 리뷰 중 column이 POSITIVE인 비율(%) (조합 건수가 있는 월만)"""
+        base = self.size(*terms)
+        return (self.total(*terms, f'{column}=POSITIVE')[base.index] / base * 100).round(2)
+
+    def _count_ratio(self, count, count_name, ratio_name='비율'):
+        """월별 건수와 전체 리뷰 대비 비율(%)"""
+        return pd.DataFrame({count_name: count, ratio_name: (count / self.size() * 100).round(2)}).fillna(0)
+
+    def _subset_ratio(self, count, base, count_name, base_name, ratio_name):
+        """월별 건수와 기준 집단 대비 비율(%)"""
+        return pd.DataFrame({
+            count_name: count,
+            base_name: base,
+            ratio_name: (count / base * 100).round(2)
+        }).fillna(0)
+
+    def idea1_absorption_repurchase(self):
+        # 재구매 중 흡수 긍정 비율
+        repurchase = self.size('repurchase')
+        absorption = self.size('repurchase', 'absorption_positive')
+        return pd.DataFrame({
+            '총 재구매 리뷰': repurchase,
+            '흡수 긍정 비율': (absorption / repurchase * 100).round(2)
+        }).fillna(0)
+
+    def idea2_texture_seasonality(self):
+        # 점성/쫀쫀 제형 리뷰의 월별 긍정 비율
+        return pd.DataFrame({'긍정 비율': self.positive_rate('viscous_texture', column='OVERALL_SENTIMENT')})
+
+    def idea3_moisture_summer_dissatisfaction(self):
+        # 보습 부정 ∪ 전체 부정 = 각각의 합 - 교집합
+        either = (
+            self.total('moisture_negative') + self.total('overall_negative')
+            - self.total('moisture_negative', 'overall_negative')
+        )
+        return self._count_ratio(either[either > 0], '보습/전체 부정 리뷰')
+
+    def idea4_freshness_moisture_conflict(self):
+        # 산뜻 + 보습 부정과 각각의 월별 건수
+        return pd.DataFrame({
+            '산뜻+보습불만 동시': self.size('finish_positive', 'moisture_negative'),
+            '산뜻긍정': self.size('finish_positive'),
+            '보습부정': self.size('moisture_negative')
+        }).fillna(0)
+
+    def idea5_scent_seasonality(self):
+        return self._count_ratio(self.size('scent_negative'), '향부정')
+
+    def idea6_neutral_new_purchase(self):
+        # 무난 + 첫구매, 신규 구매 총량 대비
+        return self._subset_ratio(
+            self.size('mild_summary', 'new_purchase'), self.size('new_purchase'), '무난+신규', '신규총', '신규대비비율'
+        )
+
+    def idea7_oily_skin_finish_sensitivity(self):
+        # 지성 피부 + 마무리 부정, 지성 피부 총량 대비
+        return self._subset_ratio(
+            self.size('oily_skin', 'finish_negative'), self.size('oily_skin'), '지성+마무리부정', '지성총', '비율'
+        )
+
+    def idea8_irritation_spike(self):
+        # 자극 있음 (값이 비어 있는 리뷰는 자극 이슈로 세지 않음)
+        return self._count_ratio(self.size('irritation_issue'), '자극이슈')
+
+    def idea9_value_for_money_buffering(self):
+        # 가성비 언급 시 감정 분포와 전체 감정 분포 (1~12월, 리뷰가 없는 월은 0)
+        months = range(1, 13)
+        by_month = lambda *terms: self.total(*terms).reindex(months, fill_value=0).to_numpy()
+        return pd.DataFrame({
+            '가성비 긍정': by_month('value_for_money_summary', 'OVERALL_SENTIMENT=POSITIVE'),
+            '가성비 부정': by_month('value_for_money_summary', 'OVERALL_SENTIMENT=NEGATIVE'),
+            '전체 긍정': by_month('OVERALL_SENTIMENT=POSITIVE'),
+            '전체 부정': by_month('OVERALL_SENTIMENT=NEGATIVE')
+        }, index=months)
+
+    def idea10_repurchase_seasonal_resilience(self):
+        # 재구매/전체 리뷰의 속성별 월별 긍정 비율과 그 표준편차
+        repurchase_monthly = pd.DataFrame({
+            col: self.positive_rate('repurchase', column=col) for col, _ in RESILIENCE_COLUMNS
+        }).round(2)
+        overall = self.size()
+        overall_monthly = pd.DataFrame({
+            col: (self.total(f'{col}=POSITIVE') / overall * 100) for col, _ in RESILIENCE_COLUMNS
+        }).round(2)
+        result = {}
+        for col, name in RESILIENCE_COLUMNS:
+            result[f'재구매_{name}_std'] = [repurchase_monthly[col].std()]
+            result[f'전체_{name}_std'] = [overall_monthly[col].std()]
+        return pd.DataFrame(result).round(2), repurchase_monthly, overall_monthly
+
+    def get_monthly_attribute_sentiment_table(self):
+        # 속성별 월별 긍정 비율 (1~12월, 리뷰가 없는 월은 0)
+        months = range(1, 13)
+        overall = self.size()
+        return pd.DataFrame({
+            name: (self.total(f'{col}=POSITIVE') / overall * 100).round(2).reindex(months, fill_value=0).to_numpy()
+            for col, name in ATTRIBUTE_COLUMNS
+        }, index=months)
+
+
+class _MaskedMonthlyCounts(MonthlyInsightTables):
+    """분석 객체의 공유 조건 마스크(masks.mask_cache)로 월별 건수를 세는 건수 제공자
+
+    메서드 호출 1회 동안 같은 조건 마스크와 월별 건수는 한 번만 계산
+    """
+
+    def __init__(self, analysis):
+        self.analysis = analysis
+        self._masks = {}
+        self._sizes = {}
+
+    def _term_mask(self, term):
+        if term not in self._masks:
+            self._masks[term] = self.analysis._mask(term)
+        return self._masks[term]
+
+    def size(self, *terms):
+        if terms not in self._sizes:
+            if not terms:
+                self._sizes[terms] = self.analysis._monthly_size()
+            else:
+                mask = self._term_mask(terms[0])
+                for term in terms[1:]:
+                    mask = mask & self._term_mask(term)
+                self._sizes[terms] = self.analysis._monthly_size(mask)
+        return self._sizes[terms]
+
+
+class ReviewInsightAnalysis:
+    def __init__(self, csv_path=None, category='토너', store=None, projection=True, rescorer=None):
+        """데이터 로드 및 초기화 (csv_path는 단일 경로 또는 파티션 파일 경로 목록)
+
+        projection=True이면 메서드·페이지 레지스트리의 필요 컬럼 합집합만 읽고
+        긴 텍스트 컬럼은 ensure_columns 호출 시 지연 로드
+        rescorer(sentiment_scoring.SentimentRescorer)를 지정하면 감성 정규화 전에 빈 라벨을 채점으로 보완
+        초기 로드 시 validation 단계로 불량 행을 격리 (quality_report, quarantine)
+        """
+        self.category = category
+        self.store = store
+        self.rescorer = rescorer
+        self.rescore_report = None
+        self.quality_report = None
+        self.quarantine = None
+        # 데이터셋 버전 (카탈로그가 원본 파일 기준으로 설정)
+        self.dataset_version = None
+        # 검증 통과 행 마스크 (지연 로드 컬럼을 같은 행에 맞추기 위해 보관)
+        self._kept_rows = None
+        self.csv_paths = list(csv_path) if isinstance(csv_path, (list, tuple)) else [csv_path]
+        self.product = "전체"
         self.product_list = []
+        # 지연 컬럼 로드 시 공유 original_df 변경 보호 (for_product 뷰와 공유)
+        self._load_lock = threading.RLock()
+        # 카테고리 전체 단위 계산 결과 캐시 (for_product 뷰와 공유)
+        self._shared_cache = {}
+
+        if store is not None:
+            # 저장소 모드(파티션/공유 메모리 매핑): 제품/컬럼이 정해질 때까지 읽지 않음
+            self.df = pd.DataFrame()
+            self.original_df = None
+            self.rescore_report = getattr(store, 'rescore_report', None)
+            self.quality_report = getattr(store, 'quality_report', None)
+            return
+
+        self.available_columns = list(dict.fromkeys(
+            col for path in self.csv_paths for col in read_review_csv_header(path)
+        ))
+        usecols = source_columns(projected_columns()) if projection else None
+        self.df = self._read_csv_columns(usecols)
         self._prepare_data()
+        # 전처리된 데이터를 원본으로 보관 (제품 전환 시에도 파생 컬럼 유지)
+        # 분석 메서드는 df를 제자리에서 수정하지 않으므로 별도 복사본을 두지 않음
+        self.original_df = self.df
 
     def get_products(self):
         """제품 목록 반환"""
+        if self.store is not None:
+            self.product_list = self.store.brands()
+            return self.product_list
         if '브랜드명' in self.original_df.columns:
             self.product_list = sorted(self.original_df['브랜드명'].unique().tolist())
             return self.product_list
@@ -30,12 +317,56 @@ class TinerInsightAnalysis:
 
     def set_product(self, product_name):
         """제품별 데이터 설정"""
-        if product_name == "전체":
-            self.df = self.original_df.copy()
-        elif '브랜드명' in self.original_df.columns:
-            self.df = self.original_df[self.original_df['브랜드명'] == product_name].copy()
+        if self.store is not None:
+            # 제품이 바뀌면 로드된 컬럼을 비우고, 필요 컬럼은 ensure_columns에서 해당 브랜드 파티션만 읽음
+            if product_name != self.product:
+                self.product = product_name
+                self.df = pd.DataFrame()
+            return
+
+        self.product = product_name
+        if product_name != "전체" and '브랜드명' in self.original_df.columns:
+            self.df = self.original_df[self.original_df['브랜드명'] == product_name]
         else:
-            self.df = self.original_df.copy()
+            self.df = self.original_df
+
+    def for_product(self, product_name):
+        """제품이 설정된 독립 분석 뷰 반환 (원본 데이터는 공유, 동시 요청 간 제품 상태 분리)"""
+        view = copy.copy(self)
+        view.set_product(product_name)
+        return view
+
+    @classmethod
+    def from_frame(cls, df, category='토너', product="전체"):
+        """전처리된 DataFrame으로 분석 객체 생성 (파일을 읽지 않음, 리포트 작업자 등에서 사용)"""
+        analysis = cls.__new__(cls)
+        analysis.category = category
+        analysis.store = None
+        analysis.csv_paths = []
+        analysis.product = product
+        analysis.product_list = []
+        analysis.rescorer = None
+        analysis.rescore_report = None
+        analysis.quality_report = None
+        analysis.quarantine = None
+        analysis._kept_rows = None
+        analysis.dataset_version = None
+        analysis._load_lock = threading.RLock()
+        analysis._shared_cache = {}
+        analysis.available_columns = list(df.columns)
+        analysis.original_df = df
+        analysis.df = df
+        return analysis
+
+    def product_views(self, columns, products=None):
+        """카테고리 전체를 브랜드별로 한 번만 나눠 (제품명, DataFrame) 생성 (제품별 반복 필터링 대신 사용)"""
+        full = self.full_frame(list(dict.fromkeys(['브랜드명'] + list(columns))))
+        if '브랜드명' not in full.columns:
+            return
+        wanted = None if products is None else set(products)
+        for product, group in full.groupby('브랜드명', sort=True, observed=True):
+            if wanted is None or product in wanted:
+                yield product, group
 
     def get_product_data(self, product_name):
         """제품별 데이터 반환"""
@@ -43,307 +374,195 @@ class TinerInsightAnalysis:
             return self.df[self.df['브랜드명'] == product_name].copy()
         return self.df.copy()
 
-    def _prepare_data(self):
-        """데이터 전처리"""
+    def _read_csv_columns(self, usecols=None):
+        """CSV 파일들에서 지정 컬럼만 읽어 파일 순서대로 연결 (검증 후에는 격리 행 제외)"""
+        frames = [read_review_csv(path, usecols=usecols) for path in self.csv_paths]
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        if self._kept_rows is not None and not self._kept_rows.all():
+            df = df[self._kept_rows].reset_index(drop=True)
+        return df
+
+    def ensure_columns(self, columns):
+        """필요 컬럼 확보 (미로드 컬럼만 추가로 읽음)
+
+        CSV 모드: 지연 로드 대상 컬럼을 원본 파일에서 읽어 original_df에 붙이고 현재 제품 데이터 갱신
+        파티션 저장소 모드: 선택 제품 파티션에서 미로드 컬럼을 읽음
+        """
+        if self.store is None:
+            with self._load_lock:
+                missing = [
+                    col for col in source_columns(columns)
+                    if col in self.available_columns and col not in self.original_df.columns
+                ]
+                if missing:
+                    fetched = self._read_csv_columns(missing)
+                    self._prepare_data(fetched)
+                    for col in fetched.columns:
+                        self.original_df[col] = fetched[col].values
+            if any(col not in self.df.columns for col in source_columns(columns) if col in self.original_df.columns):
+                self.set_product(self.product)
+            return
+        missing = [col for col in columns if col not in self.df.columns and col in self.store.columns]
+        if not missing and len(self.df.columns) > 0:
+            return
+
+        loaded = list(dict.fromkeys(list(self.df.columns) + missing))
+        brand = None if self.product == "전체" else self.product
+        self.df = self.store.read(brand=brand, columns=loaded)
+
+    def full_frame(self, columns):
+        """제품 선택과 무관한 카테고리 전체 데이터 (필요 컬럼만)"""
+        if self.store is not None:
+            return self.store.read(columns=columns)
+        self.ensure_columns(columns)
+        return self.original_df[[col for col in columns if col in self.original_df.columns]]
+
+    def _prepare_data(self, df=None):
+        """데이터 전처리 (df 미지정 시 self.df, 지정 시 추가로 읽은 컬럼 프레임)"""
+        if df is None:
+            # 초기 로드: 품질 검증 후 불량 행 격리 (날짜 변환·감성 라벨 정규화 포함)
+            self.df, self.quarantine, self.quality_report, self._kept_rows = validate_reviews(self.df)
+        df = self.df if df is None else df
+
         # 날짜 변환
-        if '리뷰등록일' in self.df.columns:
-            self.df['리뷰등록일'] = pd.to_datetime(self.df['리뷰등록일'], errors='coerce')
-            self.df['YEAR_MONTH'] = self.df['리뷰등록일'].dt.to_period('M')
-            self.df['MONTH'] = self.df['리뷰등록일'].dt.month
+        if '리뷰등록일' in df.columns:
+            df['리뷰등록일'] = pd.to_datetime(df['리뷰등록일'], errors='coerce')
+            df['YEAR_MONTH'] = df['리뷰등록일'].dt.to_period('M')
+            df['MONTH'] = df['리뷰등록일'].dt.month
+
+        # 빈 감성 라벨 보완 (NEUTRAL 일괄 대체 전)
+        if self.rescorer is not None:
+            self._rescore_sentiments(df)
 
         # 감정 정규화
-        if 'OVERALL_SENTIMENT' in self.df.columns:
-            self.df['OVERALL_SENTIMENT'] = self.df['OVERALL_SENTIMENT'].fillna('NEUTRAL').str.upper()
-        if 'ABSORPTION_SENTIMENT' in self.df.columns:
-            self.df['ABSORPTION_SENTIMENT'] = self.df['ABSORPTION_SENTIMENT'].fillna('NEUTRAL').str.upper()
-        if 'FINISH_SENTIMENT' in self.df.columns:
-            self.df['FINISH_SENTIMENT'] = self.df['FINISH_SENTIMENT'].fillna('NEUTRAL').str.upper()
-        if 'MOISTURE_SENTIMENT' in self.df.columns:
-            self.df['MOISTURE_SENTIMENT'] = self.df['MOISTURE_SENTIMENT'].fillna('NEUTRAL').str.upper()
-        if 'SCENT_SENTIMENT' in self.df.columns:
-            self.df['SCENT_SENTIMENT'] = self.df['SCENT_SENTIMENT'].fillna('NEUTRAL').str.upper()
+        if 'OVERALL_SENTIMENT' in df.columns:
+            df['OVERALL_SENTIMENT'] = df['OVERALL_SENTIMENT'].fillna('NEUTRAL').str.upper()
+        if 'ABSORPTION_SENTIMENT' in df.columns:
+            df['ABSORPTION_SENTIMENT'] = df['ABSORPTION_SENTIMENT'].fillna('NEUTRAL').str.upper()
+        if 'FINISH_SENTIMENT' in df.columns:
+            df['FINISH_SENTIMENT'] = df['FINISH_SENTIMENT'].fillna('NEUTRAL').str.upper()
+        if 'MOISTURE_SENTIMENT' in df.columns:
+            df['MOISTURE_SENTIMENT'] = df['MOISTURE_SENTIMENT'].fillna('NEUTRAL').str.upper()
+        if 'SCENT_SENTIMENT' in df.columns:
+            df['SCENT_SENTIMENT'] = df['SCENT_SENTIMENT'].fillna('NEUTRAL').str.upper()
 
         # 피부 타입 정규화
-        if 'SKIN_TYPE_FINAL' in self.df.columns:
-            self.df['SKIN_TYPE_FINAL'] = self.df['SKIN_TYPE_FINAL'].fillna('미분류')
+        if 'SKIN_TYPE_FINAL' in df.columns:
+            df['SKIN_TYPE_FINAL'] = df['SKIN_TYPE_FINAL'].fillna('미분류')
 
         # 구매 유형 정규화
-        if 'PURCHASE_TYPE' in self.df.columns:
-            self.df['PURCHASE_TYPE'] = self.df['PURCHASE_TYPE'].fillna('미분류')
+        if 'PURCHASE_TYPE' in df.columns:
+            df['PURCHASE_TYPE'] = df['PURCHASE_TYPE'].fillna('미분류')
+
+    def _rescore_sentiments(self, df):
+        """요약 텍스트로 감성 라벨 채점 (텍스트 컬럼이 미로드면 원본에서 해당 컬럼만 읽음)"""
+        if not any(col in df.columns for col in self.rescorer.scorer.attributes()):
+            return
+        text_columns = [col for col in ('ONE_LINE_SUMMARY', 'REVIEW_ID') if col in self.available_columns]
+        if 'ONE_LINE_SUMMARY' not in text_columns:
+            return
+
+        source = df if all(col in df.columns for col in text_columns) else self._read_csv_columns(text_columns)
+        keys = source['REVIEW_ID'].to_numpy() if 'REVIEW_ID' in source.columns else None
+        self.rescore_report = self.rescorer.apply(
+            df, source['ONE_LINE_SUMMARY'].to_numpy(), keys=keys, cache_key=self.category
+        )
+
+    # ===== 공유 조건 마스크 =====
+    def _cache_key(self, product, name):
+        return (self.category, self.dataset_version, product, name)
+
+    def _mask(self, name):
+        """조건 항(masks.PREDICATES 이름 또는 '컬럼=값')의 불리언 마스크 (데이터셋 버전이 있으면 공유 마스크 캐시 사용)
+
+        df와 제품은 한 번만 읽어 계산·캐시 키·행 수가 같은 데이터를 가리키도록 고정
+        """
+        df, product = self.df, self.product
+        compute = lambda: term_mask(df, name)
+        if self.dataset_version is None:
+            return compute()
+        return mask_cache.mask(self._cache_key(product, name), len(df), compute)
+
+    def _monthly_size(self, mask=None):
+        """월별 리뷰 수 (mask 지정 시 해당 행만, 전체 기준은 공유 캐시 사용)"""
+        df, product = self.df, self.product
+        if mask is not None:
+            return count_months(df['MONTH'], mask)
+        compute = lambda: count_months(df['MONTH'])
+        if self.dataset_version is None:
+            return compute()
+        return mask_cache.value(self._cache_key(product, 'monthly_size'), compute, n_rows=len(df))
 
     # ===== IDEA 1: 흡수력과 재구매의 관계 =====
+    @requires_columns('MONTH', 'ABSORPTION_SENTIMENT', 'PURCHASE_TYPE')
     def idea1_absorption_repurchase(self):
         """흡수력은 재구매의 핵심이며, 여름에 더 중요해진다"""
-        # 재구매 + 흡수 긍정인 리뷰 필터링
-        filtered = self.df[
-            (self.df['ABSORPTION_SENTIMENT'] == 'POSITIVE') &
-            (self.df['PURCHASE_TYPE'].str.contains('재구매', na=False))
-        ].copy()
-
-        # 월별 비율 계산
-        monthly_repurchase = self.df[
-            self.df['PURCHASE_TYPE'].str.contains('재구매', na=False)
-        ].groupby('MONTH').size()
-
-        monthly_absorption_positive = filtered.groupby('MONTH').size()
-
-        result = pd.DataFrame({
-            '총 재구매 리뷰': monthly_repurchase,
-            '흡수 긍정 비율': (monthly_absorption_positive / monthly_repurchase * 100).round(2)
-        }).fillna(0)
-
-        return result
+        return _MaskedMonthlyCounts(self).idea1_absorption_repurchase()
 
     # ===== IDEA 2: 점성 제형과 계절의 관계 =====
+    @requires_columns('MONTH', 'TEXTURE_VALUE', 'OVERALL_SENTIMENT')
     def idea2_texture_seasonality(self):
         """점성 제형은 가을·겨울에만 긍정으로 인식된다"""
-        # 점성/쫀쫀 제형 필터링
-        filtered = self.df[
-            self.df['TEXTURE_VALUE'].isin(['점성', '쫀쫀'])
-        ].copy()
-
-        # 월별 긍정 비율
-        monthly_sentiment = filtered.groupby('MONTH').agg({
-            'OVERALL_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100
-        }).round(2)
-        monthly_sentiment.columns = ['긍정 비율']
-
-        return monthly_sentiment
+        return _MaskedMonthlyCounts(self).idea2_texture_seasonality()
 
     # ===== IDEA 3: 보습 만족과 여름철 불만 =====
+    @requires_columns('MONTH', 'MOISTURE_SENTIMENT', 'OVERALL_SENTIMENT')
     def idea3_moisture_summer_dissatisfaction(self):
         """보습 만족은 줄어도 불만은 여름에 증가한다"""
-        # 보습 부정 + 전체 부정
-        filtered = self.df[
-            (self.df['MOISTURE_SENTIMENT'] == 'NEGATIVE') |
-            (self.df['OVERALL_SENTIMENT'] == 'NEGATIVE')
-        ].copy()
-
-        monthly_count = filtered.groupby('MONTH').size()
-        monthly_ratio = (monthly_count / self.df.groupby('MONTH').size() * 100).round(2)
-
-        result = pd.DataFrame({
-            '보습/전체 부정 리뷰': monthly_count,
-            '비율': monthly_ratio
-        }).fillna(0)
-
-        return result
+        return _MaskedMonthlyCounts(self).idea3_moisture_summer_dissatisfaction()
 
     # ===== IDEA 4: 산뜻함 선호와 보습 불만의 동시 발생 =====
+    @requires_columns('MONTH', 'FINISH_SENTIMENT', 'MOISTURE_SENTIMENT')
     def idea4_freshness_moisture_conflict(self):
         """산뜻함 선호 증가와 보습 불만이 동시에 발생한다"""
-        # 산뜻 + 보습 부정 필터링
-        filtered = self.df[
-            (self.df['FINISH_SENTIMENT'] == 'POSITIVE') &
-            (self.df['MOISTURE_SENTIMENT'] == 'NEGATIVE')
-        ].copy()
-
-        monthly_count = filtered.groupby('MONTH').size()
-
-        # 각각의 월별 비율도 계산
-        finish_positive = self.df[self.df['FINISH_SENTIMENT'] == 'POSITIVE'].groupby('MONTH').size()
-        moisture_negative = self.df[self.df['MOISTURE_SENTIMENT'] == 'NEGATIVE'].groupby('MONTH').size()
-
-        result = pd.DataFrame({
-            '산뜻+보습불만 동시': monthly_count,
-            '산뜻긍정': finish_positive,
-            '보습부정': moisture_negative
-        }).fillna(0)
-
-        return result
+        return _MaskedMonthlyCounts(self).idea4_freshness_moisture_conflict()
 
     # ===== IDEA 5: 향의 계절 무관성과 특정 월 이슈 =====
+    @requires_columns('MONTH', 'SCENT_SENTIMENT')
     def idea5_scent_seasonality(self):
         """향은 계절 무관, 특정 월에만 이슈로 터진다"""
-        # 향 부정 필터링
-        filtered = self.df[self.df['SCENT_SENTIMENT'] == 'NEGATIVE'].copy()
-
-        monthly_count = filtered.groupby('MONTH').size()
-        monthly_ratio = (monthly_count / self.df.groupby('MONTH').size() * 100).round(2)
-
-        result = pd.DataFrame({
-            '향부정': monthly_count,
-            '비율': monthly_ratio
-        }).fillna(0)
-
-        return result
+        return _MaskedMonthlyCounts(self).idea5_scent_seasonality()
 
     # ===== IDEA 6: 무난함과 신규 유입의 관계 =====
+    @requires_columns('MONTH', 'ONE_LINE_SUMMARY', 'PURCHASE_TYPE')
     def idea6_neutral_new_purchase(self):
         """무난한 평가는 신규 유입기에서 증가한다"""
-        # 무난 + 첫구매 필터링
-        filtered = self.df[
-            (self.df['ONE_LINE_SUMMARY'].str.contains('무난', na=False)) &
-            (self.df['PURCHASE_TYPE'].str.contains('첫구매|신규', na=False, regex=True))
-        ].copy()
-
-        monthly_count = filtered.groupby('MONTH').size()
-
-        # 신규 구매 총량 대비
-        new_purchase = self.df[
-            self.df['PURCHASE_TYPE'].str.contains('첫구매|신규', na=False, regex=True)
-        ].groupby('MONTH').size()
-
-        result = pd.DataFrame({
-            '무난+신규': monthly_count,
-            '신규총': new_purchase,
-            '신규대비비율': (monthly_count / new_purchase * 100).round(2)
-        }).fillna(0)
-
-        return result
+        return _MaskedMonthlyCounts(self).idea6_neutral_new_purchase()
 
     # ===== IDEA 7: 지성 피부와 여름 마무리감 민감성 =====
+    @requires_columns('MONTH', 'SKIN_TYPE_FINAL', 'FINISH_SENTIMENT')
     def idea7_oily_skin_finish_sensitivity(self):
         """지성 피부는 여름에 마무리에 민감해진다"""
-        # 지성 피부 + 마무리 부정
-        filtered = self.df[
-            (self.df['SKIN_TYPE_FINAL'].str.contains('지성', na=False)) &
-            (self.df['FINISH_SENTIMENT'] == 'NEGATIVE')
-        ].copy()
-
-        monthly_count = filtered.groupby('MONTH').size()
-
-        # 지성 피부 총량 대비
-        oily_skin = self.df[
-            self.df['SKIN_TYPE_FINAL'].str.contains('지성', na=False)
-        ].groupby('MONTH').size()
-
-        result = pd.DataFrame({
-            '지성+마무리부정': monthly_count,
-            '지성총': oily_skin,
-            '비율': (monthly_count / oily_skin * 100).round(2)
-        }).fillna(0)
-
-        return result
+        return _MaskedMonthlyCounts(self).idea7_oily_skin_finish_sensitivity()
 
     # ===== IDEA 8: 자극 이슈의 월별 Spike 탐지 =====
+    @requires_columns('MONTH', 'IRRITATION_VALUE')
     def idea8_irritation_spike(self):
         """자극 이슈는 특정 월에 집중적으로 발생한다"""
-        # 자극 있음 필터링
-        filtered = self.df[
-            self.df['IRRITATION_VALUE'] != '없음'
-        ].copy()
-
-        monthly_count = filtered.groupby('MONTH').size()
-        monthly_ratio = (monthly_count / self.df.groupby('MONTH').size() * 100).round(2)
-
-        result = pd.DataFrame({
-            '자극이슈': monthly_count,
-            '비율': monthly_ratio
-        }).fillna(0)
-
-        return result
+        return _MaskedMonthlyCounts(self).idea8_irritation_spike()
 
     # ===== IDEA 9: 가성비 평가와 불만 완충 =====
+    @requires_columns('MONTH', 'ONE_LINE_SUMMARY', 'OVERALL_SENTIMENT')
     def idea9_value_for_money_buffering(self):
         """가성비 평가는 불만을 완충한다"""
-        # 가성비 언급 필터링
-        filtered = self.df[
-            self.df['ONE_LINE_SUMMARY'].str.contains('가성비', na=False)
-        ].copy()
-
-        # 가성비 언급 시 감정 분포
-        sentiment_dist = filtered.groupby('MONTH')['OVERALL_SENTIMENT'].apply(
-            lambda x: {
-                'POSITIVE': (x == 'POSITIVE').sum(),
-                'NEUTRAL': (x == 'NEUTRAL').sum(),
-                'NEGATIVE': (x == 'NEGATIVE').sum()
-            }
-        )
-
-        # 전체 감정 분포와 비교
-        overall_dist = self.df.groupby('MONTH')['OVERALL_SENTIMENT'].apply(
-            lambda x: {
-                'POSITIVE': (x == 'POSITIVE').sum(),
-                'NEUTRAL': (x == 'NEUTRAL').sum(),
-                'NEGATIVE': (x == 'NEGATIVE').sum()
-            }
-        )
-
-        result = pd.DataFrame({
-            '가성비 긍정': [sentiment_dist[m]['POSITIVE'] if m in sentiment_dist.index else 0 for m in range(1, 13)],
-            '가성비 부정': [sentiment_dist[m]['NEGATIVE'] if m in sentiment_dist.index else 0 for m in range(1, 13)],
-            '전체 긍정': [overall_dist[m]['POSITIVE'] if m in overall_dist.index else 0 for m in range(1, 13)],
-            '전체 부정': [overall_dist[m]['NEGATIVE'] if m in overall_dist.index else 0 for m in range(1, 13)]
-        }, index=range(1, 13))
-
-        return result
+        return _MaskedMonthlyCounts(self).idea9_value_for_money_buffering()
 
     # ===== IDEA 10: 재구매 리뷰의 계절 영향 적음 =====
+    @requires_columns('MONTH', 'PURCHASE_TYPE', 'ABSORPTION_SENTIMENT', 'FINISH_SENTIMENT',
+                      'MOISTURE_SENTIMENT', 'OVERALL_SENTIMENT')
     def idea10_repurchase_seasonal_resilience(self):
         """재구매 리뷰는 계절 영향이 작다"""
-        # 재구매 리뷰
-        repurchase = self.df[
-            self.df['PURCHASE_TYPE'].str.contains('재구매', na=False)
-        ].copy()
-
-        # 재구매 속성별 변화의 표준편차
-        repurchase_monthly = repurchase.groupby('MONTH').agg({
-            'ABSORPTION_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100,
-            'FINISH_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100,
-            'MOISTURE_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100,
-            'OVERALL_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100
-        }).round(2)
-
-        # 전체 리뷰
-        overall_monthly = self.df.groupby('MONTH').agg({
-            'ABSORPTION_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100,
-            'FINISH_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100,
-            'MOISTURE_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100,
-            'OVERALL_SENTIMENT': lambda x: (x == 'POSITIVE').sum() / len(x) * 100
-        }).round(2)
-
-        # 표준편차 비교
-        result = pd.DataFrame({
-            '재구매_흡수_std': [repurchase_monthly['ABSORPTION_SENTIMENT'].std()],
-            '전체_흡수_std': [overall_monthly['ABSORPTION_SENTIMENT'].std()],
-            '재구매_마무리_std': [repurchase_monthly['FINISH_SENTIMENT'].std()],
-            '전체_마무리_std': [overall_monthly['FINISH_SENTIMENT'].std()],
-            '재구매_보습_std': [repurchase_monthly['MOISTURE_SENTIMENT'].std()],
-            '전체_보습_std': [overall_monthly['MOISTURE_SENTIMENT'].std()],
-            '재구매_전체_std': [repurchase_monthly['OVERALL_SENTIMENT'].std()],
-            '전체_전체_std': [overall_monthly['OVERALL_SENTIMENT'].std()]
-        }).round(2)
-
-        return result, repurchase_monthly, overall_monthly
+        return _MaskedMonthlyCounts(self).idea10_repurchase_seasonal_resilience()
 
     # ===== 월별 × 속성 × 감성 지표 테이블 =====
+    @requires_columns('MONTH', 'ABSORPTION_SENTIMENT', 'FINISH_SENTIMENT', 'MOISTURE_SENTIMENT',
+                      'TEXTURE_SENTIMENT', 'SCENT_SENTIMENT', 'IRRITATION_SENTIMENT', 'SOOTHING_SENTIMENT')
     def get_monthly_attribute_sentiment_table(self):
         """월별 속성별 감성 지표"""
-        attributes = [
-            ('ABSORPTION_SENTIMENT', '흡수'),
-            ('FINISH_SENTIMENT', '마무리'),
-            ('MOISTURE_SENTIMENT', '보습'),
-            ('TEXTURE_SENTIMENT', '제형'),
-            ('SCENT_SENTIMENT', '향'),
-            ('IRRITATION_SENTIMENT', '자극'),
-            ('SOOTHING_SENTIMENT', '진정')
-        ]
-
-        results = {}
-        for col, name in attributes:
-            monthly = self.df.groupby('MONTH')[col].apply(
-                lambda x: {
-                    'POSITIVE': (x == 'POSITIVE').sum(),
-                    'NEUTRAL': (x == 'NEUTRAL').sum(),
-                    'NEGATIVE': (x == 'NEGATIVE').sum(),
-                    'Total': len(x)
-                }
-            )
-
-            positive_rate = []
-            for m in range(1, 13):
-                if m in monthly.index:
-                    rate = monthly[m]['POSITIVE'] / monthly[m]['Total'] * 100 if monthly[m]['Total'] > 0 else 0
-                    positive_rate.append(round(rate, 2))
-                else:
-                    positive_rate.append(0)
-
-            results[name] = positive_rate
-
-        return pd.DataFrame(results, index=range(1, 13))
+        return _MaskedMonthlyCounts(self).get_monthly_attribute_sentiment_table()
 
     # ===== 종합 요약 =====
+    @requires_columns('리뷰등록일', 'OVERALL_SENTIMENT')
     def get_summary(self):
         """전체 분석 요약"""
         try:
@@ -367,10 +586,143 @@ class TinerInsightAnalysis:
             'neutral_ratio': f"{neutral_count / total * 100:.2f}%" if total > 0 else "0%"
         }
 
+    # ===== 재구매 코호트 (리뷰어 단위) =====
+    @requires_columns('리뷰등록일', '브랜드명', *REVIEWER_ID_COLUMNS)
+    def purchase_sequences(self):
+        """리뷰어 × 브랜드별 구매 시퀀스 (리뷰어 식별 컬럼이 없으면 None)
+
+        '전체' 보기에서도 다른 브랜드 리뷰는 재구매로 세지 않아 브랜드별 보기와 같은 재구매 정의 유지
+        """
+        reviewer_col = find_reviewer_column(self.df.columns)
+        if reviewer_col is None or '리뷰등록일' not in self.df.columns:
+            return None
+        products = self.df['브랜드명'] if '브랜드명' in self.df.columns else None
+        return PurchaseSequences(self.df[reviewer_col], self.df['리뷰등록일'], products)
+
+    def cohort_retention_table(self):
+        """첫 구매 월 코호트별 경과 개월 재방문 비율"""
+        sequences = self.purchase_sequences()
+        if sequences is None:
+            return pd.DataFrame()
+        return sequences.cohort_retention()
+
+    @requires_columns(*[col for col, _ in COHORT_ATTRIBUTES])
+    def repurchase_by_first_sentiment(self):
+        """첫 리뷰의 속성별 감성에 따른 재구매율과 재구매까지 일수"""
+        sequences = self.purchase_sequences()
+        if sequences is None:
+            return pd.DataFrame()
+
+        frames = []
+        for col, name in COHORT_ATTRIBUTES:
+            if col not in self.df.columns:
+                continue
+            table = sequences.repurchase_by_first_value(self.df[col].to_numpy())
+            table.index = pd.MultiIndex.from_product([[name], table.index], names=['속성', '첫 리뷰 감성'])
+            frames.append(table)
+
+        return pd.concat(frames) if frames else pd.DataFrame()
+
+    def get_cohort_summary(self):
+        """재구매 코호트 요약"""
+        sequences = self.purchase_sequences()
+        if sequences is None or sequences.n_reviewers == 0:
+            return None
+        repurchased = sequences.repurchased()
+        days = sequences.days_to_repurchase()
+        return {
+            'reviewers': int(sequences.n_distinct_reviewers),
+            'sequences': int(sequences.n_reviewers),
+            'repurchase_rate': f"{repurchased.mean() * 100:.2f}%",
+            'median_days_to_repurchase': float(np.nanmedian(days)) if repurchased.any() else None
+        }
+
+    # ===== 속성 동시발생 (향상도/조건부 확률) =====
+    @requires_columns('MONTH', *feature_columns())
+    def attribute_cooccurrence(self, group_by=None):
+        """속성 × 감성·범주값·요약 키워드 동시발생 행렬 (group_by 예: ['MONTH'], ['브랜드명', 'MONTH'])"""
+        return CooccurrenceMatrix(self.df, group_by=group_by)
+
+    # ===== 한 줄 요약 텍스트 피처 =====
+    def summary_term_matrix(self):
+        """카테고리 전체 요약 단어 행렬 (디스크 캐시 사용) 과 행 정렬 기준 프레임"""
+        with self._load_lock:
+            if 'term_matrix' not in self._shared_cache:
+                frame = self.full_frame(['REVIEW_ID', '브랜드명', 'MONTH', 'OVERALL_SENTIMENT', 'ONE_LINE_SUMMARY'])
+                frame = frame.reset_index(drop=True)
+                matrix = load_term_matrix(frame, cache_key=self.category)
+                self._shared_cache['term_matrix'] = (matrix, frame.drop(columns=['ONE_LINE_SUMMARY']))
+            return self._shared_cache['term_matrix']
+
+    def _summary_rows(self, frame, sentiment=None):
+        """선택 제품(및 감성) 리뷰의 단어 행렬 행 위치"""
+        mask = np.ones(len(frame), dtype=bool)
+        if self.product != "전체" and '브랜드명' in frame.columns:
+            mask &= (frame['브랜드명'] == self.product).to_numpy()
+        if sentiment is not None and 'OVERALL_SENTIMENT' in frame.columns:
+            mask &= (frame['OVERALL_SENTIMENT'] == sentiment).to_numpy()
+        return np.flatnonzero(mask)
+
+    def trending_summary_terms(self, sentiment='NEGATIVE', limit=5):
+        """월별 전월 대비 언급 비율이 가장 많이 늘어난 요약 단어"""
+        matrix, frame = self.summary_term_matrix()
+        rows = self._summary_rows(frame, sentiment)
+        return matrix.trending_terms(frame['MONTH'].to_numpy(), rows, limit=limit)
+
+    def summary_top_terms(self, sentiment=None, limit=20):
+        """선택 제품 요약의 평균 TF-IDF 상위 단어"""
+        matrix, frame = self.summary_term_matrix()
+        return matrix.top_terms(self._summary_rows(frame, sentiment), limit=limit)
+
+
+# 10가지 인사이트 메서드 (IDEA 번호 순)
+IDEA_METHODS = [name for name in COLUMN_REQUIREMENTS if name.startswith('idea')]
+
+# 페이지별 필요 컬럼 레지스트리 {페이지: [컬럼, ...]}
+PAGE_COLUMN_REQUIREMENTS = {}
+
+# 상세 데이터 페이지 표시 컬럼
+DETAIL_DISPLAY_COLUMNS = [
+    '리뷰등록일', 'ONE_LINE_SUMMARY', 'OVERALL_SENTIMENT',
+    'ABSORPTION_SENTIMENT', 'FINISH_SENTIMENT', 'MOISTURE_SENTIMENT',
+    'SCENT_SENTIMENT', 'PURCHASE_TYPE', 'SKIN_TYPE_FINAL'
+]
+
+
+def register_page_columns(page, columns=(), methods=()):
+    """페이지 필요 컬럼 등록 (직접 사용하는 컬럼 + 페이지에서 호출하는 분석 메서드의 필요 컬럼)"""
+    PAGE_COLUMN_REQUIREMENTS[page] = list(dict.fromkeys(list(columns) + columns_for(*methods)))
+    return PAGE_COLUMN_REQUIREMENTS[page]
+
+
+def page_columns(page):
+    """페이지 필요 컬럼 반환"""
+    return PAGE_COLUMN_REQUIREMENTS.get(page, [])
+
+
+def projected_columns():
+    """초기 로드 컬럼: 메서드·페이지 필요 컬럼 합집합 (긴 텍스트 컬럼 제외)"""
+    columns = list(ALWAYS_LOADED_COLUMNS) + VALIDATION_COLUMNS
+    for required in list(COLUMN_REQUIREMENTS.values()) + list(PAGE_COLUMN_REQUIREMENTS.values()):
+        columns.extend(required)
+    return [col for col in dict.fromkeys(columns) if col not in LAZY_TEXT_COLUMNS]
+
+
+register_page_columns('overview', columns=['MONTH', 'OVERALL_SENTIMENT'], methods=['get_summary'])
+register_page_columns('insights', methods=IDEA_METHODS)
+register_page_columns('attributes', methods=['get_monthly_attribute_sentiment_table'])
+register_page_columns('detail', columns=['MONTH'] + DETAIL_DISPLAY_COLUMNS)
+register_page_columns('cohort', methods=['purchase_sequences', 'repurchase_by_first_sentiment'])
+register_page_columns('cooccurrence', methods=['attribute_cooccurrence'])
+
+
+# 기존 토너 전용 이름 호환
+TinerInsightAnalysis = ReviewInsightAnalysis
+
 
 if __name__ == '__main__':
     # 분석 실행
-    analysis = TinerInsightAnalysis('data/올영리뷰_토너.csv')
+    analysis = ReviewInsightAnalysis('data/올영리뷰_토너.csv')
 
     print("=== 토너 리뷰 인사이트 분석 ===\n")
     print("IDEA 1: 흡수력과 재구매의 관계")
@@ -0,0 +1,240 @@
+"""
+인사이트 JSON API 서버
+대시보드와 같은 카탈로그/분석 객체를 공유하는 비동기 HTTP 서비스 (표준 라이브러리 asyncio만 사용)
+
+엔드포인트 (모든 요청은 GET, 쿼리 파라미터 category / product 공통):
+    /categories                 카테고리 목록
+    /products                   제품 목록
+    /summary                    get_summary
+    /ideas/<1-10>               IDEA 1~10 결과
+    /attributes                 월별 × 속성 긍정 비율 테이블
+    /reviews                    상세 데이터 (month, sentiment, skin, limit(1~MAX_LIMIT), offset 필터)
+"""
+
+import os
+import json
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, parse_qs, unquote
+
+import pandas as pd
+
+from analysis import IDEA_METHODS, DETAIL_DISPLAY_COLUMNS, page_columns
+from catalog import dashboard_catalog
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 5000
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class ApiError(Exception):
+    """HTTP 오류 응답으로 변환되는 예외"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def frame_to_json(df):
+    """DataFrame을 JSON 직렬화 가능한 dict로 변환 (orient=split)"""
+    return json.loads(df.to_json(orient='split', force_ascii=False, date_format='iso'))
+
+
+def _multi_param(params, name):
+    """쉼표 구분 또는 반복 파라미터를 목록으로"""
+    values = []
+    for raw in params.get(name, []):
+        values.extend(v for v in raw.split(',') if v)
+    return values
+
+
+class InsightService:
+    """카탈로그 기반 인사이트 계산 (요청 파라미터 → JSON 가능한 결과)"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    def _analysis(self, params):
+        categories = self.catalog.categories()
+        if not categories:
+            raise ApiError(404, '데이터셋이 없습니다.')
+        category = params.get('category', [None])[0] or ('토너' if '토너' in categories else categories[0])
+        if category not in categories:
+            raise ApiError(404, f'알 수 없는 카테고리: {category}')
+
+        analysis = self.catalog.get(category)
+        product = params.get('product', ['전체'])[0] or '전체'
+        if product != '전체' and product not in analysis.get_products():
+            raise ApiError(404, f'알 수 없는 제품: {product}')
+        return analysis.for_product(product)
+
+    def categories(self, params):
+        return {'categories': self.catalog.categories()}
+
+    def products(self, params):
+        analysis = self._analysis(params)
+        return {'category': analysis.category, 'products': analysis.get_products()}
+
+    def summary(self, params):
+        analysis = self._analysis(params)
+        return {'category': analysis.category, 'product': analysis.product, 'summary': analysis.get_summary()}
+
+    def idea(self, params, number):
+        if not 1 <= number <= len(IDEA_METHODS):
+            raise ApiError(404, f'IDEA 번호는 1~{len(IDEA_METHODS)} 입니다.')
+        analysis = self._analysis(params)
+        method = IDEA_METHODS[number - 1]
+        result = getattr(analysis, method)()
+
+        if isinstance(result, tuple):
+            std_table, repurchase_monthly, overall_monthly = result
+            payload = {
+                'std': frame_to_json(std_table),
+                'repurchase_monthly': frame_to_json(repurchase_monthly),
+                'overall_monthly': frame_to_json(overall_monthly),
+            }
+        else:
+            payload = frame_to_json(result)
+        return {'category': analysis.category, 'product': analysis.product, 'idea': number, 'method': method, 'result': payload}
+
+    def attributes(self, params):
+        analysis = self._analysis(params)
+        table = analysis.get_monthly_attribute_sentiment_table()
+        return {'category': analysis.category, 'product': analysis.product, 'result': frame_to_json(table)}
+
+    def reviews(self, params):
+        analysis = self._analysis(params)
+        analysis.ensure_columns(page_columns('detail'))
+        df = analysis.df
+
+        months = _multi_param(params, 'month')
+        sentiments = _multi_param(params, 'sentiment')
+        skins = _multi_param(params, 'skin')
+        try:
+            limit = min(max(int(params.get('limit', [DEFAULT_LIMIT])[0]), 1), MAX_LIMIT)
+            offset = max(int(params.get('offset', [0])[0]), 0)
+            months = [int(m) for m in months]
+        except ValueError:
+            raise ApiError(400, 'month, limit, offset은 정수여야 합니다.')
+
+        mask = pd.Series(True, index=df.index)
+        if months and 'MONTH' in df.columns:
+            mask &= df['MONTH'].isin(months)
+        if sentiments and 'OVERALL_SENTIMENT' in df.columns:
+            mask &= df['OVERALL_SENTIMENT'].isin([s.upper() for s in sentiments])
+        if skins and 'SKIN_TYPE_FINAL' in df.columns:
+            mask &= df['SKIN_TYPE_FINAL'].isin(skins)
+
+        columns = [col for col in DETAIL_DISPLAY_COLUMNS if col in df.columns]
+        filtered = df.loc[mask, columns]
+        if '리뷰등록일' in columns:
+            filtered = filtered.sort_values('리뷰등록일', ascending=False)
+
+        page = filtered.iloc[offset:offset + limit]
+        return {
+            'category': analysis.category,
+            'product': analysis.product,
+            'total': int(len(filtered)),
+            'offset': offset,
+            'limit': limit,
+            'result': json.loads(page.to_json(orient='records', force_ascii=False, date_format='iso')),
+        }
+
+
+class InsightServer:
+    """asyncio HTTP 서버 (동일 요청은 한 번만 계산하고 결과 공유)"""
+
+    def __init__(self, service, workers=4):
+        self.service = service
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self._inflight = {}
+
+    def _route(self, path):
+        """경로 → (핸들러, 추가 인자)"""
+        parts = [unquote(p) for p in path.strip('/').split('/') if p]
+        if parts == ['categories']:
+            return self.service.categories, ()
+        if parts == ['products']:
+            return self.service.products, ()
+        if parts == ['summary']:
+            return self.service.summary, ()
+        if parts == ['attributes']:
+            return self.service.attributes, ()
+        if parts == ['reviews']:
+            return self.service.reviews, ()
+        if len(parts) == 2 and parts[0] == 'ideas' and parts[1].isdigit():
+            return self.service.idea, (int(parts[1]),)
+        raise ApiError(404, f'알 수 없는 경로: {path}')
+
+    async def compute(self, path, query):
+        """요청 결과 계산 (진행 중인 동일 요청이 있으면 그 결과를 기다림)"""
+        params = parse_qs(query, keep_blank_values=False)
+        key = (path.rstrip('/'), tuple(sorted((k, tuple(v)) for k, v in params.items())))
+
+        future = self._inflight.get(key)
+        if future is None:
+            handler, args = self._route(path)
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, lambda: handler(params, *args))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def handle(self, reader, writer):
+        """HTTP/1.1 요청 1건 처리 후 연결 종료"""
+        status, payload = 200, None
+        try:
+            request_line = (await reader.readline()).decode('utf-8', errors='replace').strip()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+
+            parts = request_line.split()
+            if len(parts) < 2:
+                raise ApiError(400, '잘못된 요청입니다.')
+            if parts[0] != 'GET':
+                raise ApiError(405, 'GET만 지원합니다.')
+
+            url = urlsplit(parts[1])
+            payload = await self.compute(url.path, url.query)
+        except ApiError as e:
+            status, payload = e.status, {'error': e.message}
+        except Exception as e:
+            status, payload = 500, {'error': str(e)}
+
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        header = (
+            f'HTTP/1.1 {status} {STATUS_TEXT.get(status, "")}\r\n'
+            'Content-Type: application/json; charset=utf-8\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            'Connection: close\r\n\r\n'
+        ).encode('latin-1')
+        try:
+            writer.write(header + body)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        """서버 실행"""
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            print(f"인사이트 API 서버 실행: http://{host}:{port}")
+            await server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='리뷰 인사이트 JSON API 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--data-dir', default=os.path.join(BASE_DIR, 'data'))
+    parser.add_argument('--workers', type=int, default=4, help='계산 스레드 수')
+    args = parser.parse_args()
+
+    server = InsightServer(InsightService(dashboard_catalog(BASE_DIR, data_dir=args.data_dir)), workers=args.workers)
+    asyncio.run(server.serve(args.host, args.port))
@@ -1,60 +1,195 @@
 """
-토너 리뷰 인사이트 도출 대시보드
-Streamlit으로 작성된 인터랙티브 대시보드 (제품별 분석)
+화장품 리뷰 인사이트 도출 대시보드
+Streamlit으로 작성된 인터랙티브 대시보드 (카테고리·제품별 분석)
 """
 
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from analysis import TinerInsightAnalysis
+from analysis import columns_for, page_columns, DETAIL_DISPLAY_COLUMNS
+from cooccurrence import METRICS
+from catalog import dashboard_catalog
+from approximate import ApproximateEngine, DEFAULT_FRACTION
+from validation import quality_table
+from history import metric_label
+from chart_data import cached_figure, data_fingerprint, point_budget
+from figures import (
+    IDEA_LABELS, metric_drift_figure, monthly_sentiment_figure, positive_ratio_figure, attribute_heatmap_figure, attribute_trend_figure,
+    cohort_repurchase_figure, cohort_retention_figure, cooccurrence_figure, trending_terms_figure,
+    idea1_figure, idea2_figure, idea3_figure, idea4_figure, idea5_figure,
+    idea6_figure, idea7_figure, idea8_figure, idea9_figure, idea10_figure
+)
 import warnings
 
 warnings.filterwarnings('ignore')
 
 # 페이지 설정
 st.set_page_config(
-    page_title="토너 리뷰 인사이트 도출 대시보드",
+    page_title="리뷰 인사이트 도출 대시보드",
     page_icon="📊",
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
-# 캐싱을 통한 데이터 로드
+# 캐싱을 통한 데이터 카탈로그 로드 (카테고리별 분석 객체는 최초 선택 시 로드)
+# 비어 있는 감성 라벨은 NEUTRAL로 일괄 대체하기 전에 로컬 사전 채점으로 보완
+# 전처리된 데이터는 .cache/shared의 메모리 매핑 파일로 한 번만 만들어 같은 호스트의 앱 프로세스들이 공유
+# 새 데이터셋 버전을 처음 로드하면 history/에 지표 이력을 백그라운드로 기록
+# (구성은 catalog.dashboard_catalog에 있어 부하 테스트도 같은 카탈로그를 사용)
 @st.cache_resource
-def load_analysis():
+def load_catalog():
     import os
-    csv_path = os.path.join(os.path.dirname(__file__), 'data', '올영리뷰_토너.csv')
-    return TinerInsightAnalysis(csv_path)
+    return dashboard_catalog(os.path.dirname(os.path.abspath(__file__)))
+
+# 근사 모드 엔진 (카테고리·데이터셋 버전·추출률별 층화 표본, 정확한 결과는 엔진의 백그라운드 스레드에서 계산)
+# 데이터가 바뀌면 버전이 달라져 새 엔진을 만들고, 오래된 엔진은 max_entries 한도로 해제
+@st.cache_resource(max_entries=8, on_release=lambda engine: engine.close())
+def load_approximate_engine(category, dataset_version, fraction, _analysis):
+    return ApproximateEngine(_analysis, fraction=fraction)
+
+# 근사 결과 상태 확인 주기 (정확한 결과가 준비되면 페이지를 자동 재실행)
+EXACT_POLL_SECONDS = 1.0
+
+# 차트 포인트 예산 기준 플롯 폭(px)
+# Streamlit은 브라우저 폭을 서버에 전달하지 않으므로 wide 레이아웃 본문 차트가 가질 수 있는 최대 폭을 가정한 고정값
+CHART_MAX_WIDTH = 1200
 
-# 분석 객체 로드
-analysis = load_analysis()
+def render_chart(chart_id, build, *inputs, key=None):
+    """축소된 Figure를 캐시에서 가져와 표시 (캐시에 없을 때만 build(*inputs)로 생성)
+
+    key를 주지 않으면 카테고리·데이터셋 버전·제품 + 차트 입력(집계 결과 표·선택 값) 해시를 키로 사용
+    """
+    if key is None:
+        key = (data_fingerprint(*inputs),)
+    key = (selected_category, category_analysis.dataset_version, selected_product, *key)
+    fig = cached_figure(chart_id, key, lambda: build(*inputs), point_budget(CHART_MAX_WIDTH))
+    st.plotly_chart(fig, use_container_width=True)
 
 # 사이드바 네비게이션
-st.sidebar.title("📊 토너 리뷰 인사이트 대시보드")
+st.sidebar.title("📊 리뷰 인사이트 대시보드")
+
+# 카테고리 선택
+catalog = load_catalog()
+categories = catalog.categories()
+
+if not categories:
+    st.error("data 디렉터리에서 리뷰 파일(올영리뷰_<카테고리>.csv)을 찾을 수 없습니다.")
+    st.stop()
+
+selected_category = st.sidebar.selectbox(
+    "🧴 카테고리 선택",
+    categories,
+    index=categories.index("토너") if "토너" in categories else 0
+)
+
+# 분석 객체 로드 (카탈로그가 세션 간 공유하는 객체이므로 직접 변경하지 않음)
+category_analysis = catalog.get(selected_category)
+
+# 감성 재채점 처리 현황
+if category_analysis.rescore_report and category_analysis.rescore_report['target_reviews']:
+    report = category_analysis.rescore_report
+    speed = f" · {report['reviews_per_sec']:,.0f}건/초" if report['reviews_per_sec'] else ""
+    # 이전 버전 공유 저장소 메타에는 라벨 단위 건수가 없을 수 있음
+    filled = f" · 라벨 {report['filled_labels']:,}개" if report.get('filled_labels') is not None else ""
+    st.sidebar.caption(
+        f"🧮 빈 감성 라벨 보완: {report['target_reviews']:,}건{filled} "
+        f"(신규 채점 {report['scored_reviews']:,} · 캐시 {report['cached_reviews']:,}{speed})"
+    )
+
+# 적재 품질 검증 현황
+if category_analysis.quality_report and category_analysis.quality_report['quarantined_rows']:
+    st.sidebar.caption(
+        f"🧹 품질 검증: {category_analysis.quality_report['quarantined_rows']:,}행 격리 "
+        f"(전체 {category_analysis.quality_report['rows']:,}행, 상세 데이터 페이지에서 확인)"
+    )
 
 # 제품 선택 - 직접 데이터프레임에서 가져오기
-products = analysis.get_products()
+products = category_analysis.get_products()
 
 selected_product = st.sidebar.selectbox("📦 제품 선택", ["전체"] + products if products else ["전체"])
 
-# 선택된 제품의 데이터 설정
-analysis.set_product(selected_product)
+# 선택된 제품의 독립 분석 뷰 (이번 실행 전용, 공유 객체의 제품 상태를 바꾸지 않음)
+analysis = category_analysis.for_product(selected_product)
+
+# 근사 모드: 대용량 데이터 탐색 시 표본으로 즉시 응답하고 정확한 결과가 준비되면 교체
+approximate_mode = st.sidebar.toggle(
+    "⚡ 근사 모드",
+    value=False,
+    help="브랜드 × 월 × 구매 유형 층화 표본으로 먼저 계산하고 오차 범위(95% 신뢰구간)를 함께 표시합니다."
+)
+engine = None
+if approximate_mode:
+    sample_fraction = st.sidebar.select_slider(
+        "표본 추출률", options=[0.01, 0.02, 0.05, 0.1, 0.2], value=DEFAULT_FRACTION,
+        format_func=lambda v: f"{v:.0%}"
+    )
+    engine = load_approximate_engine(
+        selected_category, category_analysis.dataset_version, sample_fraction, category_analysis
+    )
+    # 같은 버전이라도 카탈로그가 카테고리를 해제 후 다시 로드했으면 새 객체 기준으로 교체
+    if engine.analysis is not category_analysis:
+        load_approximate_engine.clear(
+            selected_category, category_analysis.dataset_version, sample_fraction, category_analysis
+        )
+        engine = load_approximate_engine(
+            selected_category, category_analysis.dataset_version, sample_fraction, category_analysis
+        )
+
+@st.fragment(run_every=EXACT_POLL_SECONDS)
+def watch_exact(method):
+    """정확한 결과가 준비되거나 실패한 작업을 다시 제출해야 하면 페이지 재실행 (근사 결과 자동 교체)"""
+    status = engine.exact_status(selected_product, method)
+    if status in ('ready', 'retry'):
+        st.rerun()
+    if status == 'failed':
+        st.caption("⚠️ 정확한 결과 계산에 실패해 근사 결과를 유지합니다.")
+    else:
+        st.caption("⏳ 정확한 결과 계산 중 (준비되면 자동으로 교체)")
+
+def show_error_bounds(answer, key):
+    """근사 결과 안내와 오차 범위 표시 (key: 분석 메서드명)"""
+    if answer.is_exact:
+        st.caption("✅ 정확한 결과 (백그라운드 계산 완료)")
+        return
+
+    st.caption(
+        f"⚡ 근사 결과: 표본 {answer.sample_size:,}건 (추출률 {answer.fraction:.1%}) · 건수는 확대 추정치"
+    )
+    watch_exact(key)
+    show_bounds_table(answer.bounds)
+
+def show_bounds_table(bounds):
+    """오차 범위 표 (결과 표별 ± 값)"""
+    with st.expander("± 오차 범위 (95% 신뢰구간)"):
+        bounds = bounds if isinstance(bounds, tuple) else (bounds,)
+        for table in bounds:
+            if isinstance(table, dict):
+                st.dataframe(pd.Series(table, name='±'), use_container_width=True)
+            elif table is not None and len(table.columns) > 0:
+                st.dataframe(table, use_container_width=True)
+
+def run_query(method):
+    """분석 메서드 실행 (근사 모드면 표본 추정 + 오차 범위, 정확한 결과가 준비되면 그 결과 사용)"""
+    if engine is None:
+        return getattr(analysis, method)()
+    answer = engine.query(selected_product, method)
+    show_error_bounds(answer, method)
+    return answer.value
 
 page = st.sidebar.radio(
     "메뉴",
-    ["📈 대시보드 개요", "🔍 10가지 인사이트", "📋 월별 속성 분석", "📑 상세 데이터"]
+    ["📈 대시보드 개요", "🔍 10가지 인사이트", "📋 월별 속성 분석", "📑 상세 데이터", "🔁 재구매 코호트", "🧩 속성 동시발생", "💬 요약 키워드 트렌드", "📉 지표 변화 추이"]
 )
 
 # ===== PAGE 1: 대시보드 개요 =====
 if page == "📈 대시보드 개요":
-    st.title("📈 토너 리뷰 인사이트 대시보드")
-    st.markdown(f"### 📦 제품: {selected_product}")
+    st.title(f"📈 {selected_category} 리뷰 인사이트 대시보드")
+    st.markdown(f"### 🧴 {selected_category} · 📦 제품: {selected_product}")
     st.markdown("---")
 
-    # 요약 통계
-    summary = analysis.get_summary()
+    # 요약 통계 (개요 페이지 필요 컬럼 확보)
+    analysis.ensure_columns(page_columns('overview'))
+    summary = run_query('get_summary')
 
     col1, col2, col3, col4, col5 = st.columns(5)
 
@@ -77,79 +212,44 @@ if page == "📈 대시보드 개요":
 
     # 월별 감정 분포
     if 'MONTH' in analysis.df.columns and 'OVERALL_SENTIMENT' in analysis.df.columns:
-        monthly_sentiment = analysis.df.groupby('MONTH')['OVERALL_SENTIMENT'].value_counts().unstack(fill_value=0)
-
-        fig_sentiment = go.Figure()
-        for col in monthly_sentiment.columns:
-            fig_sentiment.add_trace(go.Bar(
-                x=monthly_sentiment.index,
-                y=monthly_sentiment[col],
-                name=col,
-                marker_color={'POSITIVE': '#2ECC71', 'NEUTRAL': '#F39C12', 'NEGATIVE': '#E74C3C'}.get(col, '#95A5A6')
-            ))
-
-        fig_sentiment.update_layout(
-            title="월별 감정 분포",
-            xaxis_title="월",
-            yaxis_title="리뷰 수",
-            barmode='stack',
-            height=400,
-            hovermode='x unified'
-        )
-
-        st.plotly_chart(fig_sentiment, use_container_width=True)
-
-        # 월별 긍정 비율 추이
-        positive_ratio = analysis.df.groupby('MONTH')['OVERALL_SENTIMENT'].apply(
-            lambda x: (x == 'POSITIVE').sum() / len(x) * 100
-        )
-
-        fig_ratio = go.Figure()
-        fig_ratio.add_trace(go.Scatter(
-            x=positive_ratio.index,
-            y=positive_ratio.values,
-            mode='lines+markers',
-            name='긍정 비율',
-            line=dict(color='#2ECC71', width=3),
-            marker=dict(size=10)
-        ))
-
-        fig_ratio.update_layout(
-            title="월별 긍정 리뷰 비율 추이",
-            xaxis_title="월",
-            yaxis_title="긍정 비율 (%)",
-            height=400,
-            hovermode='x'
-        )
-
-        st.plotly_chart(fig_ratio, use_container_width=True)
+        ratio_bounds = None
+        # 개요 차트 입력은 원본/표본 행 전체라 해시 대신 데이터 출처(정확한 결과 여부·추출률)로 캐시 키 구성
+        overview_key = ('exact',)
+        if engine is None:
+            frame, scale = analysis.df, 1.0
+        else:
+            overview = engine.overview(selected_product)
+            frame, scale = overview.value
+            if not overview.is_exact:
+                overview_key = ('sample', sample_fraction)
+                # 근사 안내·자동 교체는 위 요약 지표(get_summary)와 공유
+                ratio_bounds = overview.bounds['긍정 비율']
+                show_bounds_table(overview.bounds)
+        render_chart('overview_sentiment', monthly_sentiment_figure, frame, scale, key=overview_key)
+
+        # 월별 긍정 비율 추이 (근사 모드면 95% 신뢰구간 오차 막대)
+        render_chart('overview_ratio', positive_ratio_figure, frame, ratio_bounds, key=overview_key)
 
 # ===== PAGE 2: 10가지 인사이트 =====
 elif page == "🔍 10가지 인사이트":
     st.title("🔍 10가지 핵심 인사이트")
-    st.markdown(f"### 📦 제품: {selected_product}")
+    st.markdown(f"### 🧴 {selected_category} · 📦 제품: {selected_product}")
     st.markdown("---")
 
-    # 인사이트 선택
-    insight_list = [
-        "IDEA 1: 흡수력과 재구매의 관계",
-        "IDEA 2: 점성 제형과 계절의 관계",
-        "IDEA 3: 보습 만족과 여름철 불만",
-        "IDEA 4: 산뜻함 선호와 보습 불만의 동시 발생",
-        "IDEA 5: 향의 계절 무관성과 특정 월 이슈",
-        "IDEA 6: 무난함과 신규 유입의 관계",
-        "IDEA 7: 지성 피부와 여름 마무리감 민감성",
-        "IDEA 8: 자극 이슈의 월별 Spike",
-        "IDEA 9: 가성비 평가와 불만 완충",
-        "IDEA 10: 재구매 리뷰의 계절 영향 적음"
-    ]
+    # 인사이트 선택 (인사이트별 분석 메서드)
+    insight_methods = {label: method for method, label in IDEA_LABELS.items()}
+    insight_list = list(insight_methods.keys())
 
     selected_idea = st.selectbox("분석할 인사이트 선택", insight_list)
+    idea_key = selected_idea.split(':')[0]
+
+    # 선택한 인사이트에 필요한 컬럼만 확보
+    analysis.ensure_columns(columns_for(insight_methods[selected_idea]))
 
     st.markdown("---")
 
     # IDEA 1
-    if "IDEA 1" in selected_idea:
+    if idea_key == "IDEA 1":
         st.subheader("💡 IDEA 1: 흡수력은 재구매의 핵심이며, 여름에 더 중요해진다")
         st.markdown("""
         **분석 목표**: 재구매 고객이 흡수력을 얼마나 중요하게 평가하는지, 특히 여름철(6-8월)에 더 중요해지는지 검증
@@ -158,24 +258,11 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'ABSORPTION_SENTIMENT' in analysis.df.columns and 'PURCHASE_TYPE' in analysis.df.columns:
-            result = analysis.idea1_absorption_repurchase()
+            result = run_query('idea1_absorption_repurchase')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=result.index,
-                y=result['흡수 긍정 비율'],
-                name='흡수 긍정 비율',
-                marker_color='#3498DB'
-            ))
-            fig.update_layout(
-                title="월별 재구매 리뷰의 흡수 긍정 비율",
-                xaxis_title="월",
-                yaxis_title="비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea1', idea1_figure, result)
 
             # 인사이트 요약
             try:
@@ -194,7 +281,7 @@ elif page == "🔍 10가지 인사이트":
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 2
-    elif "IDEA 2" in selected_idea:
+    elif idea_key == "IDEA 2":
         st.subheader("💡 IDEA 2: 점성 제형은 가을·겨울에만 긍정으로 인식된다")
         st.markdown("""
         **분석 목표**: 점성/쫀쫀한 제형이 계절에 따라 다르게 인식되는지 검증
@@ -203,32 +290,16 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'TEXTURE_VALUE' in analysis.df.columns and 'OVERALL_SENTIMENT' in analysis.df.columns:
-            result = analysis.idea2_texture_seasonality()
+            result = run_query('idea2_texture_seasonality')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=result.index,
-                y=result['긍정 비율'],
-                mode='lines+markers',
-                name='긍정 비율',
-                line=dict(color='#E67E22', width=3),
-                marker=dict(size=10)
-            ))
-            fig.add_hline(y=50, line_dash="dash", line_color="gray", annotation_text="50%")
-            fig.update_layout(
-                title="점성 제형의 월별 긍정 비율",
-                xaxis_title="월",
-                yaxis_title="긍정 비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea2', idea2_figure, result)
         else:
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 3
-    elif "IDEA 3" in selected_idea:
+    elif idea_key == "IDEA 3":
         st.subheader("💡 IDEA 3: 보습 만족은 줄어도 불만은 여름에 증가한다")
         st.markdown("""
         **분석 목표**: 여름철에 보습 관련 불만이 증가하는지 검증
@@ -237,29 +308,16 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'MOISTURE_SENTIMENT' in analysis.df.columns and 'OVERALL_SENTIMENT' in analysis.df.columns:
-            result = analysis.idea3_moisture_summer_dissatisfaction()
+            result = run_query('idea3_moisture_summer_dissatisfaction')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=result.index,
-                y=result['비율'],
-                name='불만 비율',
-                marker_color='#E74C3C'
-            ))
-            fig.update_layout(
-                title="월별 보습/전체 부정 리뷰 비율",
-                xaxis_title="월",
-                yaxis_title="비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea3', idea3_figure, result)
         else:
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 4
-    elif "IDEA 4" in selected_idea:
+    elif idea_key == "IDEA 4":
         st.subheader("💡 IDEA 4: 산뜻함 선호와 보습 불만이 동시에 발생한다")
         st.markdown("""
         **분석 목표**: 산뜻함을 원하면서 동시에 보습 불만을 표현하는 리뷰가 함께 증가하는지 검증
@@ -268,38 +326,16 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'FINISH_SENTIMENT' in analysis.df.columns and 'MOISTURE_SENTIMENT' in analysis.df.columns:
-            result = analysis.idea4_freshness_moisture_conflict()
+            result = run_query('idea4_freshness_moisture_conflict')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=result.index,
-                y=result['산뜻+보습불만 동시'],
-                name='산뜻+보습불만 동시',
-                marker_color='#9B59B6'
-            ))
-            fig.add_trace(go.Scatter(
-                x=result.index,
-                y=result['산뜻긍정'],
-                name='산뜻긍정',
-                mode='lines+markers',
-                yaxis='y2'
-            ))
-            fig.update_layout(
-                title="산뜻함과 보습 불만의 관계",
-                xaxis_title="월",
-                yaxis_title="동시 발생 수",
-                yaxis2=dict(title="산뜻긍정 수", overlaying='y', side='right'),
-                height=400,
-                hovermode='x unified'
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea4', idea4_figure, result)
         else:
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 5
-    elif "IDEA 5" in selected_idea:
+    elif idea_key == "IDEA 5":
         st.subheader("💡 IDEA 5: 향은 계절 무관, 특정 월에만 이슈로 터진다")
         st.markdown("""
         **분석 목표**: 향에 대한 불만이 특정 월에 집중적으로 발생하는지 검증
@@ -308,29 +344,16 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'SCENT_SENTIMENT' in analysis.df.columns:
-            result = analysis.idea5_scent_seasonality()
+            result = run_query('idea5_scent_seasonality')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=result.index,
-                y=result['비율'],
-                name='향 부정 비율',
-                marker_color='#1ABC9C'
-            ))
-            fig.update_layout(
-                title="월별 향 부정 리뷰 비율",
-                xaxis_title="월",
-                yaxis_title="비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea5', idea5_figure, result)
         else:
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 6
-    elif "IDEA 6" in selected_idea:
+    elif idea_key == "IDEA 6":
         st.subheader("💡 IDEA 6: 무난한 평가는 신규 유입기에서 증가한다")
         st.markdown("""
         **분석 목표**: 신규 구매 고객이 "무난하다"는 표현을 더 많이 사용하는지 검증
@@ -339,29 +362,16 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'ONE_LINE_SUMMARY' in analysis.df.columns and 'PURCHASE_TYPE' in analysis.df.columns:
-            result = analysis.idea6_neutral_new_purchase()
+            result = run_query('idea6_neutral_new_purchase')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=result.index,
-                y=result['신규대비비율'],
-                name='신규 대비 무난 비율',
-                marker_color='#F39C12'
-            ))
-            fig.update_layout(
-                title="월별 신규 구매 리뷰의 '무난' 표현 비율",
-                xaxis_title="월",
-                yaxis_title="비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea6', idea6_figure, result)
         else:
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 7
-    elif "IDEA 7" in selected_idea:
+    elif idea_key == "IDEA 7":
         st.subheader("💡 IDEA 7: 지성 피부는 여름에 마무리에 민감해진다")
         st.markdown("""
         **분석 목표**: 지성 피부 고객이 마무리감에 대해 여름에 더 민감해지는지 검증
@@ -370,31 +380,16 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'SKIN_TYPE_FINAL' in analysis.df.columns and 'FINISH_SENTIMENT' in analysis.df.columns:
-            result = analysis.idea7_oily_skin_finish_sensitivity()
+            result = run_query('idea7_oily_skin_finish_sensitivity')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=result.index,
-                y=result['비율'],
-                mode='lines+markers',
-                name='지성+마무리부정 비율',
-                line=dict(color='#E74C3C', width=3),
-                marker=dict(size=10)
-            ))
-            fig.update_layout(
-                title="지성 피부의 월별 마무리감 불만 비율",
-                xaxis_title="월",
-                yaxis_title="비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea7', idea7_figure, result)
         else:
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 8
-    elif "IDEA 8" in selected_idea:
+    elif idea_key == "IDEA 8":
         st.subheader("💡 IDEA 8: 자극 이슈는 특정 월에 집중적으로 발생한다")
         st.markdown("""
         **분석 목표**: 자극 관련 문제가 특정 월에 집중적으로 보고되는지 검증
@@ -403,29 +398,16 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'IRRITATION_VALUE' in analysis.df.columns:
-            result = analysis.idea8_irritation_spike()
+            result = run_query('idea8_irritation_spike')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=result.index,
-                y=result['비율'],
-                name='자극 이슈 비율',
-                marker_color='#E74C3C'
-            ))
-            fig.update_layout(
-                title="월별 자극 이슈 리뷰 비율",
-                xaxis_title="월",
-                yaxis_title="비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea8', idea8_figure, result)
         else:
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 9
-    elif "IDEA 9" in selected_idea:
+    elif idea_key == "IDEA 9":
         st.subheader("💡 IDEA 9: 가성비 평가는 불만을 완충한다")
         st.markdown("""
         **분석 목표**: 가성비를 언급한 리뷰가 전체 평가에 더 긍정적인지 검증
@@ -434,37 +416,16 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'ONE_LINE_SUMMARY' in analysis.df.columns and 'OVERALL_SENTIMENT' in analysis.df.columns:
-            result = analysis.idea9_value_for_money_buffering()
+            result = run_query('idea9_value_for_money_buffering')
             st.dataframe(result, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=result.index,
-                y=(result['가성비 긍정'] / (result['가성비 긍정'] + result['가성비 부정'] + 1) * 100),
-                mode='lines+markers',
-                name='가성비 언급 긍정 비율',
-                line=dict(color='#2ECC71', width=3)
-            ))
-            fig.add_trace(go.Scatter(
-                x=result.index,
-                y=(result['전체 긍정'] / (result['전체 긍정'] + result['전체 부정'] + 1) * 100),
-                mode='lines+markers',
-                name='전체 긍정 비율',
-                line=dict(color='#95A5A6', width=2, dash='dash')
-            ))
-            fig.update_layout(
-                title="가성비 언급 여부에 따른 긍정 비율 비교",
-                xaxis_title="월",
-                yaxis_title="긍정 비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea9', idea9_figure, result)
         else:
             st.warning("필요한 컬럼 데이터가 부족합니다.")
 
     # IDEA 10
-    elif "IDEA 10" in selected_idea:
+    elif idea_key == "IDEA 10":
         st.subheader("💡 IDEA 10: 재구매 리뷰는 계절 영향이 작다")
         st.markdown("""
         **분석 목표**: 재구매 고객의 평가가 신규 고객보다 계절 변화에 덜 민감한지 검증
@@ -473,7 +434,7 @@ elif page == "🔍 10가지 인사이트":
         """)
 
         if 'MONTH' in analysis.df.columns and 'PURCHASE_TYPE' in analysis.df.columns:
-            result, repurchase_monthly, overall_monthly = analysis.idea10_repurchase_seasonal_resilience()
+            result, repurchase_monthly, overall_monthly = run_query('idea10_repurchase_seasonal_resilience')
 
             col1, col2 = st.columns(2)
 
@@ -490,28 +451,7 @@ elif page == "🔍 10가지 인사이트":
                 st.dataframe(comparison_data, use_container_width=True)
 
             # 시각화
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=repurchase_monthly.index,
-                y=repurchase_monthly['OVERALL_SENTIMENT'],
-                mode='lines+markers',
-                name='재구매 긍정 비율',
-                line=dict(color='#2ECC71', width=3)
-            ))
-            fig.add_trace(go.Scatter(
-                x=overall_monthly.index,
-                y=overall_monthly['OVERALL_SENTIMENT'],
-                mode='lines+markers',
-                name='전체 긍정 비율',
-                line=dict(color='#95A5A6', width=2, dash='dash')
-            ))
-            fig.update_layout(
-                title="재구매 vs 전체 리뷰의 월별 긍정 비율 안정성",
-                xaxis_title="월",
-                yaxis_title="긍정 비율 (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            render_chart('idea10', idea10_figure, (result, repurchase_monthly, overall_monthly))
 
             st.info("""
             **해석**:
@@ -524,11 +464,12 @@ elif page == "🔍 10가지 인사이트":
 # ===== PAGE 3: 월별 속성 분석 =====
 elif page == "📋 월별 속성 분석":
     st.title("📋 월별 속성별 감성 분석")
-    st.markdown(f"### 📦 제품: {selected_product}")
+    st.markdown(f"### 🧴 {selected_category} · 📦 제품: {selected_product}")
     st.markdown("---")
 
     # 월별 속성 감성 테이블
-    monthly_attribute = analysis.get_monthly_attribute_sentiment_table()
+    analysis.ensure_columns(page_columns('attributes'))
+    monthly_attribute = run_query('get_monthly_attribute_sentiment_table')
 
     st.subheader("월별 속성별 긍정 비율 (%)")
     st.dataframe(monthly_attribute, use_container_width=True)
@@ -537,17 +478,7 @@ elif page == "📋 월별 속성 분석":
 
     if len(monthly_attribute) > 0 and len(monthly_attribute.columns) > 0:
         # 히트맵 시각화
-        fig = px.imshow(
-            monthly_attribute.T,
-            labels=dict(x="월", y="속성", color="긍정 비율 (%)"),
-            x=monthly_attribute.index,
-            y=monthly_attribute.columns,
-            color_continuous_scale="RdYlGn",
-            aspect="auto",
-            height=400
-        )
-        fig.update_layout(title="월별 × 속성별 긍정 비율 히트맵")
-        st.plotly_chart(fig, use_container_width=True)
+        render_chart('attribute_heatmap', attribute_heatmap_figure, monthly_attribute)
 
         # 속성별 월간 추이
         st.markdown("---")
@@ -561,33 +492,43 @@ elif page == "📋 월별 속성 분석":
         )
 
         if selected_attributes:
-            fig_attribute = go.Figure()
-            for attr in selected_attributes:
-                fig_attribute.add_trace(go.Scatter(
-                    x=monthly_attribute.index,
-                    y=monthly_attribute[attr],
-                    mode='lines+markers',
-                    name=attr,
-                    marker=dict(size=8)
-                ))
-
-            fig_attribute.update_layout(
-                title="속성별 월간 긍정 비율 추이",
-                xaxis_title="월",
-                yaxis_title="긍정 비율 (%)",
-                height=400,
-                hovermode='x unified'
-            )
-            st.plotly_chart(fig_attribute, use_container_width=True)
+            render_chart('attribute_trend', attribute_trend_figure, monthly_attribute, selected_attributes)
     else:
         st.info("월별 데이터가 부족합니다.")
 
 # ===== PAGE 4: 상세 데이터 =====
 elif page == "📑 상세 데이터":
     st.title("📑 상세 데이터")
-    st.markdown(f"### 📦 제품: {selected_product}")
+    st.markdown(f"### 🧴 {selected_category} · 📦 제품: {selected_product}")
     st.markdown("---")
 
+    # 적재 품질 리포트 (카테고리 전체 기준)
+    quality = analysis.quality_report
+    if quality:
+        with st.expander(f"🧹 데이터 품질 리포트 · 격리 {quality['quarantined_rows']:,}행"):
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("검사 행 수", f"{quality['rows']:,}")
+            col2.metric("날짜 파싱 실패", f"{quality['date_parse_failures']:,}")
+            col3.metric("REVIEW_ID 중복", f"{quality['duplicate_review_ids']:,}")
+            col4.metric("사전 위반", f"{sum(quality['invalid_vocabulary'].values()):,}")
+            if quality['missing_columns']:
+                st.warning(f"필수 컬럼 누락: {', '.join(quality['missing_columns'])}")
+            st.dataframe(quality_table(quality), use_container_width=True)
+
+            if analysis.quarantine is not None and len(analysis.quarantine) > 0:
+                st.write("**격리된 행**")
+                st.dataframe(analysis.quarantine.head(1000), use_container_width=True, height=240)
+                st.download_button(
+                    label="📥 격리된 행 다운로드 (CSV)",
+                    data=analysis.quarantine.to_csv(index=False, encoding='utf-8-sig'),
+                    file_name=f"quarantine_{selected_category}_reviews.csv",
+                    mime="text/csv"
+                )
+
+    # 주요 컬럼만 선택해서 표시 (요약 등 긴 텍스트 컬럼은 이 페이지에서 처음 로드)
+    display_columns = DETAIL_DISPLAY_COLUMNS
+    analysis.ensure_columns(page_columns('detail'))
+
     # 데이터 필터링
     col1, col2, col3 = st.columns(3)
 
@@ -629,13 +570,6 @@ elif page == "📑 상세 데이터":
     # 필터 결과
     st.info(f"📊 필터링 결과: {len(filtered_df):,}개의 리뷰")
 
-    # 주요 컬럼만 선택해서 표시
-    display_columns = [
-        '리뷰등록일', 'ONE_LINE_SUMMARY', 'OVERALL_SENTIMENT',
-        'ABSORPTION_SENTIMENT', 'FINISH_SENTIMENT', 'MOISTURE_SENTIMENT',
-        'SCENT_SENTIMENT', 'PURCHASE_TYPE', 'SKIN_TYPE_FINAL'
-    ]
-
     # 존재하는 컬럼만 선택
     existing_columns = [col for col in display_columns if col in filtered_df.columns]
 
@@ -651,7 +585,7 @@ elif page == "📑 상세 데이터":
         st.download_button(
             label="📥 필터링된 데이터 다운로드 (CSV)",
             data=csv,
-            file_name=f"filtered_toner_reviews_{selected_product}.csv",
+            file_name=f"filtered_{selected_category}_reviews_{selected_product}.csv",
             mime="text/csv"
         )
 
@@ -675,11 +609,209 @@ elif page == "📑 상세 데이터":
                 positive_ratio = (filtered_df['OVERALL_SENTIMENT'] == 'POSITIVE').sum() / len(filtered_df) * 100 if len(filtered_df) > 0 else 0
                 st.metric("긍정 비율", f"{positive_ratio:.1f}%")
 
+# ===== PAGE 5: 재구매 코호트 =====
+elif page == "🔁 재구매 코호트":
+    st.title("🔁 재구매 코호트 분석")
+    st.markdown(f"### 🧴 {selected_category} · 📦 제품: {selected_product}")
+    st.markdown("---")
+
+    analysis.ensure_columns(page_columns('cohort'))
+    cohort_summary = analysis.get_cohort_summary()
+
+    if cohort_summary is None:
+        st.info("리뷰어 식별 컬럼(REVIEWER_ID 등)이 없어 코호트 분석을 할 수 없습니다.")
+    else:
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric(
+                "👤 리뷰어 수", f"{cohort_summary['reviewers']:,}",
+                help=f"재구매율은 리뷰어 × 브랜드 시퀀스 {cohort_summary['sequences']:,}개 기준"
+            )
+
+        with col2:
+            st.metric("🔁 재구매율", cohort_summary['repurchase_rate'])
+
+        with col3:
+            median_days = cohort_summary['median_days_to_repurchase']
+            st.metric("⏱️ 재구매까지 (중앙값)", f"{median_days:.0f}일" if median_days is not None else "-")
+
+        st.markdown("---")
+
+        # 첫 리뷰 속성 감성별 재구매
+        st.subheader("첫 리뷰 속성 감성별 재구매율")
+        st.markdown("""
+        **분석 목표**: 첫 구매 리뷰에서 특정 속성(예: 흡수)을 긍정 평가한 리뷰어가 실제로 이후에 다시 구매하는지 리뷰어 단위로 검증
+        """)
+
+        by_sentiment = analysis.repurchase_by_first_sentiment()
+        st.dataframe(by_sentiment, use_container_width=True)
+
+        if len(by_sentiment) > 0:
+            attributes = by_sentiment.index.get_level_values('속성').unique().tolist()
+            selected_attribute = st.selectbox("속성 선택", attributes)
+            attribute_table = by_sentiment.loc[selected_attribute]
+            render_chart('cohort_repurchase', cohort_repurchase_figure, attribute_table, selected_attribute)
+
+        st.markdown("---")
+
+        # 첫 구매 월 코호트
+        st.subheader("첫 구매 월 코호트별 재방문 비율 (%)")
+        retention = analysis.cohort_retention_table()
+        st.dataframe(retention, use_container_width=True)
+
+        if len(retention) > 0:
+            retention_rates = retention.drop(columns=['코호트 리뷰어 수'])
+            render_chart('cohort_retention', cohort_retention_figure, retention_rates)
+
+# ===== PAGE 6: 속성 동시발생 =====
+elif page == "🧩 속성 동시발생":
+    st.title("🧩 속성 동시발생 매트릭스")
+    st.markdown(f"### 🧴 {selected_category} · 📦 제품: {selected_product}")
+    st.markdown("""
+    **분석 목표**: 속성 × 감성, 피부/구매 유형, 요약 키워드의 모든 쌍에 대해 함께 나타나는 정도를 계산하여
+    IDEA 4(산뜻 + 보습불만)와 같은 새로운 조합을 코드 없이 탐색
+
+    - **향상도(lift)**: 1보다 크면 두 피처가 우연보다 자주 함께 등장
+    - **조건부 확률 P(열|행)**: 행 피처가 있는 리뷰 중 열 피처가 함께 있는 비율
+    """)
+    st.markdown("---")
+
+    analysis.ensure_columns(page_columns('cooccurrence'))
+    cooccurrence = analysis.attribute_cooccurrence(group_by=['MONTH'])
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        month_options = ["전체"] + [int(g[0]) for g in cooccurrence.groups]
+        selected_month = st.selectbox("월 선택", month_options)
+
+    with col2:
+        selected_metric = st.selectbox("지표 선택", list(METRICS.keys()), format_func=lambda m: METRICS[m])
+
+    with col3:
+        min_count = st.number_input("최소 동시 발생 수", min_value=1, value=30, step=10)
+
+    group = None if selected_month == "전체" else float(selected_month)
+
+    # 상위 조합
+    st.subheader("서로 다른 속성 간 향상도 상위 조합")
+    st.dataframe(cooccurrence.top_pairs(group=group, min_count=min_count), use_container_width=True)
+
+    # 전체 매트릭스
+    st.subheader(f"피처 × 피처 {METRICS[selected_metric]}")
+    matrix = cooccurrence.metric_frame(selected_metric, group=group)
+
+    if len(matrix) > 0:
+        render_chart(
+            'cooccurrence_matrix', cooccurrence_figure, matrix, selected_metric, METRICS[selected_metric],
+            f"{'전체 기간' if group is None else f'{selected_month}월'} {METRICS[selected_metric]}"
+        )
+
+        with st.expander("매트릭스 표 보기"):
+            st.dataframe(matrix, use_container_width=True)
+    else:
+        st.info("동시발생을 계산할 속성 데이터가 없습니다.")
+
+# ===== PAGE 7: 요약 키워드 트렌드 =====
+elif page == "💬 요약 키워드 트렌드":
+    st.title("💬 한 줄 요약 키워드 트렌드")
+    st.markdown(f"### 🧴 {selected_category} · 📦 제품: {selected_product}")
+    st.markdown("""
+    **분석 목표**: ONE_LINE_SUMMARY의 어절·문자 n-gram을 월별로 집계하여 전월 대비 급증한 불만 표현을 탐지
+    """)
+    st.markdown("---")
+
+    sentiment_filter = st.radio(
+        "리뷰 범위",
+        ["NEGATIVE", "NEUTRAL", "POSITIVE", "전체"],
+        format_func=lambda v: {'NEGATIVE': '부정 리뷰', 'NEUTRAL': '중립 리뷰', 'POSITIVE': '긍정 리뷰', '전체': '전체 리뷰'}[v],
+        horizontal=True
+    )
+    sentiment = None if sentiment_filter == "전체" else sentiment_filter
+
+    with st.spinner("요약 단어 행렬 준비 중... (최초 1회, 이후 디스크 캐시 사용)"):
+        trending = analysis.trending_summary_terms(sentiment=sentiment, limit=5)
+        top_terms = analysis.summary_top_terms(sentiment=sentiment, limit=20)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("월별 급상승 표현 (전월 대비)")
+        st.dataframe(trending, use_container_width=True, height=400)
+
+    with col2:
+        st.subheader("대표 표현 (TF-IDF 상위)")
+        st.dataframe(top_terms, use_container_width=True, height=400)
+
+    if len(trending) > 0:
+        months_with_trend = sorted(trending['월'].unique())
+        selected_trend_month = st.selectbox("월 선택", months_with_trend, format_func=lambda m: f"{int(m)}월")
+        month_trend = trending[trending['월'] == selected_trend_month]
+
+        render_chart('summary_trending', trending_terms_figure, month_trend, selected_trend_month)
+    else:
+        st.info("월별 비교가 가능한 요약 데이터가 부족합니다.")
+
+# ===== PAGE 8: 지표 변화 추이 =====
+elif page == "📉 지표 변화 추이":
+    st.title("📉 인사이트 지표 변화 추이")
+    st.markdown(f"### 🧴 {selected_category} · 📦 제품: {selected_product}")
+    st.markdown("---")
+
+    history = catalog.history
+    if analysis.dataset_version and not history.has_version(selected_category, analysis.dataset_version):
+        st.info("현재 데이터셋 버전의 지표를 기록하는 중입니다. 잠시 후 다시 확인하세요.")
+
+    versions = history.versions(selected_category)
+    if len(versions) == 0:
+        st.info("기록된 지표 이력이 없습니다.")
+    else:
+        st.subheader("기록된 데이터셋 버전")
+        st.dataframe(
+            versions.rename(columns={'dataset_version': '버전', 'recorded_at': '기록 시각', 'data_end': '데이터 마지막 날짜'}),
+            use_container_width=True
+        )
+
+        failures = history.failures(selected_category)
+        if len(failures):
+            st.warning(
+                f"계산에 실패해 값 없이 기록된 지표가 {len(failures)}개 있습니다. "
+                f"원인을 수정한 뒤 `python history.py --category {selected_category} --repair`로 현재 버전을 다시 기록하세요."
+            )
+            with st.expander("계산 실패 지표"):
+                st.dataframe(
+                    failures.rename(columns={
+                        'dataset_version': '버전', 'recorded_at': '기록 시각', 'product': '제품', 'metric': '지표', 'error': '오류'
+                    }),
+                    use_container_width=True
+                )
+
+        metrics = history.metrics(selected_category, selected_product)
+        if not metrics:
+            st.info("선택한 제품의 기록된 지표가 없습니다.")
+        else:
+            selected_metric = st.selectbox("지표 선택", metrics, format_func=metric_label)
+            drift = history.drift(selected_category, selected_metric, selected_product)
+
+            render_chart('metric_drift', metric_drift_figure, drift, metric_label(selected_metric))
+            st.dataframe(drift, use_container_width=True)
+
+            # 최근 두 버전 간 변화
+            if drift.shape[1] >= 2:
+                st.subheader("직전 버전 대비 변화")
+                change = pd.DataFrame({
+                    '직전': drift.iloc[:, -2],
+                    '최근': drift.iloc[:, -1],
+                    '변화': (drift.iloc[:, -1] - drift.iloc[:, -2]).round(2)
+                })
+                st.dataframe(change, use_container_width=True)
+
 # 푸터
 st.markdown("---")
 st.markdown("""
 <div style='text-align: center'>
-    <small>💡 토너 리뷰 인사이트 도출 대시보드</small><br>
+    <small>💡 리뷰 인사이트 도출 대시보드</small><br>
     <small>데이터 기반 제품별 인사이트 분석</small>
 </div>
 """, unsafe_allow_html=True)
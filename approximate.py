@@ -0,0 +1,293 @@
+"""
+근사 질의 모드
+브랜드 × 월 × 구매 유형 층화 표본으로 인사이트/속성 테이블/개요를 즉시 계산하고 95% 신뢰구간 오차 범위를 함께 제공,
+정확한 결과는 백그라운드 스레드에서 계산해 준비되면 교체
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from analysis import ReviewInsightAnalysis, columns_for
+from masks import PREDICATES
+
+
+STRATA_COLUMNS = ['브랜드명', 'MONTH', 'PURCHASE_TYPE']
+DEFAULT_FRACTION = 0.05
+MIN_SAMPLE_ROWS = 2000
+Z_95 = 1.96
+# 정확한 결과 보관 개수 (초과 시 완료된 결과부터 오래된 순으로 해제)와 실패 시 재시도 횟수
+MAX_EXACT_RESULTS = 64
+EXACT_MAX_ATTEMPTS = 3
+
+
+# 비율 분모(표본에서 월별로 세는 대상) 조건 (전체 행 외에는 masks 공유 조건 사용)
+def _all_rows(df):
+    return np.ones(len(df), dtype=bool)
+
+
+_repurchase = PREDICATES['repurchase'][1]
+_new_purchase = PREDICATES['new_purchase'][1]
+_viscous_texture = PREDICATES['viscous_texture'][1]
+_oily_skin = PREDICATES['oily_skin'][1]
+
+
+# 메서드별 결과 컬럼 해석 {메서드: {'counts': [건수 컬럼], 'ratios': {비율(%) 컬럼: 분모 조건}}}
+# 건수는 표본 추출률로 확대 추정하고, 비율은 비례 배분 표본(자기 가중)이므로 그대로 사용
+APPROXIMATION_REGISTRY = {
+    'idea1_absorption_repurchase': {'counts': ['총 재구매 리뷰'], 'ratios': {'흡수 긍정 비율': _repurchase}},
+    'idea2_texture_seasonality': {'counts': [], 'ratios': {'긍정 비율': _viscous_texture}},
+    'idea3_moisture_summer_dissatisfaction': {'counts': ['보습/전체 부정 리뷰'], 'ratios': {'비율': _all_rows}},
+    'idea4_freshness_moisture_conflict': {'counts': ['산뜻+보습불만 동시', '산뜻긍정', '보습부정'], 'ratios': {}},
+    'idea5_scent_seasonality': {'counts': ['향부정'], 'ratios': {'비율': _all_rows}},
+    'idea6_neutral_new_purchase': {'counts': ['무난+신규', '신규총'], 'ratios': {'신규대비비율': _new_purchase}},
+    'idea7_oily_skin_finish_sensitivity': {'counts': ['지성+마무리부정', '지성총'], 'ratios': {'비율': _oily_skin}},
+    'idea8_irritation_spike': {'counts': ['자극이슈'], 'ratios': {'비율': _all_rows}},
+    'idea9_value_for_money_buffering': {'counts': ['가성비 긍정', '가성비 부정', '전체 긍정', '전체 부정'], 'ratios': {}},
+    'get_monthly_attribute_sentiment_table': {'counts': [], 'ratios': {'*': _all_rows}},
+}
+
+# IDEA 10은 (표준편차 표, 재구매 월별 비율, 전체 월별 비율) 튜플 → 월별 비율 표별 분모
+IDEA10_METHOD = 'idea10_repurchase_seasonal_resilience'
+IDEA10_PART_DENOMINATORS = {1: _repurchase, 2: _all_rows}
+
+# 표본 DataFrame에 담는 컬럼 (층 + 근사 대상 메서드 필요 컬럼 합집합)
+# 제품별 최초 질의 때 전체 데이터에서 한 번만 추출하고 이후 질의는 표본만 사용
+SAMPLE_COLUMNS = list(dict.fromkeys(
+    STRATA_COLUMNS + columns_for(*APPROXIMATION_REGISTRY, IDEA10_METHOD, 'get_summary')
+))
+
+
+def stratified_sample(df, fraction=DEFAULT_FRACTION, strata=STRATA_COLUMNS, seed=0):
+    """층별 비례 배분 표본의 행 위치 (층 크기 × 추출률, 소수점 이하는 확률적 반올림)"""
+    n = len(df)
+    if n == 0:
+        return np.array([], dtype=np.int64)
+
+    # 층 컬럼별 코드를 혼합 기수로 결합 (결측은 별도 층)
+    codes = np.zeros(n, dtype=np.int64)
+    for col in strata:
+        if col in df.columns:
+            column_codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+            codes = codes * (len(uniques) + 1) + column_codes
+    codes = pd.factorize(codes)[0]
+
+    rng = np.random.default_rng(seed)
+    sizes = np.bincount(codes)
+    expected = sizes * fraction
+    quota = np.floor(expected).astype(np.int64)
+    quota += rng.random(len(sizes)) < (expected - quota)
+
+    # 층 내 무작위 순위가 할당량보다 작은 행 선택
+    order = np.lexsort((rng.random(n), codes))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.arange(n) - np.repeat(starts, sizes)
+    chosen = order[rank < np.repeat(quota, sizes)]
+    return np.sort(chosen)
+
+
+def _ratio_bounds(ratio_percent, sample_sizes, fraction):
+    """비율(%)의 95% 신뢰구간 반폭(%p) (이항 정규 근사 + 유한 모집단 보정)"""
+    p = np.clip(np.asarray(ratio_percent, dtype=np.float64) / 100, 0, 1)
+    n = np.asarray(sample_sizes, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        se = np.sqrt(p * (1 - p) / n * (1 - fraction))
+    # 표본이 0건인 칸은 추정 불가 → 최대 오차(±100%p)
+    return np.where(n > 0, Z_95 * se * 100, 100.0)
+
+
+def _count_bounds(sample_counts, fraction):
+    """확대 추정 건수의 95% 신뢰구간 반폭 (Var = c(1-f)/f²)"""
+    counts = np.asarray(sample_counts, dtype=np.float64)
+    return Z_95 * np.sqrt(counts * (1 - fraction)) / fraction
+
+
+def _monthly_sizes(sample, predicate, index):
+    """표본의 월별 분모 건수 (결과 인덱스에 맞춤)"""
+    mask = predicate(sample)
+    return sample.loc[mask, 'MONTH'].value_counts().reindex(index, fill_value=0).to_numpy()
+
+
+def _estimate_frame(frame, sample, fraction, counts, ratios):
+    """표본 결과 표 → (추정 표, 오차 범위 표)"""
+    estimate = frame.copy()
+    bounds = pd.DataFrame(index=frame.index)
+    for col in counts:
+        if col in frame.columns:
+            sample_counts = frame[col].to_numpy(dtype=np.float64)
+            estimate[col] = np.round(sample_counts / fraction).astype(np.int64)
+            bounds[col] = np.round(_count_bounds(sample_counts, fraction), 1)
+
+    ratio_columns = list(frame.columns) if '*' in ratios else [col for col in ratios if col in frame.columns]
+    for col in ratio_columns:
+        predicate = ratios.get(col, ratios.get('*'))
+        sizes = _monthly_sizes(sample, predicate, frame.index)
+        bounds[col] = np.round(_ratio_bounds(frame[col], sizes, fraction), 2)
+    return estimate, bounds
+
+
+class ApproximateAnswer:
+    """근사(또는 정확) 결과와 오차 범위 (is_exact이면 bounds는 None)"""
+
+    def __init__(self, value, bounds=None, fraction=1.0, sample_size=None, is_exact=False):
+        self.value = value
+        self.bounds = bounds
+        self.fraction = fraction
+        self.sample_size = sample_size
+        self.is_exact = is_exact
+
+
+class ApproximateEngine:
+    """카테고리 분석 객체에 대한 근사 질의 (제품별 층화 표본 유지 + 정확한 결과 백그라운드 계산)"""
+
+    def __init__(self, analysis, fraction=DEFAULT_FRACTION, workers=2, seed=0):
+        self.analysis = analysis
+        self.fraction = fraction
+        self.seed = seed
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        # 제품별 표본 행 위치 (컬럼 구성이 달라도 같은 행을 사용)
+        self._positions = {}
+        # {(제품, 컬럼): (표본 DataFrame, 실제 추출률)}
+        self._samples = {}
+        # {(제품, 메서드): [Future, 시도 횟수]} (최근 사용 순)
+        self._exact = OrderedDict()
+        self._lock = threading.Lock()
+
+    def close(self):
+        """대기 중인 정확한 결과 계산 취소 (데이터셋이 바뀌어 엔진을 교체할 때)"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # ----- 표본 -----
+    def _view(self, product, columns=()):
+        view = self.analysis.for_product(product)
+        view.ensure_columns(list(columns))
+        return view
+
+    def sample_frame(self, product, method=None):
+        """제품 데이터의 층화 표본 DataFrame과 실제 추출률
+
+        표본은 (제품, 컬럼)별로 한 번만 만들어 보관하므로 이후 질의는 전체 데이터(저장소 모드의 파티션 파일)를 읽지 않음
+        """
+        columns = tuple(dict.fromkeys(SAMPLE_COLUMNS + (columns_for(method) if method else [])))
+        key = (product, columns)
+        with self._lock:
+            cached = self._samples.get(key)
+        if cached is not None:
+            return cached
+
+        view = self._view(product, columns)
+        with self._lock:
+            positions = self._positions.get(product)
+        if positions is None:
+            # 작은 제품은 최소 표본 크기를 채우도록 추출률 상향 (전체보다 작으면 전수)
+            fraction = min(1.0, max(self.fraction, MIN_SAMPLE_ROWS / max(len(view.df), 1)))
+            positions = stratified_sample(view.df, fraction, seed=self.seed)
+            with self._lock:
+                positions = self._positions.setdefault(product, positions)
+        sample = view.df[[col for col in columns if col in view.df.columns]].iloc[positions]
+        fraction = len(sample) / len(view.df) if len(view.df) else 1.0
+        with self._lock:
+            return self._samples.setdefault(key, (sample, fraction))
+
+    # ----- 정확한 결과 -----
+    def _exact_future(self, product, method):
+        """정확한 결과 계산 작업 (같은 제품·메서드는 한 번만 제출, 실패하면 EXACT_MAX_ATTEMPTS회까지 재제출)"""
+        key = (product, method)
+        with self._lock:
+            entry = self._exact.get(key)
+            if entry is None or (_failed(entry[0]) and entry[1] < EXACT_MAX_ATTEMPTS):
+                attempts = entry[1] + 1 if entry is not None else 1
+                future = self.executor.submit(lambda: getattr(self._view(product), method)())
+                entry = self._exact[key] = [future, attempts]
+            self._exact.move_to_end(key)
+            self._evict_exact()
+        return entry[0]
+
+    def _evict_exact(self):
+        """보관 한도를 넘으면 완료(성공·실패)된 결과를 오래된 순으로 해제 (계산 중인 작업은 유지)"""
+        excess = len(self._exact) - MAX_EXACT_RESULTS
+        for key in list(self._exact):
+            if excess <= 0:
+                break
+            if self._exact[key][0].done():
+                del self._exact[key]
+                excess -= 1
+
+    def exact_status(self, product, method):
+        """정확한 결과 상태: 'ready' | 'running' | 'retry'(실패, 다음 질의 때 재시도) | 'failed' | 'missing'"""
+        with self._lock:
+            entry = self._exact.get((product, method))
+        if entry is None:
+            return 'missing'
+        future, attempts = entry
+        if not future.done():
+            return 'running'
+        if not _failed(future):
+            return 'ready'
+        return 'retry' if attempts < EXACT_MAX_ATTEMPTS else 'failed'
+
+    def exact_ready(self, product, method):
+        return self.exact_status(product, method) == 'ready'
+
+    # ----- 질의 -----
+    def query(self, product, method):
+        """메서드 결과 (정확한 결과가 준비됐으면 정확, 아니면 표본 추정 + 오차 범위)"""
+        future = self._exact_future(product, method)
+        if future.done() and not _failed(future):
+            return ApproximateAnswer(future.result(), is_exact=True)
+
+        sample, fraction = self.sample_frame(product, method)
+        sample_view = ReviewInsightAnalysis.from_frame(sample, category=self.analysis.category, product=product)
+        result = getattr(sample_view, method)()
+
+        if method == 'get_summary':
+            value, bounds = self._estimate_summary(result, sample, fraction, population=int(round(len(sample) / fraction)))
+        elif method == IDEA10_METHOD:
+            std_table, repurchase_monthly, overall_monthly = result
+            parts = [None, None, None]
+            _, parts[1] = _estimate_frame(repurchase_monthly, sample, fraction, [], {'*': IDEA10_PART_DENOMINATORS[1]})
+            _, parts[2] = _estimate_frame(overall_monthly, sample, fraction, [], {'*': IDEA10_PART_DENOMINATORS[2]})
+            value, bounds = result, tuple(parts)
+        else:
+            spec = APPROXIMATION_REGISTRY.get(method, {'counts': [], 'ratios': {}})
+            value, bounds = _estimate_frame(result, sample, fraction, spec['counts'], spec['ratios'])
+
+        return ApproximateAnswer(value, bounds, fraction=fraction, sample_size=len(sample))
+
+    def _estimate_summary(self, summary, sample, fraction, population):
+        """get_summary 결과의 감정 비율 오차 범위 (리뷰 수는 모집단 크기 그대로)"""
+        n = len(sample)
+        value = dict(summary)
+        value['total_reviews'] = population
+        bounds = {'total_reviews': 0.0}
+        for key, label in [('positive_ratio', 'POSITIVE'), ('neutral_ratio', 'NEUTRAL'), ('negative_ratio', 'NEGATIVE')]:
+            p = (sample['OVERALL_SENTIMENT'] == label).mean() * 100 if n and 'OVERALL_SENTIMENT' in sample.columns else 0
+            bounds[key] = float(np.round(_ratio_bounds(p, n, fraction), 2))
+        return value, bounds
+
+    def overview(self, product):
+        """개요 차트용 결과 (value: (DataFrame, 건수 배율), bounds: 월별 감정 건수·긍정 비율 오차 범위 표)
+
+        정확한 요약이 준비되면 전체 데이터
+        """
+        self._exact_future(product, 'get_summary')
+        if self.exact_ready(product, 'get_summary'):
+            view = self._view(product, STRATA_COLUMNS + columns_for('get_summary'))
+            return ApproximateAnswer((view.df, 1.0), is_exact=True)
+
+        sample, fraction = self.sample_frame(product, 'get_summary')
+        counts = sample.groupby('MONTH')['OVERALL_SENTIMENT'].value_counts().unstack(fill_value=0)
+        bounds = pd.DataFrame(np.round(_count_bounds(counts.to_numpy(), fraction), 1), index=counts.index, columns=counts.columns)
+        positive = counts['POSITIVE'] if 'POSITIVE' in counts.columns else pd.Series(0, index=counts.index)
+        sizes = counts.sum(axis=1)
+        bounds['긍정 비율'] = np.round(_ratio_bounds(positive / sizes.where(sizes > 0) * 100, sizes, fraction), 2)
+        scale = 1 / fraction if fraction else 1.0
+        return ApproximateAnswer((sample, scale), bounds, fraction=fraction, sample_size=len(sample))
+
+
+def _failed(future):
+    """완료됐지만 결과가 없는 작업 (예외 또는 취소)"""
+    return future.done() and (future.cancelled() or future.exception() is not None)
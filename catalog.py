@@ -0,0 +1,188 @@
+"""
+리뷰 데이터셋 카탈로그
+data/ 디렉터리의 카테고리별 리뷰 파일(단일 CSV 또는 파티션 파일)을 탐색하고 카테고리 단위로 지연 로드
+"""
+
+import os
+import glob
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from analysis import ReviewInsightAnalysis
+from masks import mask_cache
+
+
+# 리뷰 파일명 규칙: 올영리뷰_<카테고리>.csv, 올영리뷰_<카테고리>_<파티션>.csv, 올영리뷰_<카테고리>/*.csv
+# 브랜드/연월 파티션 저장소(storage.py로 적재한 디렉터리)가 있으면 CSV보다 우선 사용
+FILE_PREFIX = '올영리뷰_'
+DEFAULT_MAX_RESIDENT = 3
+
+
+def _category_from_name(name):
+    """파일/디렉터리 이름에서 카테고리명 추출"""
+    stem = os.path.splitext(name)[0]
+    if not stem.startswith(FILE_PREFIX):
+        return None
+    category = stem[len(FILE_PREFIX):].split('_')[0]
+    return category or None
+
+
+def _is_store_dir(path):
+    """브랜드 파티션 저장소 디렉터리인지 확인 (pyarrow는 저장소가 있을 때만 로드)"""
+    return os.path.isdir(path) and any(name.startswith('브랜드명=') for name in os.listdir(path))
+
+
+def discover_datasets(data_dir):
+    """카테고리별 데이터 위치 탐색 {카테고리: [CSV 경로, ...] 또는 파티션 저장소 경로}"""
+    datasets = {}
+    stores = {}
+    if not os.path.isdir(data_dir):
+        return datasets
+
+    for name in sorted(os.listdir(data_dir)):
+        path = os.path.join(data_dir, name)
+        category = _category_from_name(name)
+        if category is None:
+            continue
+        if _is_store_dir(path):
+            stores[category] = path
+            continue
+        if os.path.isdir(path):
+            paths = sorted(glob.glob(os.path.join(path, '*.csv')))
+        elif name.endswith('.csv'):
+            paths = [path]
+        else:
+            continue
+        datasets.setdefault(category, []).extend(paths)
+
+    datasets = {category: paths for category, paths in datasets.items() if paths}
+    datasets.update(stores)
+    return dict(sorted(datasets.items()))
+
+
+def dataset_version(source):
+    """데이터 소스(CSV 경로 목록 또는 저장소 디렉터리)의 파일 크기·수정 시각으로 만든 버전 문자열"""
+    paths = [source] if isinstance(source, str) else list(source)
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(p for p in glob.glob(os.path.join(path, '**', '*'), recursive=True) if os.path.isfile(p)))
+        else:
+            files.append(path)
+    parts = []
+    for path in files:
+        stat = os.stat(path)
+        parts.append(f'{os.path.relpath(path, os.path.dirname(paths[0]))}:{stat.st_size}:{stat.st_mtime_ns}')
+    return hashlib.blake2b('|'.join(parts).encode(), digest_size=8).hexdigest()
+
+
+class DatasetCatalog:
+    """카테고리별 분석 객체를 최초 사용 시 로드하고 LRU로 상주 개수를 제한"""
+
+    def __init__(self, data_dir, max_resident=DEFAULT_MAX_RESIDENT, rescorer=None, shared_dir=None, history=None):
+        self.data_dir = data_dir
+        self.max_resident = max_resident
+        # CSV 카테고리 로드 시 적용할 감성 재채점 단계 (파티션 저장소는 적재 시 적용)
+        self.rescorer = rescorer
+        # 지정 시 CSV 카테고리를 메모리 매핑 공유 저장소로 변환해 워커 프로세스 간 공유
+        self.shared_dir = shared_dir
+        # 지정 시(history.MetricHistory) 새 데이터셋 버전을 처음 로드할 때 지표 이력을 백그라운드로 기록
+        self.history = history
+        self.datasets = discover_datasets(data_dir)
+        self._resident = OrderedDict()
+        # 로드 중인 카테고리 {카테고리: Future} (같은 카테고리 동시 요청은 한 번만 로드하고 결과를 기다림)
+        self._loading = {}
+        # LRU·로드 중 목록 갱신만 보호 (로드 자체는 잠금 밖에서 수행해 다른 카테고리 요청을 막지 않음)
+        self._lock = threading.Lock()
+
+    def categories(self):
+        """카테고리 목록 반환"""
+        return list(self.datasets.keys())
+
+    def refresh(self):
+        """data 디렉터리 재탐색 (새 카테고리/파티션 반영, 파일 구성이나 내용이 바뀐 카테고리는 언로드)"""
+        datasets = discover_datasets(self.data_dir)
+        with self._lock:
+            for category, analysis in list(self._resident.items()):
+                source = datasets.get(category)
+                if source != self.datasets.get(category) or dataset_version(source) != analysis.dataset_version:
+                    del self._resident[category]
+                    mask_cache.invalidate(category, analysis.dataset_version)
+            self.datasets = datasets
+
+    def get(self, category):
+        """카테고리 분석 객체 반환 (미로드 시 로드, 상주 한도 초과 시 가장 오래 안 쓴 카테고리 해제)"""
+        with self._lock:
+            if category in self._resident:
+                self._resident.move_to_end(category)
+                return self._resident[category]
+            if category not in self.datasets:
+                raise KeyError(f"알 수 없는 카테고리: {category}")
+            pending = self._loading.get(category)
+            if pending is None:
+                source = self.datasets[category]
+                future = self._loading[category] = Future()
+
+        # 다른 세션이 같은 카테고리를 로드 중이면 그 결과를 공유 (실패 시 같은 예외 전파)
+        if pending is not None:
+            return pending.result()
+
+        try:
+            analysis = self._load(category, source)
+        except BaseException as e:
+            with self._lock:
+                self._loading.pop(category, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._loading.pop(category, None)
+            # 로드 중 refresh()로 소스가 바뀌었으면 상주시키지 않음 (다음 요청이 새 소스로 다시 로드)
+            if self.datasets.get(category) == source:
+                self._resident[category] = analysis
+                self._resident.move_to_end(category)
+                while len(self._resident) > self.max_resident:
+                    evicted_category, evicted = self._resident.popitem(last=False)
+                    mask_cache.invalidate(evicted_category, evicted.dataset_version)
+        future.set_result(analysis)
+        return analysis
+
+    def _load(self, category, source):
+        """데이터 소스 종류에 맞는 분석 객체 생성 (전역 잠금 밖에서 호출)"""
+        if isinstance(source, str):
+            from storage import PartitionedReviewStore
+            analysis = ReviewInsightAnalysis(category=category, store=PartitionedReviewStore(source))
+        elif self.shared_dir is not None:
+            from shared_store import open_shared_store
+            store = open_shared_store(source, category, self.shared_dir, rescorer=self.rescorer)
+            analysis = ReviewInsightAnalysis(category=category, store=store)
+        else:
+            analysis = ReviewInsightAnalysis(source, category=category, rescorer=self.rescorer)
+        analysis.dataset_version = dataset_version(source)
+        if self.history is not None:
+            self.history.record_async(analysis, analysis.dataset_version)
+        return analysis
+
+    def resident_categories(self):
+        """현재 메모리에 상주 중인 카테고리 목록"""
+        with self._lock:
+            return list(self._resident.keys())
+
+
+def dashboard_catalog(base_dir, data_dir=None, record_history=True):
+    """대시보드(app.py)와 같은 구성의 카탈로그 (API·리포트·이력 CLI·부하 테스트가 앱과 같은 로드 경로를 쓰도록 공용)
+
+    비어 있는 감성 라벨은 로컬 사전 채점으로 보완하고, 전처리 결과는 .cache/shared 메모리 매핑 파일로 공유,
+    새 데이터셋 버전은 history/에 지표 이력을 기록 (record_history=False이면 기록하지 않음)
+    """
+    # history가 catalog를 import하므로 순환을 피해 호출 시 로드
+    from sentiment_scoring import SentimentRescorer
+    from history import MetricHistory
+    return DatasetCatalog(
+        data_dir or os.path.join(base_dir, 'data'),
+        rescorer=SentimentRescorer(mode='fill'),
+        shared_dir=os.path.join(base_dir, '.cache', 'shared'),
+        history=MetricHistory(os.path.join(base_dir, 'history')) if record_history else None
+    )
@@ -0,0 +1,249 @@
+"""
+차트 데이터 레이어
+Plotly Figure의 트레이스를 포인트 예산 내로 사전 집계·다운샘플링하고, 축소된 Figure를
+차트 입력(차트 ID + 데이터셋 버전 또는 입력 데이터 해시) 키로 캐싱해 캐시 적중 시 Figure 생성을 건너뜀
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+
+# 기본 차트 플롯 폭(px)과 픽셀당 포인트 수
+DEFAULT_CHART_WIDTH = 1200
+POINTS_PER_PIXEL = 2
+MIN_POINT_BUDGET = 100
+
+# 히트맵 최대 행 수 (열은 포인트 예산 적용)
+MAX_HEATMAP_ROWS = 60
+
+
+def point_budget(chart_width=DEFAULT_CHART_WIDTH, points_per_pixel=POINTS_PER_PIXEL):
+    """차트 플롯 폭(px) 기준 트레이스당 최대 포인트 수"""
+    return max(int(chart_width * points_per_pixel), MIN_POINT_BUDGET)
+
+
+def _is_ordered_axis(x):
+    """구간 집계가 의미 있는 축(숫자·날짜)인지 확인 (범주형 축은 이웃 값끼리 평균하면 안 됨)"""
+    x = np.asarray(x)
+    return np.issubdtype(x.dtype, np.number) or np.issubdtype(x.dtype, np.datetime64)
+
+
+def _numeric_axis(x):
+    """x축 값을 LTTB 면적 계산용 실수 배열로 변환"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    if np.issubdtype(x.dtype, np.number):
+        return x.astype(np.float64)
+    # 범주형/문자열 축은 순서만 의미가 있으므로 위치 인덱스 사용
+    return np.arange(len(x), dtype=np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets 다운샘플링 (선택된 포인트 인덱스 반환)"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    xs = _numeric_axis(x)
+    ys = np.nan_to_num(np.asarray(y, dtype=np.float64))
+
+    # 첫/끝 포인트는 고정, 나머지를 n_out - 2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        if next_end <= next_start:
+            next_end = next_start + 1
+        avg_x = xs[next_start:next_end].mean()
+        avg_y = ys[next_start:next_end].mean()
+
+        # 이전 선택점 - 후보 - 다음 버킷 평균점이 이루는 삼각형 면적 최대 후보 선택
+        area = np.abs(
+            (xs[prev] - avg_x) * (ys[start:end] - ys[prev])
+            - (xs[prev] - xs[start:end]) * (avg_y - ys[prev])
+        )
+        prev = start + int(area.argmax())
+        selected[i + 1] = prev
+
+    return selected
+
+
+def bin_edges(n, n_out):
+    """n개 포인트를 최대 n_out개 연속 구간으로 나누는 시작 인덱스"""
+    return np.unique(np.linspace(0, n, min(n, n_out), endpoint=False).astype(np.int64))
+
+
+def bin_series(x, y, n_out):
+    """연속 구간 평균으로 시리즈 사전 집계 (막대 차트용, 숫자·날짜 축만, 범주형 축은 그대로 반환)"""
+    y = np.asarray(y, dtype=np.float64)
+    if len(y) <= n_out or not _is_ordered_axis(x):
+        return np.asarray(x), y
+
+    starts = bin_edges(len(y), n_out)
+    valid = ~np.isnan(y)
+    sums = np.add.reduceat(np.where(valid, y, 0.0), starts)
+    valid_counts = np.add.reduceat(valid.astype(np.int64), starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(valid_counts > 0, sums / np.maximum(valid_counts, 1), np.nan)
+    # 구간 대표 x는 구간 시작값
+    return np.asarray(x)[starts], means
+
+
+def _nanmean_reduceat(z, starts, axis):
+    """구간별 결측 제외 평균 (구간 전체가 결측이면 NaN)"""
+    valid = ~np.isnan(z)
+    sums = np.add.reduceat(np.where(valid, z, 0.0), starts, axis=axis)
+    counts = np.add.reduceat(valid.astype(np.int64), starts, axis=axis)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+def bin_heatmap(z, x_labels, y_labels, max_cols, max_rows=MAX_HEATMAP_ROWS):
+    """히트맵 행렬을 블록 평균으로 축소 (결측 칸은 평균에서 제외)"""
+    z = np.asarray(z, dtype=np.float64)
+    if z.ndim != 2:
+        return z, x_labels, y_labels
+
+    if z.shape[1] > max_cols:
+        col_starts = bin_edges(z.shape[1], max_cols)
+        z = _nanmean_reduceat(z, col_starts, axis=1)
+        x_labels = None if x_labels is None else np.asarray(x_labels)[col_starts]
+    if z.shape[0] > max_rows:
+        row_starts = bin_edges(z.shape[0], max_rows)
+        z = _nanmean_reduceat(z, row_starts, axis=0)
+        y_labels = None if y_labels is None else np.asarray(y_labels)[row_starts]
+
+    return z, x_labels, y_labels
+
+
+def _needs_reduction(trace, budget):
+    """트레이스가 포인트 예산을 넘는지 확인"""
+    if trace.type in ('scatter', 'scattergl'):
+        return trace.y is not None and len(trace.y) > budget
+    if trace.type == 'bar':
+        return trace.y is not None and len(trace.y) > budget and (trace.x is None or _is_ordered_axis(trace.x))
+    if trace.type == 'heatmap':
+        return trace.z is not None and np.size(trace.z) > budget * MAX_HEATMAP_ROWS
+    return False
+
+
+def bounded_figure(fig, budget=None):
+    """Figure의 모든 트레이스를 포인트 예산 내로 축소 (원본 Figure는 변경하지 않음)"""
+    budget = budget or point_budget()
+    # 축소할 트레이스가 없으면 복사 비용 없이 그대로 반환
+    if not any(_needs_reduction(trace, budget) for trace in fig.data):
+        return fig
+    fig = go.Figure(fig)
+
+    for trace in fig.data:
+        if trace.type in ('scatter', 'scattergl') and trace.y is not None and len(trace.y) > budget:
+            x = trace.x if trace.x is not None else np.arange(len(trace.y))
+            idx = lttb_indices(x, trace.y, budget)
+            trace.x = np.asarray(x)[idx]
+            trace.y = np.asarray(trace.y)[idx]
+        elif trace.type == 'bar' and _needs_reduction(trace, budget):
+            x = trace.x if trace.x is not None else np.arange(len(trace.y))
+            trace.x, trace.y = bin_series(x, trace.y, budget)
+        elif trace.type == 'heatmap' and trace.z is not None and np.size(trace.z) > budget * MAX_HEATMAP_ROWS:
+            trace.z, trace.x, trace.y = bin_heatmap(trace.z, trace.x, trace.y, max_cols=budget)
+
+    return fig
+
+
+def _update_digest(digest, value):
+    """차트 입력 값(DataFrame/Series/배열/dict/list/스칼라)을 재귀적으로 해시에 반영 (배열은 바이트 단위)"""
+    if isinstance(value, pd.DataFrame):
+        digest.update(b'frame')
+        _update_digest(digest, value.columns)
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            digest.update(f'{key!r}:'.encode())
+            _update_digest(digest, value[key])
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)) and any(isinstance(v, (dict, list, tuple, pd.DataFrame)) for v in value):
+        for item in value:
+            _update_digest(digest, item)
+        digest.update(b']')
+    elif isinstance(value, (pd.Series, pd.Index)):
+        digest.update(f'{type(value).__name__}{value.dtype}{len(value)}'.encode())
+        digest.update(pd.util.hash_pandas_object(value, index=isinstance(value, pd.Series)).to_numpy().tobytes())
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        arr = np.asarray(value)
+        digest.update(f'{arr.dtype}{arr.shape}'.encode())
+        if arr.dtype == object:
+            digest.update(pd.util.hash_array(arr.ravel()).tobytes())
+        else:
+            digest.update(np.ascontiguousarray(arr).tobytes())
+    else:
+        digest.update(repr(value).encode())
+
+
+def data_fingerprint(*values):
+    """차트 입력 데이터(집계 결과 표 등) 식별 해시 (Figure를 만들기 전에 캐시 키로 사용)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update_digest(digest, value)
+        digest.update(b'|')
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """축소된 Figure LRU 캐시 (프로세스 내 세션 간 공유)
+
+    키는 Figure를 만들기 전에 알 수 있는 값(차트 ID, 데이터셋 버전, 입력 데이터 해시 등)이고,
+    캐시에 없을 때만 build()로 Figure를 만들어 축소한 객체를 그대로 저장 (반환된 Figure는 수정하지 말 것)
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build, budget=None):
+        """키에 해당하는 축소 Figure 반환, 없으면 build()로 생성해 포인트 예산으로 축소 후 저장"""
+        budget = budget or point_budget()
+        key = (key, budget)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        fig = bounded_figure(build(), budget)
+
+        with self._lock:
+            self._entries[key] = fig
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return fig
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+
+figure_cache = FigureCache()
+
+
+def cached_figure(chart_id, key, build, budget=None):
+    """포인트 예산이 적용된 캐시 Figure 반환 (key: 차트 입력 식별 튜플, build: 캐시에 없을 때 Figure 생성 함수)"""
+    return figure_cache.get((chart_id, *key), build, budget)
@@ -0,0 +1,141 @@
+"""
+리뷰어 단위 재구매 코호트 엔진
+리뷰를 리뷰어 × 브랜드별로 정렬된 배열 기반 구매 시퀀스로 묶어 첫 구매 월 코호트, 재구매율,
+재구매까지 걸린 기간을 벡터 연산으로 계산
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# 리뷰어 식별 컬럼 후보 (앞에 있을수록 우선)
+REVIEWER_ID_COLUMNS = ['REVIEWER_ID', 'USER_ID', 'MEMBER_ID', '회원ID', '작성자ID', '작성자']
+
+# 첫 리뷰 감성으로 재구매를 비교할 속성
+COHORT_ATTRIBUTES = [
+    ('ABSORPTION_SENTIMENT', '흡수'),
+    ('FINISH_SENTIMENT', '마무리'),
+    ('MOISTURE_SENTIMENT', '보습'),
+    ('SCENT_SENTIMENT', '향'),
+    ('OVERALL_SENTIMENT', '전체')
+]
+
+NS_PER_DAY = 86_400_000_000_000
+
+
+def find_reviewer_column(columns):
+    """데이터에 존재하는 리뷰어 식별 컬럼 반환 (없으면 None)"""
+    for col in REVIEWER_ID_COLUMNS:
+        if col in columns:
+            return col
+    return None
+
+
+class PurchaseSequences:
+    """리뷰어(× 브랜드)별 구매 시퀀스 (시퀀스 → 날짜 순으로 정렬된 행 인덱스 배열)
+
+    products(브랜드명)를 주면 같은 리뷰어라도 브랜드마다 별도 시퀀스로 나눠, 다른 브랜드 리뷰를 재구매로 세지 않음
+    order[starts[i]:starts[i] + lengths[i]]가 i번째 시퀀스의 리뷰 행 위치(시간순)
+    재구매는 첫 리뷰보다 뒤 날짜의 리뷰로 판단 (첫 리뷰와 같은 날 남긴 리뷰는 같은 구매로 봄)
+    """
+
+    def __init__(self, reviewer_ids, dates, products=None):
+        reviewer_ids = pd.Series(reviewer_ids).reset_index(drop=True)
+        dates = pd.to_datetime(pd.Series(dates).reset_index(drop=True), errors='coerce')
+
+        valid = reviewer_ids.notna().to_numpy() & dates.notna().to_numpy()
+        rows = np.flatnonzero(valid)
+        reviewer_codes, reviewers = pd.factorize(reviewer_ids.to_numpy()[rows])
+        codes = reviewer_codes.astype(np.int64)
+        if products is not None:
+            product_codes, product_values = pd.factorize(
+                pd.Series(products).reset_index(drop=True).to_numpy()[rows], use_na_sentinel=False
+            )
+            codes, _ = pd.factorize(codes * len(product_values) + product_codes)
+        date_ns = dates.to_numpy().astype('datetime64[ns]').astype(np.int64)[rows]
+
+        # 시퀀스 코드 → 날짜 순 정렬 (lexsort는 마지막 키가 1차 정렬 기준)
+        sort = np.lexsort((date_ns, codes))
+        self.order = rows[sort]
+        self.codes = codes[sort]
+        self.date_ns = date_ns[sort]
+        self.n_distinct_reviewers = len(reviewers)
+
+        boundary = np.empty(len(self.codes), dtype=bool)
+        if len(boundary):
+            boundary[0] = True
+            boundary[1:] = self.codes[1:] != self.codes[:-1]
+        self.starts = np.flatnonzero(boundary)
+        self.lengths = np.diff(np.append(self.starts, len(self.codes)))
+
+        # 재구매 = 첫 리뷰 날짜보다 뒤 날짜의 리뷰 (같은 날 작성한 리뷰 여러 건은 한 번의 구매로 봄)
+        self.day = np.floor_divide(self.date_ns, NS_PER_DAY)
+        later = np.flatnonzero(self.day > np.repeat(self.day[self.starts], self.lengths))
+        sequence = np.repeat(np.arange(len(self.starts)), self.lengths)
+        repeat_sequences, first_later = np.unique(sequence[later], return_index=True)
+        # 시퀀스별 재구매 리뷰(첫 리뷰 다음 날짜의 첫 리뷰) 정렬 위치 (없으면 -1)
+        self.repeat_positions = np.full(len(self.starts), -1, dtype=np.int64)
+        self.repeat_positions[repeat_sequences] = later[first_later]
+
+    @property
+    def n_reviewers(self):
+        """시퀀스 수 (브랜드별로 나눈 경우 리뷰어 × 브랜드 수)"""
+        return len(self.starts)
+
+    def first_rows(self):
+        """시퀀스별 첫 리뷰 행 위치"""
+        return self.order[self.starts]
+
+    def repurchased(self):
+        """시퀀스별 재구매 여부 (첫 리뷰 날짜 이후 같은 시퀀스의 리뷰가 있는지)"""
+        return self.repeat_positions >= 0
+
+    def days_to_repurchase(self):
+        """시퀀스별 첫 리뷰 날짜 → 다음 날짜 리뷰까지 일수 (재구매 없으면 NaN)"""
+        days = np.full(self.n_reviewers, np.nan)
+        repeat = self.repurchased()
+        days[repeat] = self.day[self.repeat_positions[repeat]] - self.day[self.starts[repeat]]
+        return days
+
+    def cohort_retention(self):
+        """첫 구매 월 코호트 × 경과 개월 수별 재방문 리뷰어 비율(%)"""
+        if self.n_reviewers == 0:
+            return pd.DataFrame()
+
+        month_index = self.date_ns.astype('datetime64[ns]').astype('datetime64[M]').astype(np.int64)
+        first_month = month_index[self.starts]
+        offset = month_index - np.repeat(first_month, self.lengths)
+
+        # 같은 달 리뷰 여러 건은 리뷰어 1명으로 계산
+        active = pd.DataFrame({
+            'reviewer': self.codes,
+            'cohort': np.repeat(first_month, self.lengths),
+            'offset': offset
+        }).drop_duplicates()
+
+        counts = active.groupby(['cohort', 'offset']).size().unstack(fill_value=0)
+        cohort_size = counts[0]
+        retention = (counts.div(cohort_size, axis=0) * 100).round(2)
+        retention.insert(0, '코호트 리뷰어 수', cohort_size)
+        retention.index = pd.PeriodIndex(
+            retention.index.to_numpy().astype('datetime64[M]'), freq='M'
+        ).astype(str)
+        retention.index.name = '첫 구매 월'
+        retention.columns = ['코호트 리뷰어 수'] + [f'+{m}개월' for m in retention.columns[1:]]
+        return retention
+
+    def repurchase_by_first_value(self, values):
+        """첫 리뷰의 값(예: 속성 감성)별 리뷰어 수, 재구매율, 재구매까지 일수 중앙값"""
+        first_values = pd.Series(np.asarray(values)[self.first_rows()])
+        frame = pd.DataFrame({
+            '첫 리뷰 값': first_values,
+            'repurchased': self.repurchased(),
+            'days': self.days_to_repurchase()
+        })
+        grouped = frame.groupby('첫 리뷰 값', dropna=False)
+        return pd.DataFrame({
+            '리뷰어 수': grouped.size(),
+            '재구매 리뷰어 수': grouped['repurchased'].sum(),
+            '재구매율': (grouped['repurchased'].mean() * 100).round(2),
+            '재구매까지 일수(중앙값)': grouped['days'].median().round(1)
+        })
@@ -0,0 +1,192 @@
+"""
+속성 동시발생 분석 모듈
+속성 × 감성, 범주형 속성값, 등록된 요약 키워드를 희소 원-핫 행렬로 인코딩하고
+그룹(월/제품)별 동시발생 수·향상도(lift)·조건부 확률 행렬을 한 번의 희소 행렬 곱으로 계산
+"""
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+
+# 속성 × 감성 피처
+SENTIMENT_FEATURES = [
+    ('OVERALL_SENTIMENT', '전체'),
+    ('ABSORPTION_SENTIMENT', '흡수'),
+    ('FINISH_SENTIMENT', '마무리'),
+    ('MOISTURE_SENTIMENT', '보습'),
+    ('TEXTURE_SENTIMENT', '제형'),
+    ('SCENT_SENTIMENT', '향'),
+    ('IRRITATION_SENTIMENT', '자극'),
+    ('SOOTHING_SENTIMENT', '진정')
+]
+SENTIMENT_LABELS = {'POSITIVE': '긍정', 'NEUTRAL': '중립', 'NEGATIVE': '부정'}
+
+# 값 자체를 피처로 쓰는 범주형 속성
+CATEGORY_FEATURES = [
+    ('TEXTURE_VALUE', '제형값'),
+    ('SKIN_TYPE_FINAL', '피부'),
+    ('PURCHASE_TYPE', '구매')
+]
+
+SUMMARY_COLUMN = 'ONE_LINE_SUMMARY'
+
+# 요약 키워드 레지스트리 {피처 라벨: 정규식}
+SUMMARY_KEYWORDS = {
+    '무난': '무난',
+    '가성비': '가성비'
+}
+
+METRICS = {
+    'lift': '향상도 (lift)',
+    'conditional': '조건부 확률 P(열|행) (%)',
+    'count': '동시 발생 수',
+    'support': '지지도 (%)'
+}
+
+
+def register_keyword(label, pattern):
+    """요약 키워드 피처 등록 (ONE_LINE_SUMMARY 정규식 매칭)"""
+    SUMMARY_KEYWORDS[label] = pattern
+
+
+def feature_columns():
+    """피처 인코딩에 필요한 컬럼"""
+    return [col for col, _ in SENTIMENT_FEATURES] + [col for col, _ in CATEGORY_FEATURES] + [SUMMARY_COLUMN]
+
+
+def build_feature_matrix(df):
+    """리뷰 × 피처 희소 원-핫 행렬(CSR, int32)과 피처 메타데이터 생성
+
+    값이 0/1이므로 정수로 보관 (float32는 2^24건을 넘는 동시발생 수를 정확히 셀 수 없음)
+    """
+    n = len(df)
+    row_blocks, col_blocks, names, sources = [], [], [], []
+
+    def add_block(rows, source, labels, codes):
+        offset = len(names)
+        row_blocks.append(rows)
+        col_blocks.append(codes + offset)
+        names.extend(labels)
+        sources.extend([source] * len(labels))
+
+    for col, name in SENTIMENT_FEATURES:
+        if col not in df.columns:
+            continue
+        values = df[col].to_numpy()
+        labels = list(SENTIMENT_LABELS.keys())
+        codes = pd.Categorical(values, categories=labels).codes
+        rows = np.flatnonzero(codes >= 0)
+        add_block(rows, name, [f'{name} {SENTIMENT_LABELS[v]}' for v in labels], codes[rows].astype(np.int64))
+
+    for col, name in CATEGORY_FEATURES:
+        if col not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[col], sort=True)
+        rows = np.flatnonzero(codes >= 0)
+        add_block(rows, name, [f'{name}:{v}' for v in uniques], codes[rows].astype(np.int64))
+
+    if SUMMARY_COLUMN in df.columns:
+        summary = df[SUMMARY_COLUMN]
+        for label, pattern in SUMMARY_KEYWORDS.items():
+            rows = np.flatnonzero(summary.str.contains(pattern, na=False, regex=True).to_numpy())
+            add_block(rows, f'키워드:{label}', [f'키워드:{label}'], np.zeros(len(rows), dtype=np.int64))
+
+    rows = np.concatenate(row_blocks) if row_blocks else np.array([], dtype=np.int64)
+    cols = np.concatenate(col_blocks) if col_blocks else np.array([], dtype=np.int64)
+    matrix = sp.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(n, len(names))
+    )
+    return matrix, names, sources
+
+
+class CooccurrenceMatrix:
+    """그룹별 피처 동시발생 행렬 (그룹 g의 k × k 블록을 희소 행렬 하나로 보관)"""
+
+    def __init__(self, df, group_by=None):
+        self.matrix, self.features, self.sources = build_feature_matrix(df)
+        n, k = self.matrix.shape
+        self.k = k
+
+        if group_by:
+            # 그룹 키가 비어 있는 행(날짜 없음 등)은 제외
+            keys = df[list(group_by)]
+            valid = keys.notna().all(axis=1).to_numpy()
+            group_codes = np.full(n, -1, dtype=np.int64)
+            codes, group_index = pd.MultiIndex.from_frame(keys[valid]).factorize(sort=True)
+            group_codes[valid] = codes
+            self.groups = [tuple(g) for g in group_index]
+        else:
+            group_codes = np.zeros(n, dtype=np.int64)
+            valid = np.ones(n, dtype=bool)
+            self.groups = [('전체',)]
+        self.group_by = group_by
+
+        # 행 i를 (그룹 g) 블록 열로 옮긴 Z (n × G·k) 를 만든 뒤 Zᵀ·X 한 번으로 전 그룹 동시발생 계산
+        # 곱셈 결과(동시발생 수)는 int32 범위를 넘을 수 있어 int64로 누적
+        X = self.matrix[np.flatnonzero(valid)].astype(np.int64)
+        codes = np.asarray(group_codes)[valid].astype(np.int64)
+        row_groups = np.repeat(codes, np.diff(X.indptr))
+        Z = sp.csr_matrix((X.data, X.indices + row_groups * k, X.indptr), shape=(X.shape[0], len(self.groups) * k))
+        self.counts = (Z.T @ X).tocsr()
+        self.total_counts = (X.T @ X).tocsr()
+        self.group_sizes = np.bincount(codes, minlength=len(self.groups))
+
+    def _group_position(self, group):
+        key = group if isinstance(group, tuple) else (group,)
+        return self.groups.index(key)
+
+    def count_matrix(self, group=None):
+        """그룹(미지정 시 전체)의 k × k 동시발생 수와 리뷰 수"""
+        if group is None:
+            block = self.total_counts
+            n = int(self.group_sizes.sum())
+        else:
+            position = self._group_position(group)
+            block = self.counts[position * self.k:(position + 1) * self.k]
+            n = int(self.group_sizes[position])
+        return np.asarray(block.todense(), dtype=np.float64), n
+
+    def metric_frame(self, metric='lift', group=None):
+        """지표 행렬 DataFrame (행/열 = 피처)"""
+        counts, n = self.count_matrix(group)
+        diag = np.diag(counts)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if metric == 'count':
+                values = counts
+            elif metric == 'support':
+                values = counts / n * 100 if n else np.zeros_like(counts)
+            elif metric == 'conditional':
+                values = counts / diag[:, None] * 100
+            elif metric == 'lift':
+                values = counts * n / np.outer(diag, diag)
+            else:
+                raise ValueError(f"알 수 없는 지표: {metric}")
+
+        values = np.where(np.isfinite(values), values, np.nan)
+        return pd.DataFrame(values, index=self.features, columns=self.features).round(3)
+
+    def top_pairs(self, group=None, min_count=30, limit=30):
+        """서로 다른 속성 간 향상도 상위 피처 쌍"""
+        counts, n = self.count_matrix(group)
+        diag = np.diag(counts)
+        sources = np.asarray(self.sources)
+
+        a, b = np.triu_indices(self.k, k=1)
+        keep = (sources[a] != sources[b]) & (counts[a, b] >= min_count)
+        a, b = a[keep], b[keep]
+        if len(a) == 0 or n == 0:
+            return pd.DataFrame(columns=['피처 A', '피처 B', '동시 발생 수', '향상도', 'P(B|A) (%)', 'P(A|B) (%)'])
+
+        pair_counts = counts[a, b]
+        result = pd.DataFrame({
+            '피처 A': np.asarray(self.features)[a],
+            '피처 B': np.asarray(self.features)[b],
+            '동시 발생 수': pair_counts.astype(np.int64),
+            '향상도': (pair_counts * n / (diag[a] * diag[b])).round(3),
+            'P(B|A) (%)': (pair_counts / diag[a] * 100).round(2),
+            'P(A|B) (%)': (pair_counts / diag[b] * 100).round(2)
+        })
+        return result.sort_values('향상도', ascending=False).head(limit).reset_index(drop=True)
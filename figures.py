@@ -0,0 +1,380 @@
+"""
+대시보드/리포트 공용 차트 생성 모듈
+분석 결과 DataFrame을 Plotly Figure로 변환 (app.py 화면과 report.py 정적 리포트가 같은 차트를 사용)
+"""
+
+import plotly.graph_objects as go
+import plotly.express as px
+
+
+SENTIMENT_COLORS = {'POSITIVE': '#2ECC71', 'NEUTRAL': '#F39C12', 'NEGATIVE': '#E74C3C'}
+
+# 인사이트 메서드별 화면 라벨 (IDEA_METHODS 순서)
+IDEA_LABELS = {
+    'idea1_absorption_repurchase': "IDEA 1: 흡수력과 재구매의 관계",
+    'idea2_texture_seasonality': "IDEA 2: 점성 제형과 계절의 관계",
+    'idea3_moisture_summer_dissatisfaction': "IDEA 3: 보습 만족과 여름철 불만",
+    'idea4_freshness_moisture_conflict': "IDEA 4: 산뜻함 선호와 보습 불만의 동시 발생",
+    'idea5_scent_seasonality': "IDEA 5: 향의 계절 무관성과 특정 월 이슈",
+    'idea6_neutral_new_purchase': "IDEA 6: 무난함과 신규 유입의 관계",
+    'idea7_oily_skin_finish_sensitivity': "IDEA 7: 지성 피부와 여름 마무리감 민감성",
+    'idea8_irritation_spike': "IDEA 8: 자극 이슈의 월별 Spike",
+    'idea9_value_for_money_buffering': "IDEA 9: 가성비 평가와 불만 완충",
+    'idea10_repurchase_seasonal_resilience': "IDEA 10: 재구매 리뷰의 계절 영향 적음"
+}
+
+
+# ===== 대시보드 개요 =====
+def monthly_sentiment_figure(df, scale=1.0):
+    """월별 감정 분포 누적 막대 (scale: 표본 건수 확대 배율, 근사 모드에서 사용)"""
+    monthly_sentiment = df.groupby('MONTH')['OVERALL_SENTIMENT'].value_counts().unstack(fill_value=0)
+    if scale != 1.0:
+        monthly_sentiment = (monthly_sentiment * scale).round()
+    return monthly_sentiment_counts_figure(monthly_sentiment)
+
+
+def monthly_sentiment_counts_figure(monthly_sentiment):
+    """월 × 감정 건수 테이블(행=월, 열=감정)로 누적 막대 생성 (리포트의 사전 집계 경로에서 사용)"""
+    fig = go.Figure()
+    for col in monthly_sentiment.columns:
+        fig.add_trace(go.Bar(
+            x=monthly_sentiment.index,
+            y=monthly_sentiment[col],
+            name=col,
+            marker_color=SENTIMENT_COLORS.get(col, '#95A5A6')
+        ))
+
+    fig.update_layout(
+        title="월별 감정 분포",
+        xaxis_title="월",
+        yaxis_title="리뷰 수",
+        barmode='stack',
+        height=400,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def positive_ratio_figure(df, bounds=None):
+    """월별 긍정 리뷰 비율 추이 (bounds: 월별 오차 범위 ±%p, 근사 모드에서 오차 막대로 표시)"""
+    positive_ratio = df.groupby('MONTH')['OVERALL_SENTIMENT'].apply(
+        lambda x: (x == 'POSITIVE').sum() / len(x) * 100
+    )
+    return positive_ratio_series_figure(positive_ratio, bounds)
+
+
+def positive_ratio_series_figure(positive_ratio, bounds=None):
+    """월별 긍정 비율(%) Series로 추이 차트 생성 (리포트의 사전 집계 경로에서 사용)"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=positive_ratio.index,
+        y=positive_ratio.values,
+        mode='lines+markers',
+        name='긍정 비율',
+        line=dict(color='#2ECC71', width=3),
+        marker=dict(size=10),
+        error_y=None if bounds is None else dict(
+            type='data', array=bounds.reindex(positive_ratio.index).to_numpy(), visible=True
+        )
+    ))
+
+    fig.update_layout(
+        title="월별 긍정 리뷰 비율 추이",
+        xaxis_title="월",
+        yaxis_title="긍정 비율 (%)",
+        height=400,
+        hovermode='x'
+    )
+    return fig
+
+
+# ===== 10가지 인사이트 =====
+def _bar_figure(result, column, name, color, title, yaxis_title="비율 (%)"):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=result.index,
+        y=result[column],
+        name=name,
+        marker_color=color
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title="월",
+        yaxis_title=yaxis_title,
+        height=400
+    )
+    return fig
+
+
+def _line_figure(result, column, name, color, title, yaxis_title="비율 (%)"):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=result.index,
+        y=result[column],
+        mode='lines+markers',
+        name=name,
+        line=dict(color=color, width=3),
+        marker=dict(size=10)
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title="월",
+        yaxis_title=yaxis_title,
+        height=400
+    )
+    return fig
+
+
+def idea1_figure(result):
+    return _bar_figure(result, '흡수 긍정 비율', '흡수 긍정 비율', '#3498DB', "월별 재구매 리뷰의 흡수 긍정 비율")
+
+
+def idea2_figure(result):
+    fig = _line_figure(result, '긍정 비율', '긍정 비율', '#E67E22', "점성 제형의 월별 긍정 비율", "긍정 비율 (%)")
+    fig.add_hline(y=50, line_dash="dash", line_color="gray", annotation_text="50%")
+    return fig
+
+
+def idea3_figure(result):
+    return _bar_figure(result, '비율', '불만 비율', '#E74C3C', "월별 보습/전체 부정 리뷰 비율")
+
+
+def idea4_figure(result):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=result.index,
+        y=result['산뜻+보습불만 동시'],
+        name='산뜻+보습불만 동시',
+        marker_color='#9B59B6'
+    ))
+    fig.add_trace(go.Scatter(
+        x=result.index,
+        y=result['산뜻긍정'],
+        name='산뜻긍정',
+        mode='lines+markers',
+        yaxis='y2'
+    ))
+    fig.update_layout(
+        title="산뜻함과 보습 불만의 관계",
+        xaxis_title="월",
+        yaxis_title="동시 발생 수",
+        yaxis2=dict(title="산뜻긍정 수", overlaying='y', side='right'),
+        height=400,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def idea5_figure(result):
+    return _bar_figure(result, '비율', '향 부정 비율', '#1ABC9C', "월별 향 부정 리뷰 비율")
+
+
+def idea6_figure(result):
+    return _bar_figure(result, '신규대비비율', '신규 대비 무난 비율', '#F39C12', "월별 신규 구매 리뷰의 '무난' 표현 비율")
+
+
+def idea7_figure(result):
+    return _line_figure(result, '비율', '지성+마무리부정 비율', '#E74C3C', "지성 피부의 월별 마무리감 불만 비율")
+
+
+def idea8_figure(result):
+    return _bar_figure(result, '비율', '자극 이슈 비율', '#E74C3C', "월별 자극 이슈 리뷰 비율")
+
+
+def idea9_figure(result):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=result.index,
+        y=(result['가성비 긍정'] / (result['가성비 긍정'] + result['가성비 부정'] + 1) * 100),
+        mode='lines+markers',
+        name='가성비 언급 긍정 비율',
+        line=dict(color='#2ECC71', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=result.index,
+        y=(result['전체 긍정'] / (result['전체 긍정'] + result['전체 부정'] + 1) * 100),
+        mode='lines+markers',
+        name='전체 긍정 비율',
+        line=dict(color='#95A5A6', width=2, dash='dash')
+    ))
+    fig.update_layout(
+        title="가성비 언급 여부에 따른 긍정 비율 비교",
+        xaxis_title="월",
+        yaxis_title="긍정 비율 (%)",
+        height=400
+    )
+    return fig
+
+
+def idea10_figure(result):
+    """result: idea10_repurchase_seasonal_resilience()의 (표준편차 표, 재구매 월별, 전체 월별)"""
+    _, repurchase_monthly, overall_monthly = result
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=repurchase_monthly.index,
+        y=repurchase_monthly['OVERALL_SENTIMENT'],
+        mode='lines+markers',
+        name='재구매 긍정 비율',
+        line=dict(color='#2ECC71', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=overall_monthly.index,
+        y=overall_monthly['OVERALL_SENTIMENT'],
+        mode='lines+markers',
+        name='전체 긍정 비율',
+        line=dict(color='#95A5A6', width=2, dash='dash')
+    ))
+    fig.update_layout(
+        title="재구매 vs 전체 리뷰의 월별 긍정 비율 안정성",
+        xaxis_title="월",
+        yaxis_title="긍정 비율 (%)",
+        height=400
+    )
+    return fig
+
+
+# 인사이트 메서드 → Figure 생성 함수
+IDEA_FIGURES = {
+    'idea1_absorption_repurchase': idea1_figure,
+    'idea2_texture_seasonality': idea2_figure,
+    'idea3_moisture_summer_dissatisfaction': idea3_figure,
+    'idea4_freshness_moisture_conflict': idea4_figure,
+    'idea5_scent_seasonality': idea5_figure,
+    'idea6_neutral_new_purchase': idea6_figure,
+    'idea7_oily_skin_finish_sensitivity': idea7_figure,
+    'idea8_irritation_spike': idea8_figure,
+    'idea9_value_for_money_buffering': idea9_figure,
+    'idea10_repurchase_seasonal_resilience': idea10_figure
+}
+
+
+# ===== 월별 속성 분석 =====
+def attribute_heatmap_figure(monthly_attribute):
+    """월별 × 속성별 긍정 비율 히트맵"""
+    fig = px.imshow(
+        monthly_attribute.T,
+        labels=dict(x="월", y="속성", color="긍정 비율 (%)"),
+        x=monthly_attribute.index,
+        y=monthly_attribute.columns,
+        color_continuous_scale="RdYlGn",
+        aspect="auto",
+        height=400
+    )
+    fig.update_layout(title="월별 × 속성별 긍정 비율 히트맵")
+    return fig
+
+
+def attribute_trend_figure(monthly_attribute, attributes):
+    """선택 속성의 월간 긍정 비율 추이"""
+    fig = go.Figure()
+    for attr in attributes:
+        fig.add_trace(go.Scatter(
+            x=monthly_attribute.index,
+            y=monthly_attribute[attr],
+            mode='lines+markers',
+            name=attr,
+            marker=dict(size=8)
+        ))
+
+    fig.update_layout(
+        title="속성별 월간 긍정 비율 추이",
+        xaxis_title="월",
+        yaxis_title="긍정 비율 (%)",
+        height=400,
+        hovermode='x unified'
+    )
+    return fig
+
+
+# ===== 지표 변화 추이 =====
+def metric_drift_figure(drift, title="데이터셋 버전별 지표 변화"):
+    """월 × 버전 지표 표 → 버전별 라인 (월 구분 없는 지표는 버전별 막대)"""
+    fig = go.Figure()
+    if list(drift.index) == [0]:
+        fig.add_trace(go.Bar(x=list(drift.columns), y=drift.iloc[0].values, marker_color='#3498DB'))
+        fig.update_layout(title=title, xaxis_title="버전", yaxis_title="값", height=400)
+        return fig
+
+    for version in drift.columns:
+        fig.add_trace(go.Scatter(
+            x=drift.index,
+            y=drift[version],
+            mode='lines+markers',
+            name=str(version),
+            marker=dict(size=8)
+        ))
+    fig.update_layout(
+        title=title,
+        xaxis_title="월",
+        yaxis_title="값",
+        height=400,
+        hovermode='x unified'
+    )
+    return fig
+
+
+def cohort_repurchase_figure(attribute_table, attribute):
+    """첫 리뷰 감성별 재구매율 막대"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=attribute_table.index.astype(str),
+        y=attribute_table['재구매율'],
+        name='재구매율',
+        marker_color=[SENTIMENT_COLORS.get(v, '#95A5A6') for v in attribute_table.index]
+    ))
+    fig.update_layout(
+        title=f"첫 리뷰 {attribute} 감성별 재구매율",
+        xaxis_title="첫 리뷰 감성",
+        yaxis_title="재구매율 (%)",
+        height=400
+    )
+    return fig
+
+
+def cohort_retention_figure(retention_rates):
+    """첫 구매 월 코호트 × 경과 개월 재방문 비율 히트맵"""
+    fig = px.imshow(
+        retention_rates,
+        labels=dict(x="경과 개월", y="첫 구매 월", color="재방문 비율 (%)"),
+        x=retention_rates.columns,
+        y=retention_rates.index,
+        color_continuous_scale="Blues",
+        aspect="auto",
+        height=500
+    )
+    fig.update_layout(title="코호트 재방문 히트맵")
+    return fig
+
+
+def cooccurrence_figure(matrix, metric, metric_name, title):
+    """피처 × 피처 동시발생 지표 히트맵 (향상도는 1을 중심으로 발산형 색상)"""
+    fig = px.imshow(
+        matrix,
+        labels=dict(x="열 피처", y="행 피처", color=metric_name),
+        x=matrix.columns,
+        y=matrix.index,
+        color_continuous_scale="RdBu_r" if metric == 'lift' else "Blues",
+        color_continuous_midpoint=1.0 if metric == 'lift' else None,
+        aspect="auto",
+        height=800
+    )
+    fig.update_layout(title=title)
+    return fig
+
+
+def trending_terms_figure(month_trend, month):
+    """월별 급상승 표현 막대"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=month_trend['단어'],
+        y=month_trend['전월 대비(%p)'],
+        name='전월 대비 증가',
+        marker_color='#E74C3C'
+    ))
+    fig.update_layout(
+        title=f"{int(month)}월 급상승 표현",
+        xaxis_title="표현",
+        yaxis_title="언급 비율 증가 (%p)",
+        height=400
+    )
+    return fig
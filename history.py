@@ -0,0 +1,262 @@
+"""
+인사이트 지표 이력 저장소
+데이터셋 버전마다 모든 제품의 인사이트 결과를 (버전, 제품, 지표, 월, 값) 행으로 펼쳐 추가 전용 Parquet 파일로 기록하고
+이전 버전을 다시 계산하지 않고 지표의 버전 간 변화를 조회
+
+    python history.py --category 토너          # 현재 데이터셋 버전 기록
+    python history.py --category 토너 --list   # 기록된 버전 목록
+"""
+
+import os
+import glob
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from analysis import ReviewInsightAnalysis, IDEA_METHODS, columns_for
+from catalog import dashboard_catalog, dataset_version
+from figures import IDEA_LABELS
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_HISTORY_DIR = os.path.join(BASE_DIR, 'history')
+
+# 기록 대상 메서드 (인사이트 + 월별 속성 테이블 + 요약)
+HISTORY_METHODS = IDEA_METHODS + ['get_monthly_attribute_sentiment_table', 'get_summary']
+
+# 월 구분이 없는 지표(요약, 표준편차 등)의 month 값
+ALL_MONTHS = 0
+
+# IDEA 10 결과 튜플의 부분 이름
+IDEA10_PARTS = ['std', 'repurchase', 'overall']
+
+HISTORY_SCHEMA = pa.schema([
+    ('dataset_version', pa.string()),
+    ('recorded_at', pa.timestamp('s')),
+    ('data_end', pa.string()),
+    ('product', pa.string()),
+    ('metric', pa.string()),
+    ('month', pa.int16()),
+    ('value', pa.float64()),
+    # 계산 실패 지표는 값 없이 오류 메시지를 기록 (정상 지표는 null)
+    ('error', pa.string()),
+])
+
+
+def _frame_rows(metric_prefix, frame):
+    """월 인덱스 결과 표 → (지표, 월, 값) 행"""
+    months = pd.to_numeric(pd.Series(frame.index), errors='coerce').fillna(ALL_MONTHS).astype(np.int16).to_numpy()
+    return pd.DataFrame({
+        'metric': np.repeat([f'{metric_prefix}.{col}' for col in frame.columns], len(frame)),
+        'month': np.tile(months, len(frame.columns)),
+        'value': frame.to_numpy(dtype=np.float64, na_value=np.nan).T.reshape(-1),
+    })
+
+
+def _summary_rows(summary):
+    """get_summary 결과 → 월 구분 없는 지표 행 (비율 문자열은 숫자로)"""
+    rows = []
+    for key in ('total_reviews', 'positive_ratio', 'neutral_ratio', 'negative_ratio'):
+        value = summary.get(key)
+        if isinstance(value, str):
+            value = float(value.rstrip('%'))
+        rows.append({'metric': f'summary.{key}', 'month': ALL_MONTHS, 'value': float(value)})
+    return pd.DataFrame(rows)
+
+
+def product_metrics(category, product, df):
+    """제품 1개의 모든 기록 대상 지표 행 (계산에 실패한 메서드는 error 컬럼에 오류를 남긴 행 1개로 기록)"""
+    analysis = ReviewInsightAnalysis.from_frame(df, category=category, product=product)
+    frames = []
+    for method in HISTORY_METHODS:
+        try:
+            result = getattr(analysis, method)()
+        except Exception as e:
+            frames.append(pd.DataFrame({
+                'metric': [method], 'month': [ALL_MONTHS], 'value': [np.nan], 'error': [f'{type(e).__name__}: {e}']
+            }))
+            continue
+        if method == 'get_summary':
+            frames.append(_summary_rows(result))
+        elif isinstance(result, tuple):
+            for part, frame in zip(IDEA10_PARTS, result):
+                frames.append(_frame_rows(f'{method}.{part}', frame))
+        else:
+            frames.append(_frame_rows(method, result))
+    rows = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=['metric', 'month', 'value'])
+    if 'error' not in rows.columns:
+        rows['error'] = None
+    rows.insert(0, 'product', product)
+    return rows
+
+
+def metric_label(metric):
+    """지표 키 → 화면 라벨"""
+    method, _, column = metric.partition('.')
+    if method == 'summary':
+        return f"요약 · {column}"
+    if method == 'get_monthly_attribute_sentiment_table':
+        return f"월별 속성 긍정 비율 · {column}"
+    return f"{IDEA_LABELS.get(method, method).split(':')[0]} · {column}"
+
+
+class MetricHistory:
+    """카테고리별 지표 이력 (카테고리 디렉터리 아래 데이터셋 버전당 Parquet 파일 1개, 기존 파일은 수정하지 않음)"""
+
+    def __init__(self, root=DEFAULT_HISTORY_DIR):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def _path(self, category, version):
+        return os.path.join(self.root, category, f'{version}.parquet')
+
+    def has_version(self, category, version):
+        return os.path.exists(self._path(category, version))
+
+    def record(self, analysis, version, products=None, repair=False):
+        """현재 데이터셋 버전의 전체/제품별 지표를 기록하고 기록 행 수 반환 (이미 기록된 버전은 0)
+
+        repair=True이면 계산 실패 지표가 남아 있는 기존 버전 파일에 한해 다시 계산해 통째로 교체
+        """
+        path = self._path(analysis.category, version)
+        if os.path.exists(path) and not (repair and len(self.failures(analysis.category, version))):
+            return 0
+
+        columns = list(dict.fromkeys(columns_for(*HISTORY_METHODS)))
+        full = analysis.full_frame(columns)
+        data_end = ''
+        if '리뷰등록일' in full.columns and full['리뷰등록일'].notna().any():
+            data_end = str(full['리뷰등록일'].max().date())
+
+        frames = [product_metrics(analysis.category, "전체", full)]
+        frames.extend(
+            product_metrics(analysis.category, product, df)
+            for product, df in analysis.product_views(columns, products)
+        )
+        rows = pd.concat(frames, ignore_index=True)
+        # 제품·지표·월 순으로 정렬해 Parquet 통계로 필터 조회 시 행 그룹을 건너뛸 수 있게 함
+        rows = rows.sort_values(['product', 'metric', 'month'], kind='stable')
+        rows.insert(0, 'data_end', data_end)
+        rows.insert(0, 'recorded_at', pd.Timestamp(datetime.now()).floor('s'))
+        rows.insert(0, 'dataset_version', version)
+
+        table = pa.Table.from_pandas(rows, schema=HISTORY_SCHEMA, preserve_index=False)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.tmp-{os.getpid()}-{threading.get_ident()}'
+        pq.write_table(table, tmp_path, row_group_size=4096)
+        os.replace(tmp_path, path)
+        return len(rows)
+
+    def record_async(self, analysis, version, products=None):
+        """백그라운드 스레드에서 기록 (같은 카테고리·버전은 한 번만 제출)"""
+        key = (analysis.category, version)
+        with self._lock:
+            if key in self._pending or self.has_version(*key):
+                return None
+            self._pending.add(key)
+
+        def run():
+            try:
+                return self.record(analysis, version, products)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+        return self.executor.submit(run)
+
+    def _dataset(self, category):
+        files = sorted(glob.glob(os.path.join(self.root, category, '*.parquet')))
+        return ds.dataset(files, schema=HISTORY_SCHEMA, format='parquet') if files else None
+
+    def versions(self, category):
+        """기록된 버전 목록 (기록 시각 순)"""
+        dataset = self._dataset(category)
+        if dataset is None:
+            return pd.DataFrame(columns=['dataset_version', 'recorded_at', 'data_end'])
+        table = dataset.to_table(columns=['dataset_version', 'recorded_at', 'data_end'])
+        return (
+            table.group_by(['dataset_version', 'recorded_at', 'data_end']).aggregate([]).to_pandas()
+            .sort_values('recorded_at').reset_index(drop=True)
+        )
+
+    def metrics(self, category, product="전체"):
+        """기록된 지표 키 목록 (계산 실패 행 제외)"""
+        dataset = self._dataset(category)
+        if dataset is None:
+            return []
+        predicate = (ds.field('product') == product) & ds.field('error').is_null()
+        table = dataset.to_table(columns=['metric'], filter=predicate)
+        return sorted(pd.unique(table.column('metric').to_numpy(zero_copy_only=False)))
+
+    def failures(self, category, version=None):
+        """계산에 실패해 값 없이 기록된 지표 행 (version 미지정 시 전체 버전)"""
+        dataset = self._dataset(category)
+        columns = ['dataset_version', 'recorded_at', 'product', 'metric', 'error']
+        if dataset is None:
+            return pd.DataFrame(columns=columns)
+        predicate = ds.field('error').is_valid()
+        if version is not None:
+            predicate = predicate & (ds.field('dataset_version') == version)
+        return dataset.to_table(columns=columns, filter=predicate).to_pandas()
+
+    def query(self, category, metric, product="전체"):
+        """지표 하나의 버전별 이력 행 (계산 실패 행 제외)"""
+        dataset = self._dataset(category)
+        if dataset is None:
+            return pd.DataFrame(columns=HISTORY_SCHEMA.names)
+        predicate = (ds.field('product') == product) & (ds.field('metric') == metric) & ds.field('error').is_null()
+        return dataset.to_table(filter=predicate).to_pandas().sort_values(['recorded_at', 'month'])
+
+    def drift(self, category, metric, product="전체"):
+        """월 × 버전 지표 값 표 (열은 기록 시각 순)"""
+        rows = self.query(category, metric, product)
+        if len(rows) == 0:
+            return pd.DataFrame()
+        order = rows.drop_duplicates('dataset_version')
+        labels = {
+            version: f"{recorded:%Y-%m-%d %H:%M} ({version[:6]})"
+            for version, recorded in zip(order['dataset_version'], order['recorded_at'])
+        }
+        table = rows.pivot_table(index='month', columns='dataset_version', values='value', aggfunc='last')
+        table = table[order['dataset_version']].rename(columns=labels)
+        table.columns.name = '버전'
+        table.index.name = '월'
+        return table
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='카테고리 인사이트 지표를 현재 데이터셋 버전으로 이력에 기록')
+    parser.add_argument('--category', default='토너', help='카테고리명')
+    parser.add_argument('--data-dir', default=os.path.join(BASE_DIR, 'data'))
+    parser.add_argument('--history-dir', default=DEFAULT_HISTORY_DIR)
+    parser.add_argument('--list', action='store_true', help='기록된 버전 목록과 계산 실패 지표 출력')
+    parser.add_argument('--repair', action='store_true', help='현재 버전에 계산 실패 지표가 있으면 다시 계산해 교체')
+    args = parser.parse_args()
+
+    history = MetricHistory(args.history_dir)
+    if args.list:
+        print(history.versions(args.category).to_string(index=False))
+        failures = history.failures(args.category)
+        if len(failures):
+            print(f"\n계산 실패 지표 {len(failures)}개:")
+            print(failures.to_string(index=False))
+    else:
+        # 대시보드와 같은 로드 경로(감성 재채점·공유 저장소)로 계산해야 같은 버전 키의 기록이 화면 수치와 일치
+        # (기록은 아래에서 --history-dir에 직접 하므로 카탈로그의 백그라운드 기록은 끔)
+        catalog = dashboard_catalog(BASE_DIR, data_dir=args.data_dir, record_history=False)
+        if args.category not in catalog.categories():
+            parser.error(f'알 수 없는 카테고리: {args.category} (사용 가능: {", ".join(catalog.categories())})')
+        version = dataset_version(catalog.datasets[args.category])
+        count = history.record(catalog.get(args.category), version, repair=args.repair)
+        print(f"기록 완료: {args.category} 버전 {version} ({count:,}행)" if count else f"이미 기록된 버전: {version}")
+        failures = history.failures(args.category, version)
+        if len(failures):
+            print(f"계산 실패 지표 {len(failures)}개 (--list로 확인, 원인 수정 후 --repair로 다시 기록)")
@@ -0,0 +1,270 @@
+"""
+대시보드 동시 사용자 부하 테스트
+스크립트화된 분석가 세션(제품 전환 → 10가지 인사이트 순회 → 상세 데이터 필터 → CSV 다운로드)을
+동시 실행 수별로 돌려 처리량, 지연 시간 백분위, 세션당 메모리를 보고 (로컬 전용)
+두 대상 모두 한 프로세스의 스레드로 동시 세션을 실행해 앱과 같은 공유 카탈로그 하나에 부하를 줌
+
+    python loadtest.py --concurrency 1,4,8 --sessions 16
+    python loadtest.py --target app --concurrency 2 --sessions 4
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from analysis import IDEA_METHODS, DETAIL_DISPLAY_COLUMNS, columns_for, page_columns
+from catalog import dashboard_catalog
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PERCENTILES = (50, 95, 99)
+DETAIL_PAGE = '📑 상세 데이터'
+INSIGHT_PAGE = '🔍 10가지 인사이트'
+
+
+def current_rss_mb():
+    """현재 프로세스 상주 메모리(MB) (/proc 미지원 환경은 최대 상주 메모리로 대체)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        return float('nan')
+
+
+class MemorySampler:
+    """백그라운드에서 주기적으로 RSS를 측정해 최댓값 기록"""
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak = current_rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss_mb())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss_mb())
+
+
+class StepTimer:
+    """세션 단계별 지연 시간 기록 (스레드 간 공유)"""
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def time(self, step, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.records.append((step, elapsed))
+        return result
+
+
+# ===== 세션 시나리오 =====
+def filter_detail(df, rng):
+    """상세 데이터 페이지와 같은 방식으로 월/감정/피부 타입 무작위 필터"""
+    filtered = df
+    if 'MONTH' in df.columns:
+        months = sorted(df['MONTH'].dropna().unique().astype(int))
+        if months:
+            filtered = filtered[filtered['MONTH'].isin(rng.sample(months, rng.randint(1, len(months))))]
+    if 'OVERALL_SENTIMENT' in df.columns:
+        sentiments = df['OVERALL_SENTIMENT'].dropna().unique().tolist()
+        if sentiments:
+            filtered = filtered[filtered['OVERALL_SENTIMENT'].isin(rng.sample(sentiments, rng.randint(1, len(sentiments))))]
+    if 'SKIN_TYPE_FINAL' in df.columns:
+        skins = df['SKIN_TYPE_FINAL'].dropna().unique().tolist()[:10]
+        if skins:
+            filtered = filtered[filtered['SKIN_TYPE_FINAL'].isin(rng.sample(skins, min(3, len(skins))))]
+    return filtered
+
+
+def download_csv(filtered):
+    """필터 결과 CSV 직렬화 (다운로드 버튼과 같은 인코딩)"""
+    columns = [col for col in DETAIL_DISPLAY_COLUMNS if col in filtered.columns]
+    return filtered[columns].to_csv(index=False, encoding='utf-8-sig')
+
+
+def analysis_session(catalog, category, timer, rng, product_switches=2):
+    """분석 계층 직접 호출 세션 (app.py 재실행과 같은 순서: 공유 카테고리 객체 → 제품별 독립 뷰)"""
+    base = timer.time('load_category', catalog.get, category)
+    products = ['전체'] + base.get_products()
+
+    for _ in range(product_switches):
+        # 앱은 재실행마다 catalog.get(...).for_product(...)로 뷰를 만들고 공유 객체는 변경하지 않음
+        analysis = timer.time('switch_product', lambda: catalog.get(category).for_product(rng.choice(products)))
+
+        timer.time('overview', lambda: (analysis.ensure_columns(page_columns('overview')), analysis.get_summary()))
+        for method in IDEA_METHODS:
+            timer.time(method, lambda m=method: (analysis.ensure_columns(columns_for(m)), getattr(analysis, m)()))
+
+        analysis.ensure_columns(page_columns('detail'))
+        filtered = timer.time('detail_filter', filter_detail, analysis.df, rng)
+        timer.time('csv_download', download_csv, filtered)
+
+
+def app_session(app_path, category, timer, rng, product_switches=2):
+    """Streamlit AppTest로 app.py 스크립트를 실제 위젯 조작으로 재실행하는 세션
+
+    같은 프로세스의 AppTest 세션들은 st.cache_resource를 공유하므로 스레드로 동시에 실행하면
+    실제 서버처럼 하나의 앱 인스턴스(카탈로그·근사 엔진)에 여러 세션이 동시에 접근
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = timer.time('load_category', lambda: AppTest.from_file(app_path, default_timeout=600).run())
+    if category in at.sidebar.selectbox[0].options:
+        at = timer.time('load_category', lambda: at.sidebar.selectbox[0].set_value(category).run())
+
+    for _ in range(product_switches):
+        product = rng.choice(at.sidebar.selectbox[1].options)
+        timer.time('switch_product', lambda: at.sidebar.selectbox[1].set_value(product).run())
+
+        timer.time('overview', lambda: at.sidebar.radio[0].set_value(at.sidebar.radio[0].options[0]).run())
+        timer.time('insights_page', lambda: at.sidebar.radio[0].set_value(INSIGHT_PAGE).run())
+        selector = [s for s in at.main.selectbox if '인사이트' in (s.label or '')][0]
+        for number, option in enumerate(selector.options):
+            timer.time(IDEA_METHODS[number], lambda o=option: selector.set_value(o).run())
+
+        timer.time('detail_filter', lambda: at.sidebar.radio[0].set_value(DETAIL_PAGE).run())
+        month_select = [m for m in at.multiselect if m.label == '월 선택']
+        if month_select and month_select[0].options:
+            options = month_select[0].options
+            months = rng.sample(options, rng.randint(1, len(options)))
+            # 필터 변경 시 표 렌더링과 CSV 직렬화(다운로드 버튼 데이터)가 함께 재실행됨
+            timer.time('csv_download', lambda: month_select[0].set_value(months).run())
+
+        if at.exception:
+            raise RuntimeError(f'앱 실행 오류: {at.exception}')
+
+
+# ===== 실행 및 보고 =====
+def summarize(records, wall_seconds, sessions, concurrency, rss_before, rss_peak, rss_per_session):
+    """단계별 지연 시간 백분위와 전체 처리량 요약"""
+    frame = pd.DataFrame(records, columns=['step', 'seconds'])
+    frame['ms'] = frame['seconds'] * 1000
+
+    by_step = frame.groupby('step', sort=False)['ms']
+    steps = pd.DataFrame({'요청 수': by_step.size()})
+    for p in PERCENTILES:
+        steps[f'p{p} (ms)'] = by_step.quantile(p / 100).round(1)
+    steps['최대 (ms)'] = by_step.max().round(1)
+
+    overall = {
+        'concurrency': concurrency,
+        'sessions': sessions,
+        'wall_seconds': round(wall_seconds, 2),
+        'requests': int(len(frame)),
+        'requests_per_sec': round(len(frame) / wall_seconds, 2) if wall_seconds else None,
+        'sessions_per_min': round(sessions / wall_seconds * 60, 2) if wall_seconds else None,
+        'rss_before_mb': round(rss_before, 1),
+        'rss_peak_mb': round(rss_peak, 1),
+        'rss_per_session_mb': round(rss_per_session, 1),
+    }
+    for p in PERCENTILES:
+        overall[f'p{p}_ms'] = round(float(np.percentile(frame['ms'], p)), 1) if len(frame) else None
+    return overall, steps
+
+
+def run_level(run_session, concurrency, sessions, seed):
+    """동시 실행 수 1단계 실행 (세션 sessions개를 concurrency개 스레드로, 한 프로세스의 상주 데이터 공유)"""
+    timer = StepTimer()
+    rss_before = current_rss_mb()
+    errors = []
+
+    def worker(index):
+        try:
+            run_session(timer, random.Random(seed + index))
+        except Exception as e:
+            errors.append(e)
+
+    started = time.perf_counter()
+    with MemorySampler() as sampler:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(worker, range(sessions)))
+    wall = time.perf_counter() - started
+
+    if errors:
+        raise errors[0]
+    rss_per_session = (sampler.peak - rss_before) / max(concurrency, 1)
+    return summarize(timer.records, wall, sessions, concurrency, rss_before, sampler.peak, rss_per_session)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='리뷰 인사이트 대시보드 부하 테스트')
+    parser.add_argument('--target', choices=['analysis', 'app'], default='analysis',
+                        help='analysis: 분석 계층 직접 호출, app: AppTest로 app.py 재실행 (모두 한 프로세스의 스레드)')
+    parser.add_argument('--concurrency', default='1,4,8', help='동시 세션 수 (쉼표로 여러 단계)')
+    parser.add_argument('--sessions', type=int, default=None, help='단계별 세션 수 (기본: 동시 실행 수 × 2)')
+    parser.add_argument('--product-switches', type=int, default=2, help='세션당 제품 전환 횟수')
+    parser.add_argument('--category', default=None, help='카테고리 (기본: 토너 또는 첫 카테고리)')
+    parser.add_argument('--data-dir', default=os.path.join(BASE_DIR, 'data'))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과 JSON 저장 경로')
+    args = parser.parse_args(argv)
+
+    levels = [int(c) for c in args.concurrency.split(',') if c]
+
+    if args.target == 'analysis':
+        # app.py의 load_catalog와 같은 구성 (감성 재채점·공유 저장소·지표 이력)
+        catalog = dashboard_catalog(BASE_DIR, data_dir=args.data_dir)
+        categories = catalog.categories()
+        if not categories:
+            parser.error(f'{args.data_dir}에서 리뷰 데이터를 찾을 수 없습니다.')
+        category = args.category or ('토너' if '토너' in categories else categories[0])
+        # 첫 로드 비용은 별도 측정하고 부하 단계에서는 상주 데이터 기준으로 측정
+        warm_started = time.perf_counter()
+        catalog.get(category)
+        print(f"카테고리 로드: {category} ({time.perf_counter() - warm_started:.2f}s)")
+        run_session = lambda timer, rng: analysis_session(catalog, category, timer, rng, args.product_switches)
+    else:
+        category = args.category or '토너'
+        app_path = os.path.join(BASE_DIR, 'app.py')
+        run_session = lambda timer, rng: app_session(app_path, category, timer, rng, args.product_switches)
+
+    results = []
+    for concurrency in levels:
+        sessions = args.sessions or concurrency * 2
+        overall, steps = run_level(run_session, concurrency, sessions, args.seed)
+        results.append({'overall': overall, 'steps': steps.reset_index().to_dict(orient='records')})
+
+        print(f"\n=== 동시 세션 {concurrency} · 세션 {sessions}개 · {overall['wall_seconds']}s ===")
+        print(f"처리량: {overall['requests_per_sec']} 요청/초, {overall['sessions_per_min']} 세션/분")
+        print(f"지연(ms): p50 {overall['p50_ms']} · p95 {overall['p95_ms']} · p99 {overall['p99_ms']}")
+        print(f"메모리: 시작 {overall['rss_before_mb']}MB → 최대 {overall['rss_peak_mb']}MB "
+              f"(세션당 {overall['rss_per_session_mb']}MB)")
+        print(steps.to_string())
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'target': args.target, 'category': category, 'levels': results}, f, ensure_ascii=False, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
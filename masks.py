@@ -0,0 +1,143 @@
+"""
+분석 조건 마스크 캐시
+여러 인사이트·페이지가 공통으로 쓰는 불리언 조건을 np.packbits로 압축해 (데이터셋 버전, 제품, 조건) 키로
+한 번만 계산해 두고 세션 간 공유 (메모리 한도를 넘으면 가장 오래 안 쓴 항목부터 해제)
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 조건 레지스트리 {이름: (필요 컬럼, df → 불리언 배열 함수)}
+PREDICATES = {}
+
+
+def register_predicate(name, columns, func):
+    """공유 조건 등록 (func는 분석 DataFrame을 받아 행 단위 불리언 값을 반환)"""
+    PREDICATES[name] = (list(columns), func)
+
+
+def predicate_columns(*names):
+    """조건들의 필요 컬럼 합집합"""
+    columns = []
+    for name in names:
+        columns.extend(PREDICATES[name][0])
+    return list(dict.fromkeys(columns))
+
+
+def term_columns(term):
+    """조건 항(등록 조건 이름 또는 '컬럼=값')의 필요 컬럼"""
+    if '=' in term:
+        return [term.split('=', 1)[0]]
+    return list(PREDICATES[term][0])
+
+
+def term_mask(df, term):
+    """조건 항(등록 조건 이름 또는 '컬럼=값')의 행 단위 불리언 배열 (결측은 False)"""
+    if '=' in term:
+        column, value = term.split('=', 1)
+        return (df[column] == value).to_numpy(dtype=bool, na_value=False)
+    return PREDICATES[term][1](df).to_numpy(dtype=bool, na_value=False)
+
+
+register_predicate('repurchase', ['PURCHASE_TYPE'], lambda df: df['PURCHASE_TYPE'].str.contains('재구매', na=False))
+register_predicate(
+    'new_purchase', ['PURCHASE_TYPE'],
+    lambda df: df['PURCHASE_TYPE'].str.contains('첫구매|신규', na=False, regex=True)
+)
+register_predicate('absorption_positive', ['ABSORPTION_SENTIMENT'], lambda df: df['ABSORPTION_SENTIMENT'] == 'POSITIVE')
+register_predicate('finish_positive', ['FINISH_SENTIMENT'], lambda df: df['FINISH_SENTIMENT'] == 'POSITIVE')
+register_predicate('finish_negative', ['FINISH_SENTIMENT'], lambda df: df['FINISH_SENTIMENT'] == 'NEGATIVE')
+register_predicate('moisture_negative', ['MOISTURE_SENTIMENT'], lambda df: df['MOISTURE_SENTIMENT'] == 'NEGATIVE')
+register_predicate('overall_negative', ['OVERALL_SENTIMENT'], lambda df: df['OVERALL_SENTIMENT'] == 'NEGATIVE')
+register_predicate('scent_negative', ['SCENT_SENTIMENT'], lambda df: df['SCENT_SENTIMENT'] == 'NEGATIVE')
+register_predicate('viscous_texture', ['TEXTURE_VALUE'], lambda df: df['TEXTURE_VALUE'].isin(['점성', '쫀쫀']))
+register_predicate('oily_skin', ['SKIN_TYPE_FINAL'], lambda df: df['SKIN_TYPE_FINAL'].str.contains('지성', na=False))
+register_predicate(
+    'irritation_issue', ['IRRITATION_VALUE'],
+    lambda df: df['IRRITATION_VALUE'].notna() & (df['IRRITATION_VALUE'] != '없음')
+)
+register_predicate('mild_summary', ['ONE_LINE_SUMMARY'], lambda df: df['ONE_LINE_SUMMARY'].str.contains('무난', na=False))
+register_predicate(
+    'value_for_money_summary', ['ONE_LINE_SUMMARY'],
+    lambda df: df['ONE_LINE_SUMMARY'].str.contains('가성비', na=False)
+)
+
+
+class MaskCache:
+    """비트 압축 마스크 + 소형 집계 값 LRU 캐시 (프로세스 내 세션 간 공유, 바이트 단위 한도)"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key, n_rows=None):
+        """저장 항목 반환 (저장 시 행 수와 n_rows가 다르면 없는 것으로 처리)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (n_rows is None or entry[2] == n_rows):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def _store(self, key, value, nbytes, n_rows=None):
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, nbytes, n_rows)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted, _) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+
+    def mask(self, key, n_rows, compute):
+        """불리언 마스크 반환 (없거나 행 수가 다르면 compute()로 계산해 비트 압축 저장)"""
+        packed = self._lookup(key, n_rows)
+        if packed is not None:
+            return np.unpackbits(packed, count=n_rows).view(bool)
+
+        mask = np.asarray(compute(), dtype=bool)
+        if len(mask) != n_rows:
+            raise ValueError(f"마스크 길이 불일치: {key} ({len(mask)} != {n_rows})")
+        packed = np.packbits(mask)
+        self._store(key, packed, packed.nbytes, n_rows)
+        return mask
+
+    def value(self, key, compute, n_rows=None):
+        """소형 집계 값(월별 건수 Series 등) 반환 (없거나 행 수가 다르면 compute()로 계산해 저장)"""
+        value = self._lookup(key, n_rows)
+        if value is None:
+            value = compute()
+            self._store(key, value, int(getattr(value, 'nbytes', 0)) or 64, n_rows)
+        return value
+
+    def invalidate(self, category=None, version=None):
+        """카테고리/버전 항목 해제 (미지정 시 전체)"""
+        with self._lock:
+            for key in list(self._entries):
+                if (category is None or key[0] == category) and (version is None or key[1] == version):
+                    self.nbytes -= self._entries.pop(key)[1]
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+# 프로세스 공용 마스크 캐시
+mask_cache = MaskCache()
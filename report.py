@@ -0,0 +1,337 @@
+"""
+일괄 인사이트 리포트 생성기
+카테고리 전체와 모든 제품의 요약 지표, 10가지 인사이트, 월별 속성 히트맵을 단일 HTML 파일로 렌더링
+(카테고리 데이터를 한 번만 읽어 브랜드 × 월 × 조건 건수 테이블로 집계하고, 제품 섹션은 그 슬라이스로
+작업자 프로세스 풀에서 병렬 생성)
+
+    python report.py --category 토너 --out reports/토너.html --workers 8
+"""
+
+import os
+import sys
+import html
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from plotly.offline import get_plotlyjs
+
+from analysis import (
+    IDEA_METHODS, ATTRIBUTE_COLUMNS, RESILIENCE_COLUMNS, MonthlyInsightTables, columns_for, page_columns
+)
+from catalog import dashboard_catalog
+from chart_data import bounded_figure, point_budget
+from figures import (
+    IDEA_LABELS, IDEA_FIGURES, monthly_sentiment_counts_figure, positive_ratio_series_figure,
+    attribute_heatmap_figure
+)
+from masks import term_columns, term_mask
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+# 리포트 차트 플롯 폭(px) (포인트 예산 기준)
+REPORT_CHART_WIDTH = 900
+TABLE_MAX_ROWS = 24
+
+REPORT_STYLE = """
+body { font-family: -apple-system, 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif; margin: 32px; color: #2C3E50; }
+h1 { border-bottom: 3px solid #2C3E50; padding-bottom: 8px; }
+h2 { margin-top: 48px; border-bottom: 1px solid #BDC3C7; padding-bottom: 4px; }
+table { border-collapse: collapse; font-size: 13px; margin: 8px 0 16px; }
+th, td { border: 1px solid #D5D8DC; padding: 4px 8px; text-align: right; }
+th { background: #F4F6F7; }
+.metrics { display: flex; gap: 24px; margin: 12px 0; }
+.metric { background: #F4F6F7; border-radius: 6px; padding: 8px 16px; }
+.metric b { display: block; font-size: 20px; }
+.note { color: #7F8C8D; }
+.error { color: #C0392B; background: #FDEDEC; border-radius: 6px; padding: 8px 16px; }
+"""
+
+SENTIMENT_VALUES = ['POSITIVE', 'NEUTRAL', 'NEGATIVE']
+
+# 브랜드 × 월별로 한 번에 세는 조건 조합 (항은 masks.PREDICATES 이름 또는 '컬럼=값', 조합은 AND)
+# analysis.MonthlyInsightTables가 size()/total()로 요청하는 조합과 같아야 함 (빠진 조합은 오류로 표시)
+REPORT_COUNTS = [
+    ('repurchase',), ('repurchase', 'absorption_positive'),
+    ('viscous_texture',), ('viscous_texture', 'OVERALL_SENTIMENT=POSITIVE'),
+    ('moisture_negative',), ('overall_negative',), ('moisture_negative', 'overall_negative'),
+    ('finish_positive',), ('finish_positive', 'moisture_negative'),
+    ('scent_negative',),
+    ('new_purchase',), ('mild_summary', 'new_purchase'),
+    ('oily_skin',), ('oily_skin', 'finish_negative'),
+    ('irritation_issue',),
+    ('value_for_money_summary', 'OVERALL_SENTIMENT=POSITIVE'),
+    ('value_for_money_summary', 'OVERALL_SENTIMENT=NEGATIVE'),
+    *[(f'OVERALL_SENTIMENT={value}',) for value in SENTIMENT_VALUES],
+    *[(f'{col}=POSITIVE',) for col, _ in ATTRIBUTE_COLUMNS],
+    *[('repurchase', f'{col}=POSITIVE') for col, _ in RESILIENCE_COLUMNS]
+]
+REPORT_COUNT_SET = set(REPORT_COUNTS)
+
+
+def report_columns():
+    """리포트에 필요한 컬럼 (개요·인사이트·속성 테이블 레지스트리 합집합)"""
+    return list(dict.fromkeys(
+        ['브랜드명']
+        + columns_for(*IDEA_METHODS, 'get_monthly_attribute_sentiment_table', 'get_summary')
+        + page_columns('overview')
+    ))
+
+
+def _count_label(terms):
+    return '&'.join(terms)
+
+
+def monthly_counts(df):
+    """카테고리 전체를 브랜드 × 월 × 조건 조합별 건수 테이블로 한 번에 집계
+
+    열 'n'은 월별 리뷰 수, 나머지 열은 REPORT_COUNTS 조합 라벨 (필요 컬럼이 없는 조합은 제외)
+    날짜가 없는 행은 월별 집계에서 빠지므로 분석 메서드의 groupby('MONTH')와 같은 기준
+    """
+    masks = {}
+    indicators = {'n': np.ones(len(df), dtype=np.int64)}
+    for terms in REPORT_COUNTS:
+        combined = None
+        for term in terms:
+            if term not in masks:
+                present = all(col in df.columns for col in term_columns(term))
+                masks[term] = term_mask(df, term) if present else None
+            if masks[term] is None:
+                combined = None
+                break
+            combined = masks[term] if combined is None else combined & masks[term]
+        if combined is not None:
+            indicators[_count_label(terms)] = combined.astype(np.int64)
+
+    frame = pd.DataFrame(indicators, index=df.index)
+    keys = [df['브랜드명'] if '브랜드명' in df.columns else pd.Series(None, index=df.index, name='브랜드명'), df['MONTH']]
+    counts = frame.groupby(keys, dropna=False, sort=True).sum()
+    return counts[counts.index.get_level_values('MONTH').notna()]
+
+
+def product_summaries(df):
+    """브랜드별 요약 지표 원본 값 {브랜드: (리뷰 수, 감성별 건수, 첫 리뷰일, 마지막 리뷰일)} + 전체"""
+    brands = df['브랜드명'] if '브랜드명' in df.columns else pd.Series(None, index=df.index)
+    frame = pd.DataFrame({'n': np.ones(len(df), dtype=np.int64)}, index=df.index)
+    for value in SENTIMENT_VALUES:
+        frame[value] = (
+            (df['OVERALL_SENTIMENT'] == value).to_numpy(dtype=bool, na_value=False).astype(np.int64)
+            if 'OVERALL_SENTIMENT' in df.columns else 0
+        )
+    dates = df['리뷰등록일'] if '리뷰등록일' in df.columns else pd.Series(pd.NaT, index=df.index)
+    frame['first'] = dates
+    frame['last'] = dates
+    grouped = frame.groupby(brands.rename('브랜드명'), dropna=False).agg(
+        {'n': 'sum', **{value: 'sum' for value in SENTIMENT_VALUES}, 'first': 'min', 'last': 'max'}
+    )
+    overall = frame.agg({'n': 'sum', **{value: 'sum' for value in SENTIMENT_VALUES}, 'first': 'min', 'last': 'max'})
+    summaries = {brand: tuple(row) for brand, row in grouped.iterrows()}
+    summaries["전체"] = tuple(overall)
+    return summaries
+
+
+def _format_summary(values):
+    """요약 원본 값을 analysis.get_summary와 같은 형식으로"""
+    total, positive, neutral, negative, first, last = values
+    total = int(total)
+    date_range = "데이터 확인 중" if pd.isna(first) or pd.isna(last) else f"{first.date()} ~ {last.date()}"
+    ratio = lambda count: f"{count / total * 100:.2f}%" if total > 0 else "0%"
+    return {
+        'total_reviews': total,
+        'date_range': date_range,
+        'positive_ratio': ratio(positive),
+        'negative_ratio': ratio(negative),
+        'neutral_ratio': ratio(neutral)
+    }
+
+
+class MonthlyCounts(MonthlyInsightTables):
+    """제품 1개의 월 × 조건 건수 테이블에서 인사이트 표를 재구성 (표 생성은 분석 객체와 같은 공통 구현)"""
+
+    def __init__(self, counts):
+        self.counts = counts
+
+    def size(self, *terms):
+        if not terms:
+            return self.counts['n']
+        sizes = self.total(*terms)
+        return sizes[sizes > 0]
+
+    def total(self, *terms):
+        if terms not in REPORT_COUNT_SET:
+            raise ValueError(f"REPORT_COUNTS에 없는 조건 조합: {_count_label(terms)}")
+        # 필요 컬럼이 없어 집계에서 빠진 조합은 KeyError (섹션에 컬럼 부족 안내)
+        return self.counts[_count_label(terms)]
+
+    def monthly_sentiment(self):
+        """월 × 감정 건수 (전체 감정 분포 차트용, 한 번도 나오지 않은 감정은 제외)"""
+        columns = {
+            value: self.total(f'OVERALL_SENTIMENT={value}')
+            for value in sorted(SENTIMENT_VALUES) if self.total(f'OVERALL_SENTIMENT={value}').sum() > 0
+        }
+        return pd.DataFrame(columns, index=self.counts.index)
+
+    def positive_ratio(self):
+        return self.total('OVERALL_SENTIMENT=POSITIVE') / self.size() * 100
+
+
+def _figure_html(fig, budget):
+    """Figure를 포인트 예산으로 축소 후 HTML 조각으로 (plotly.js는 문서에 한 번만 포함)"""
+    return bounded_figure(fig, budget).to_html(full_html=False, include_plotlyjs=False)
+
+
+def _table_html(df):
+    return df.head(TABLE_MAX_ROWS).to_html(border=0, float_format=lambda v: f'{v:,.2f}')
+
+
+def _error_block(e):
+    return f'<p class="error">⚠️ 계산 중 오류가 발생했습니다: {html.escape(type(e).__name__)}: {html.escape(str(e))}</p>'
+
+
+def render_product_section(product, summary, counts, anchor, budget=None):
+    """제품 1개 섹션 HTML 생성 (프로세스 풀 작업 단위, 입력은 작은 월 × 조건 건수 테이블)
+
+    필요한 컬럼이 없으면 안내 문구를, 그 밖의 오류는 오류 블록으로 섹션에 남기고 (제품, 요약, HTML, 오류 목록) 반환
+    """
+    budget = budget or point_budget(REPORT_CHART_WIDTH)
+    monthly = MonthlyCounts(counts)
+    errors = []
+
+    def render(title, build):
+        try:
+            return build()
+        except KeyError:
+            return '<p class="note">필요한 컬럼 데이터가 부족합니다.</p>'
+        except Exception as e:
+            errors.append(f'{product} / {title}: {type(e).__name__}: {e}')
+            return _error_block(e)
+
+    parts = [f'<h2 id="{anchor}">📦 {html.escape(str(product))}</h2>']
+    parts.append('<div class="metrics">' + ''.join(
+        f'<div class="metric">{label}<b>{html.escape(str(summary[key]))}</b></div>'
+        for label, key in [
+            ('📝 총 리뷰 수', 'total_reviews'), ('😊 긍정', 'positive_ratio'), ('😐 중립', 'neutral_ratio'),
+            ('😞 부정', 'negative_ratio'), ('📅 분석 기간', 'date_range')
+        ]
+    ) + '</div>')
+
+    if len(counts) and 'OVERALL_SENTIMENT=POSITIVE' in counts.columns:
+        parts.append(render('개요', lambda: (
+            _figure_html(monthly_sentiment_counts_figure(monthly.monthly_sentiment()), budget)
+            + _figure_html(positive_ratio_series_figure(monthly.positive_ratio()), budget)
+        )))
+
+    def idea_html(method):
+        result = getattr(monthly, method)()
+        table = result[0] if isinstance(result, tuple) else result
+        return _table_html(table) + _figure_html(IDEA_FIGURES[method](result), budget)
+
+    for method in IDEA_METHODS:
+        parts.append(f'<h3>💡 {IDEA_LABELS[method]}</h3>')
+        parts.append(render(IDEA_LABELS[method], lambda: idea_html(method)))
+
+    def attribute_html():
+        monthly_attribute = monthly.get_monthly_attribute_sentiment_table()
+        if len(monthly_attribute) == 0 or len(monthly_attribute.columns) == 0:
+            return '<p class="note">월별 데이터가 부족합니다.</p>'
+        return _table_html(monthly_attribute) + _figure_html(attribute_heatmap_figure(monthly_attribute), budget)
+
+    parts.append('<h3>📋 월별 속성별 긍정 비율 (%)</h3>')
+    parts.append(render('월별 속성별 긍정 비율', attribute_html))
+
+    return product, summary, '\n'.join(parts), errors
+
+
+def build_report(analysis, out_path, products=None, workers=None, include_overall=True):
+    """카테고리 리포트 HTML 생성 후 (제품 수, 소요 시간, 오류 목록) 반환
+
+    analysis: 카테고리 분석 객체 (CSV/파티션/공유 저장소 모드 모두 가능)
+    products: 포함할 제품 목록 (미지정 시 전체 제품)
+    """
+    started = time.perf_counter()
+
+    # 카테고리 데이터를 한 번만 읽어 브랜드 × 월 × 조건 건수로 집계 (작업자에는 제품별 작은 슬라이스만 전달)
+    df = analysis.full_frame(report_columns())
+    counts = monthly_counts(df)
+    summaries = product_summaries(df)
+    del df
+
+    jobs = []
+    if include_overall:
+        jobs.append(("전체", counts.groupby(level='MONTH', sort=True).sum()))
+    brands = counts.index.get_level_values('브랜드명')
+    for product in sorted(brand for brand in summaries if brand != "전체" and not pd.isna(brand)):
+        if products is None or product in products:
+            jobs.append((product, counts[brands == product].droplevel('브랜드명')))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                render_product_section, product, _format_summary(summaries[product]), product_counts,
+                f'section-{index}'
+            )
+            for index, (product, product_counts) in enumerate(jobs)
+        ]
+        sections = [future.result() for future in futures]
+    errors = [error for *_, section_errors in sections for error in section_errors]
+
+    title = f"{analysis.category} 리뷰 인사이트 리포트"
+    overview_rows = ''.join(
+        f'<tr><td style="text-align:left"><a href="#section-{index}">{html.escape(str(product))}</a></td>'
+        f'<td>{summary["total_reviews"]:,}</td><td>{summary["positive_ratio"]}</td>'
+        f'<td>{summary["neutral_ratio"]}</td><td>{summary["negative_ratio"]}</td>'
+        f'<td>{html.escape(summary["date_range"])}</td></tr>'
+        for index, (product, summary, _, _) in enumerate(sections)
+    )
+
+    document = f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>{REPORT_STYLE}</style>
+<script type="text/javascript">{get_plotlyjs()}</script>
+</head>
+<body>
+<h1>📊 {html.escape(title)}</h1>
+<p class="note">생성 시각: {datetime.now():%Y-%m-%d %H:%M} · 제품 {len(sections)}개</p>
+<table>
+<tr><th>제품</th><th>총 리뷰 수</th><th>긍정</th><th>중립</th><th>부정</th><th>분석 기간</th></tr>
+{overview_rows}
+</table>
+{''.join(section for _, _, section, _ in sections)}
+</body>
+</html>
+"""
+
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(document)
+    return len(sections), time.perf_counter() - started, errors
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='카테고리 전체 제품 인사이트 HTML 리포트 일괄 생성')
+    parser.add_argument('--category', default='토너', help='카테고리명')
+    parser.add_argument('--data-dir', default=os.path.join(BASE_DIR, 'data'))
+    parser.add_argument('--out', default=None, help='출력 HTML 경로 (기본: reports/<카테고리>_<날짜>.html)')
+    parser.add_argument('--products', default=None, help='포함할 제품 (쉼표 구분, 미지정 시 전체)')
+    parser.add_argument('--workers', type=int, default=None, help='작업자 프로세스 수 (기본: CPU 수)')
+    args = parser.parse_args()
+
+    # 대시보드와 같은 로드 경로(감성 재채점·공유 저장소)로 읽어 리포트 수치를 화면과 일치시킴
+    catalog = dashboard_catalog(BASE_DIR, data_dir=args.data_dir)
+    if args.category not in catalog.categories():
+        parser.error(f'알 수 없는 카테고리: {args.category} (사용 가능: {", ".join(catalog.categories())})')
+
+    out = args.out or os.path.join(BASE_DIR, 'reports', f'{args.category}_{datetime.now():%Y%m}.html')
+    products = [p for p in args.products.split(',') if p] if args.products else None
+    count, seconds, errors = build_report(catalog.get(args.category), out, products=products, workers=args.workers)
+    print(f"리포트 생성 완료: {out} (섹션 {count}개, {seconds:.1f}s)")
+    for error in errors:
+        print(f"⚠️ {error}", file=sys.stderr)
+    if errors:
+        sys.exit(1)
@@ -0,0 +1,272 @@
+"""
+로컬 감성 재채점 모듈
+*_SENTIMENT 라벨이 비어 있는(또는 전체 재채점 대상인) 리뷰를 ONE_LINE_SUMMARY 기반으로
+CPU 프로세스 풀에서 배치 채점하고, 결과를 REVIEW_ID별로 캐시하여 새로 추가/변경된 리뷰만 다시 채점
+"""
+
+import os
+import json
+import time
+import hashlib
+import warnings
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+SUMMARY_COLUMN = 'ONE_LINE_SUMMARY'
+KEY_COLUMN = 'REVIEW_ID'
+
+SENTIMENT_COLUMNS = [
+    'OVERALL_SENTIMENT', 'ABSORPTION_SENTIMENT', 'FINISH_SENTIMENT', 'MOISTURE_SENTIMENT',
+    'TEXTURE_SENTIMENT', 'SCENT_SENTIMENT', 'IRRITATION_SENTIMENT', 'SOOTHING_SENTIMENT'
+]
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'sentiment')
+DEFAULT_BATCH_SIZE = 50_000
+
+# 속성별 언급(aspect) / 긍정 / 부정 정규식 패턴
+# aspect가 없으면 모든 리뷰를 해당 속성 언급으로 간주
+DEFAULT_LEXICON = {
+    'OVERALL_SENTIMENT': {
+        'aspect': [],
+        'positive': ['좋', '만족', '최고', '촉촉', '산뜻', '순해', '순하', '추천', '편안', '재구매'],
+        'negative': ['별로', '부족', '건조', '끈적', '따가', '트러블', '아쉬', '불편', '실망', '싫']
+    },
+    'ABSORPTION_SENTIMENT': {
+        'aspect': ['흡수', '스며'],
+        'positive': ['흡수\\S*\\s*(잘|빠르|빨라|빨리|좋)', '잘\\s*스며'],
+        'negative': ['흡수\\S*\\s*(느리|안|별로)', '겉돌', '안\\s*스며']
+    },
+    'FINISH_SENTIMENT': {
+        'aspect': ['마무리', '산뜻', '끈적', '번들', '잔여감', '보송', '깔끔'],
+        'positive': ['산뜻', '깔끔', '보송'],
+        'negative': ['끈적', '번들', '무거', '답답', '잔여감']
+    },
+    'MOISTURE_SENTIMENT': {
+        'aspect': ['보습', '촉촉', '건조', '수분', '당김', '당기', '땅김', '땅기'],
+        'positive': ['촉촉', '보습\\S*\\s*(좋|충분|짱)', '수분\\S*\\s*(가득|충분)'],
+        'negative': ['부족', '건조', '당기', '당김', '땅기', '땅김', '보습\\S*\\s*(약|별로)']
+    },
+    'TEXTURE_SENTIMENT': {
+        'aspect': ['제형', '텍스처', '묽', '점성', '쫀쫀', '물같'],
+        'positive': ['가벼', '쫀쫀', '제형\\S*\\s*좋'],
+        'negative': ['흘러', '제형\\S*\\s*별로', '너무\\s*묽']
+    },
+    'SCENT_SENTIMENT': {
+        'aspect': ['향', '냄새'],
+        'positive': ['향\\S*\\s*(좋|은은|상큼)', '무향'],
+        'negative': ['향\\S*\\s*(별로|강|역|싫|독)', '냄새']
+    },
+    'IRRITATION_SENTIMENT': {
+        'aspect': ['자극', '따가', '트러블', '순해', '순하', '민감', '뒤집'],
+        'positive': ['자극\\s*(없|없이|적)', '순해', '순하'],
+        'negative': ['따가', '트러블', '자극\\S*\\s*(있|심)', '뒤집', '가려']
+    },
+    'SOOTHING_SENTIMENT': {
+        'aspect': ['진정', '붉은', '열감'],
+        'positive': ['진정\\S*\\s*(잘|효과|돼|되)', '가라앉'],
+        'negative': ['진정\\S*\\s*(안|없|별로)']
+    }
+}
+
+
+class LexiconScorer:
+    """어휘 사전 기반 속성 감성 채점기 (정규식 패턴, CPU 전용)
+
+    사용자 사전은 DEFAULT_LEXICON과 같은 구조의 JSON 파일로 from_file()로 로드
+    """
+
+    def __init__(self, lexicon=None, name='lexicon'):
+        self.lexicon = lexicon or DEFAULT_LEXICON
+        # 사전 내용이 바뀌면 캐시도 무효화되도록 이름에 사전 해시 포함
+        digest = hashlib.blake2b(json.dumps(self.lexicon, sort_keys=True).encode(), digest_size=6).hexdigest()
+        self.cache_name = f'{name}-{digest}'
+        self._patterns = {
+            col: {key: '|'.join(words) if words else None for key, words in entry.items()}
+            for col, entry in self.lexicon.items()
+        }
+
+    @classmethod
+    def from_file(cls, path):
+        """JSON 사전 파일에서 채점기 생성"""
+        with open(path, encoding='utf-8') as f:
+            lexicon = json.load(f)
+        return cls(lexicon, name=os.path.splitext(os.path.basename(path))[0])
+
+    def attributes(self):
+        return list(self.lexicon.keys())
+
+    def score(self, texts, attribute):
+        """텍스트 배열의 속성 감성 (POSITIVE / NEUTRAL / NEGATIVE)"""
+        texts = pd.Series(texts, dtype=object).fillna('')
+        patterns = self._patterns[attribute]
+
+        def matches(pattern):
+            if pattern is None:
+                return np.ones(len(texts), dtype=bool)
+            return texts.str.contains(pattern, regex=True).to_numpy()
+
+        mentioned = matches(patterns.get('aspect'))
+        positive = matches(patterns.get('positive')) & mentioned
+        negative = matches(patterns.get('negative')) & mentioned
+
+        labels = np.full(len(texts), 'NEUTRAL', dtype=object)
+        labels[positive & ~negative] = 'POSITIVE'
+        labels[negative & ~positive] = 'NEGATIVE'
+        return labels
+
+
+def _score_batch(args):
+    """프로세스 풀 작업 단위: 배치 텍스트의 속성별 감성"""
+    scorer, texts, attributes = args
+    # spawn 작업자는 부모 프로세스의 경고 필터를 물려받지 않음 (사전 패턴의 그룹 괄호는 의도된 것)
+    warnings.filterwarnings('ignore', message='This pattern is interpreted as a regular expression', category=UserWarning)
+    return {attribute: scorer.score(texts, attribute) for attribute in attributes}
+
+
+def _text_hashes(texts):
+    return pd.util.hash_array(pd.Series(texts, dtype=object).fillna('').to_numpy().astype(str))
+
+
+def _load_cache(path):
+    try:
+        return pd.read_parquet(path)
+    except (OSError, ValueError):
+        return None
+
+
+class SentimentRescorer:
+    """감성 라벨 보완/재채점 단계 (배치 × 프로세스 풀, REVIEW_ID 캐시)
+
+    mode='fill'   : 비어 있는 라벨만 채점 결과로 채움
+    mode='rescore': 모든 라벨을 채점 결과로 교체
+    """
+
+    def __init__(self, scorer=None, mode='fill', workers=None, batch_size=DEFAULT_BATCH_SIZE,
+                 cache_dir=DEFAULT_CACHE_DIR):
+        if mode not in ('fill', 'rescore'):
+            raise ValueError(f"알 수 없는 모드: {mode}")
+        self.scorer = scorer or LexiconScorer()
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.cache_dir = cache_dir
+        self.last_report = None
+
+    def _score(self, texts, attributes):
+        """텍스트 배열을 배치로 나눠 채점 (배치가 하나면 현재 프로세스에서 실행)"""
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        jobs = [(self.scorer, batch, attributes) for batch in batches]
+        if len(jobs) <= 1 or self.workers <= 1:
+            results = [_score_batch(job) for job in jobs]
+        else:
+            # Streamlit 서버 등 다중 스레드 프로세스에서 fork하면 잠금 상태가 복제되어 멈출 수 있으므로 spawn 사용
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)), mp_context=context) as pool:
+                results = list(pool.map(_score_batch, jobs))
+        return {
+            attribute: np.concatenate([r[attribute] for r in results]) if results else np.array([], dtype=object)
+            for attribute in attributes
+        }
+
+    def apply(self, df, texts, keys=None, cache_key='default'):
+        """df의 감성 컬럼을 제자리에서 보완하고 처리 보고서(dict) 반환
+
+        texts: df와 같은 행 순서의 요약 텍스트, keys: REVIEW_ID (없으면 캐시 미사용)
+        """
+        started = time.perf_counter()
+        # 캐시 항목이 항상 전 속성을 갖도록 채점은 사전의 모든 속성에 대해 수행
+        attributes = self.scorer.attributes()
+        present = [col for col in attributes if col in df.columns]
+        texts = np.asarray(texts, dtype=object)
+
+        if self.mode == 'fill':
+            target = np.zeros(len(df), dtype=bool)
+            for col in present:
+                target |= df[col].isna().to_numpy()
+        else:
+            target = np.ones(len(df), dtype=bool)
+        target_rows = np.flatnonzero(target)
+
+        labels = {col: np.full(len(target_rows), None, dtype=object) for col in attributes}
+        to_score = np.ones(len(target_rows), dtype=bool)
+        cache_path = os.path.join(self.cache_dir, f'{cache_key}-{self.scorer.cache_name}.parquet')
+        text_hash = _text_hashes(texts[target_rows])
+
+        # 캐시 적중: REVIEW_ID와 텍스트 해시가 모두 같은 리뷰는 재사용
+        cache = _load_cache(cache_path) if keys is not None else None
+        if cache is not None and len(target_rows):
+            target_keys = pd.Index(np.asarray(keys)[target_rows].astype(str))
+            cache = cache.drop_duplicates(KEY_COLUMN, keep='last').set_index(KEY_COLUMN)
+            position = cache.index.get_indexer(target_keys)
+            hit = position >= 0
+            hit[hit] = cache['text_hash'].to_numpy()[position[hit]] == text_hash[hit]
+            for col in attributes:
+                if col in cache.columns:
+                    labels[col][hit] = cache[col].to_numpy()[position[hit]]
+                else:
+                    hit[:] = False
+            to_score = ~hit
+
+        score_rows = np.flatnonzero(to_score)
+        if len(score_rows):
+            scored = self._score(texts[target_rows[score_rows]], attributes)
+            for col in attributes:
+                labels[col][score_rows] = scored[col]
+
+        # 비어 있던 라벨을 채운 수와 (rescore) 기존 라벨이 다른 값으로 바뀐 수
+        filled_labels = changed_labels = 0
+        for col in present:
+            values = df[col].to_numpy(dtype=object).copy()
+            before = values[target_rows]
+            missing = pd.isna(before)
+            filled_labels += int(np.count_nonzero(missing & pd.notna(labels[col])))
+            if self.mode == 'fill':
+                values[target_rows[missing]] = labels[col][missing]
+            else:
+                changed_labels += int(np.count_nonzero(~missing & (before != labels[col])))
+                values[target_rows] = labels[col]
+            df[col] = values
+
+        if keys is not None and len(score_rows):
+            self._update_cache(cache_path, cache, np.asarray(keys)[target_rows[score_rows]].astype(str),
+                               text_hash[score_rows], {col: labels[col][score_rows] for col in attributes})
+
+        elapsed = time.perf_counter() - started
+        self.last_report = {
+            'mode': self.mode,
+            'scorer': self.scorer.cache_name,
+            'target_reviews': int(len(target_rows)),
+            'scored_reviews': int(len(score_rows)),
+            'cached_reviews': int(len(target_rows) - len(score_rows)),
+            'filled_labels': filled_labels,
+            'changed_labels': changed_labels,
+            'seconds': round(elapsed, 3),
+            'reviews_per_sec': round(len(score_rows) / elapsed, 1) if elapsed > 0 and len(score_rows) else None
+        }
+        return self.last_report
+
+    def _update_cache(self, path, cache, keys, text_hash, labels):
+        """새로 채점한 리뷰를 캐시에 병합 저장 (임시 파일에 쓴 뒤 원자적 교체)
+
+        병합 직전에 캐시를 다시 읽어 그 사이 다른 적재 작업이 추가한 항목도 유지
+        """
+        fresh = pd.DataFrame({KEY_COLUMN: keys, 'text_hash': text_hash, **labels})
+        latest = _load_cache(path)
+        if latest is None and cache is not None:
+            latest = cache.reset_index()
+        if latest is not None:
+            fresh = pd.concat([latest, fresh], ignore_index=True)
+            fresh = fresh.drop_duplicates(KEY_COLUMN, keep='last')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.tmp-{os.getpid()}-{threading.get_ident()}'
+        try:
+            fresh.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,211 @@
+"""
+메모리 매핑 공유 분석 저장소
+전처리된 카테고리 데이터를 컬럼별 .npy 파일로 한 번만 기록하고, 여러 Streamlit 워커 프로세스가
+np.load(mmap_mode='r')로 같은 페이지 캐시를 읽기 전용으로 공유 (복제 프로세스 추가 시 메모리 증가 최소화)
+"""
+
+import os
+import json
+import shutil
+import hashlib
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+
+SHARED_FORMAT_VERSION = 2
+BRAND_COLUMN = '브랜드명'
+MONTH_COLUMN = 'YEAR_MONTH'
+META_FILE = 'meta.json'
+
+# 고유값 비율이 이보다 높은 문자열 컬럼(요약/본문 등)은 범주 코드 대신 UTF-8 바이트 + 오프셋으로 저장
+TEXT_CARDINALITY_RATIO = 0.5
+
+# 텍스트 컬럼 복원 dtype (CSV 로드 결과와 같은 pandas 기본 문자열 dtype, Arrow 버퍼를 그대로 감쌈)
+TEXT_DTYPE = pd.StringDtype('pyarrow', na_value=np.nan)
+
+
+def source_version(paths, rescorer=None):
+    """원본 파일(경로·크기·수정 시각)과 재채점 설정으로 만든 버전 문자열"""
+    parts = [str(SHARED_FORMAT_VERSION)]
+    for path in paths:
+        stat = os.stat(path)
+        parts.append(f'{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}')
+    if rescorer is not None:
+        parts.append(f'{rescorer.mode}:{rescorer.scorer.cache_name}')
+    return hashlib.blake2b('|'.join(parts).encode(), digest_size=8).hexdigest()
+
+
+def _column_file(root, name, suffix):
+    # 컬럼명(한글 포함)을 파일명으로 안전하게 쓰기 위해 해시 사용
+    digest = hashlib.blake2b(name.encode(), digest_size=6).hexdigest()
+    return os.path.join(root, f'{digest}.{suffix}.npy')
+
+
+def _write_column(root, name, series):
+    """컬럼 1개를 종류별 .npy 파일로 기록하고 메타 정보 반환"""
+    dtype = series.dtype
+    if isinstance(dtype, pd.PeriodDtype):
+        np.save(_column_file(root, name, 'values'), series.array.asi8)
+        return {'kind': 'period', 'dtype': str(dtype)}
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        values = series.to_numpy()
+        np.save(_column_file(root, name, 'values'), values.view(np.int64))
+        return {'kind': 'datetime', 'dtype': str(values.dtype)}
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(dtype):
+        values = series.to_numpy()
+        if values.dtype == object:
+            values = series.astype(np.float64).to_numpy()
+        np.save(_column_file(root, name, 'values'), values)
+        return {'kind': 'numeric'}
+
+    values = series.astype(object).where(series.notna(), None)
+    n_unique = values.nunique(dropna=True)
+    if len(values) and n_unique / len(values) > TEXT_CARDINALITY_RATIO:
+        array = pa.array(values.tolist(), type=pa.large_string())
+        _, offsets, data = array.buffers()
+        valid = values.notna().to_numpy()
+        np.save(_column_file(root, name, 'offsets'), np.frombuffer(offsets, dtype=np.int64))
+        np.save(_column_file(root, name, 'data'), np.frombuffer(data, dtype=np.uint8) if data else np.zeros(0, np.uint8))
+        np.save(_column_file(root, name, 'valid'), np.packbits(valid, bitorder='little'))
+        return {'kind': 'text'}
+
+    categorical = pd.Categorical(values.astype(str).where(values.notna(), None))
+    np.save(_column_file(root, name, 'codes'), categorical.codes)
+    return {'kind': 'category', 'categories': [str(c) for c in categorical.categories]}
+
+
+def write_shared(df, root, extra_meta=None):
+    """전처리된 DataFrame을 공유 저장소로 기록 (임시 디렉터리에 쓴 뒤 원자적 이름 변경)"""
+    tmp = f'{root}.tmp-{os.getpid()}'
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    columns = {name: _write_column(tmp, name, df[name]) for name in df.columns}
+    meta = {'format': SHARED_FORMAT_VERSION, 'rows': int(len(df)), 'columns': columns}
+    meta.update(extra_meta or {})
+    with open(os.path.join(tmp, META_FILE), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, default=str)
+
+    try:
+        os.rename(tmp, root)
+    except OSError:
+        # 다른 워커가 먼저 같은 버전을 기록한 경우 그 결과를 사용
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.exists(os.path.join(root, META_FILE)):
+            raise
+    return root
+
+
+def open_shared_store(csv_paths, category, shared_dir, rescorer=None):
+    """원본 CSV 버전에 맞는 공유 저장소를 열고, 없으면 전처리 후 생성 (이전 버전은 정리)"""
+    version = source_version(csv_paths, rescorer)
+    root = os.path.join(shared_dir, f'{category}-{version}')
+
+    if not os.path.exists(os.path.join(root, META_FILE)):
+        from analysis import ReviewInsightAnalysis
+
+        os.makedirs(shared_dir, exist_ok=True)
+        analysis = ReviewInsightAnalysis(csv_paths, category=category, projection=False, rescorer=rescorer)
+        write_shared(analysis.original_df, root, {
+            'category': category,
+            'rescore_report': analysis.rescore_report,
+            'quality_report': analysis.quality_report
+        })
+        del analysis
+
+        prefix = f'{category}-'
+        for name in os.listdir(shared_dir):
+            path = os.path.join(shared_dir, name)
+            if name.startswith(prefix) and path != root and '.tmp-' not in name:
+                # 이미 매핑 중인 프로세스는 파일 삭제 후에도 기존 매핑을 계속 사용
+                shutil.rmtree(path, ignore_errors=True)
+
+    return SharedReviewStore(root)
+
+
+class SharedReviewStore:
+    """메모리 매핑 컬럼 저장소 (PartitionedReviewStore와 같은 brands/read 인터페이스)
+
+    숫자·날짜·연월 컬럼과 범주 코드, 텍스트 컬럼의 UTF-8 바이트는 매핑된 배열을 복사 없이 그대로 사용하고,
+    브랜드/연월 필터 시에만 해당 행을 추출
+    """
+
+    def __init__(self, root):
+        self.root = root
+        with open(os.path.join(root, META_FILE), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.columns = list(self.meta['columns'].keys())
+        self.rows = self.meta['rows']
+        self.rescore_report = self.meta.get('rescore_report')
+        self.quality_report = self.meta.get('quality_report')
+        self._arrays = {}
+        self._brand_rows = {}
+
+    def _load(self, name, suffix):
+        key = (name, suffix)
+        if key not in self._arrays:
+            self._arrays[key] = np.load(_column_file(self.root, name, suffix), mmap_mode='r')
+        return self._arrays[key]
+
+    def _column(self, name, rows=None):
+        """컬럼 1개를 pandas 배열로 복원 (rows 미지정 시 매핑 배열 그대로)"""
+        info = self.meta['columns'][name]
+        kind = info['kind']
+
+        if kind == 'text':
+            offsets = self._load(name, 'offsets')
+            array = pa.LargeStringArray.from_buffers(
+                self.rows,
+                pa.py_buffer(offsets),
+                pa.py_buffer(self._load(name, 'data')),
+                pa.py_buffer(self._load(name, 'valid'))
+            )
+            if rows is not None:
+                array = array.take(pa.array(rows))
+            # 매핑된 UTF-8 바이트를 복사하지 않고 Arrow 문자열 배열로 사용 (워커 간 페이지 캐시 공유)
+            return pd.array(array, dtype=TEXT_DTYPE)
+
+        key = 'codes' if kind == 'category' else 'values'
+        values = self._load(name, key)
+        if rows is not None:
+            values = values[rows]
+
+        if kind == 'category':
+            return pd.Categorical.from_codes(values, categories=info['categories'])
+        if kind == 'datetime':
+            return pd.array(values.view(info['dtype']), copy=False)
+        if kind == 'period':
+            return pd.arrays.PeriodArray(values.view(np.int64), dtype=pd.api.types.pandas_dtype(info['dtype']))
+        return values
+
+    def brands(self):
+        """저장된 브랜드 목록"""
+        if BRAND_COLUMN not in self.meta['columns']:
+            return []
+        return sorted(self.meta['columns'][BRAND_COLUMN]['categories'])
+
+    def _rows_for_brand(self, brand):
+        """브랜드 행 위치 (브랜드별 1회 계산 후 재사용)"""
+        if brand not in self._brand_rows:
+            categories = self.meta['columns'][BRAND_COLUMN]['categories']
+            code = categories.index(brand) if brand in categories else -2
+            self._brand_rows[brand] = np.flatnonzero(self._load(BRAND_COLUMN, 'codes') == code)
+        return self._brand_rows[brand]
+
+    def read(self, brand=None, columns=None, year_months=None):
+        """필요한 행(브랜드/연월)과 컬럼만 DataFrame으로 반환"""
+        if columns is None:
+            columns = self.columns
+        columns = [col for col in dict.fromkeys(columns) if col in self.columns]
+
+        rows = None
+        if brand is not None:
+            rows = self._rows_for_brand(brand)
+        if year_months is not None and MONTH_COLUMN in self.columns:
+            ordinals = pd.PeriodIndex([str(m) for m in year_months], freq='M').asi8
+            month_rows = np.flatnonzero(np.isin(self._load(MONTH_COLUMN, 'values'), ordinals))
+            rows = month_rows if rows is None else np.intersect1d(rows, month_rows)
+
+        return pd.DataFrame({col: self._column(col, rows) for col in columns}, copy=False)
@@ -0,0 +1,159 @@
+"""
+브랜드 × 연월 파티션 리뷰 저장소
+전처리된 리뷰를 hive 스타일 Parquet 파티션(브랜드명=.../YEAR_MONTH=...)으로 저장하고
+필요한 파티션과 컬럼만 읽어오는 저장소
+"""
+
+import os
+import json
+import shutil
+import argparse
+from urllib.parse import unquote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+
+BRAND_COLUMN = '브랜드명'
+MONTH_PARTITION_COLUMN = 'YEAR_MONTH'
+PARTITION_COLUMNS = [BRAND_COLUMN, MONTH_PARTITION_COLUMN]
+
+# 날짜가 없는 리뷰의 연월 파티션 값
+UNKNOWN_MONTH = '미상'
+UNKNOWN_BRAND = '미상'
+
+# 적재 시 품질 리포트와 격리 행 (밑줄 접두어 파일은 데이터셋 탐색에서 제외됨)
+QUALITY_REPORT_FILE = '_quality_report.json'
+QUARANTINE_FILE = '_quarantine.parquet'
+
+
+def _partition_frame(df):
+    """파티션 키 컬럼을 문자열로 정리한 저장용 DataFrame"""
+    out = df.copy()
+    if BRAND_COLUMN in out.columns:
+        out[BRAND_COLUMN] = out[BRAND_COLUMN].astype(str).where(out[BRAND_COLUMN].notna(), UNKNOWN_BRAND)
+    else:
+        out[BRAND_COLUMN] = UNKNOWN_BRAND
+
+    if MONTH_PARTITION_COLUMN in out.columns:
+        year_month = out[MONTH_PARTITION_COLUMN].astype(str)
+        out[MONTH_PARTITION_COLUMN] = year_month.where(out[MONTH_PARTITION_COLUMN].notna(), UNKNOWN_MONTH)
+    else:
+        out[MONTH_PARTITION_COLUMN] = UNKNOWN_MONTH
+    return out
+
+
+def write_partitioned(df, root, overwrite=True):
+    """전처리된 리뷰를 브랜드/연월 파티션으로 저장"""
+    if overwrite and os.path.isdir(root):
+        shutil.rmtree(root)
+
+    table = pa.Table.from_pandas(_partition_frame(df), preserve_index=False)
+    ds.write_dataset(
+        table,
+        root,
+        format='parquet',
+        partitioning=PARTITION_COLUMNS,
+        partitioning_flavor='hive',
+        existing_data_behavior='overwrite_or_ignore',
+    )
+    return root
+
+
+def ingest_csv(csv_path, root, category='토너', rescorer=None):
+    """원본 CSV를 전처리(품질 검증·격리, 선택적으로 감성 재채점) 후 파티션 저장소로 적재"""
+    from analysis import ReviewInsightAnalysis
+
+    analysis = ReviewInsightAnalysis(csv_path, category=category, projection=False, rescorer=rescorer)
+    if analysis.rescore_report:
+        print(f"감성 재채점: {analysis.rescore_report}")
+    write_partitioned(analysis.original_df, root)
+
+    report = analysis.quality_report
+    with open(os.path.join(root, QUALITY_REPORT_FILE), 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    if len(analysis.quarantine):
+        analysis.quarantine.to_parquet(os.path.join(root, QUARANTINE_FILE), index=False)
+    print(
+        f"품질 검증: {report['rows']:,}행 중 {report['quarantined_rows']:,}행 격리 "
+        f"(날짜 파싱 실패 {report['date_parse_failures']:,} · REVIEW_ID 중복 {report['duplicate_review_ids']:,} · "
+        f"사전 위반 {sum(report['invalid_vocabulary'].values()):,})"
+    )
+    return root
+
+
+def is_partitioned_store(path):
+    """브랜드 파티션 디렉터리를 가진 저장소인지 확인"""
+    if not os.path.isdir(path):
+        return False
+    return any(name.startswith(f'{BRAND_COLUMN}=') for name in os.listdir(path))
+
+
+class PartitionedReviewStore:
+    """브랜드/연월 파티션과 컬럼 단위로 읽는 리뷰 저장소"""
+
+    def __init__(self, root):
+        self.root = root
+        self.dataset = ds.dataset(root, format='parquet', partitioning='hive')
+        self.columns = self.dataset.schema.names
+        self.quality_report = None
+        report_path = os.path.join(root, QUALITY_REPORT_FILE)
+        if os.path.exists(report_path):
+            with open(report_path, encoding='utf-8') as f:
+                self.quality_report = json.load(f)
+
+    def brands(self):
+        """저장된 브랜드 목록 (디렉터리 이름만 조회)"""
+        prefix = f'{BRAND_COLUMN}='
+        return sorted(
+            unquote(name[len(prefix):])
+            for name in os.listdir(self.root)
+            if name.startswith(prefix)
+        )
+
+    def read(self, brand=None, columns=None, year_months=None):
+        """필요한 파티션(브랜드/연월)과 컬럼만 읽어 DataFrame으로 반환"""
+        if columns is None:
+            columns = self.columns
+        columns = [col for col in dict.fromkeys(columns) if col in self.columns]
+
+        predicate = None
+        if brand is not None:
+            predicate = ds.field(BRAND_COLUMN) == brand
+        if year_months is not None:
+            month_filter = ds.field(MONTH_PARTITION_COLUMN).isin([str(m) for m in year_months])
+            predicate = month_filter if predicate is None else predicate & month_filter
+
+        table = self.dataset.to_table(columns=columns, filter=predicate)
+        df = table.to_pandas()
+
+        # 파티션 키는 dictionary 타입으로 읽히므로 분석 코드와 같은 형태로 복원
+        if BRAND_COLUMN in df.columns:
+            df[BRAND_COLUMN] = df[BRAND_COLUMN].astype(str)
+        if MONTH_PARTITION_COLUMN in df.columns:
+            year_month = df[MONTH_PARTITION_COLUMN].astype(str)
+            df[MONTH_PARTITION_COLUMN] = pd.PeriodIndex(
+                year_month.where(year_month != UNKNOWN_MONTH), freq='M'
+            )
+        return df
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='리뷰 CSV를 브랜드/연월 파티션 저장소로 적재')
+    parser.add_argument('csv_path', nargs='+', help='원본 리뷰 CSV (파티션 파일 여러 개 가능)')
+    parser.add_argument('--out', required=True, help='저장소 경로 (예: data/올영리뷰_토너_store)')
+    parser.add_argument('--category', default='토너', help='카테고리명')
+    parser.add_argument('--rescore', choices=['fill', 'rescore'], help='감성 재채점 (fill: 빈 라벨만, rescore: 전체)')
+    parser.add_argument('--lexicon', help='감성 사전 JSON 경로 (미지정 시 기본 사전)')
+    args = parser.parse_args()
+
+    rescorer = None
+    if args.rescore:
+        from sentiment_scoring import LexiconScorer, SentimentRescorer
+        scorer = LexiconScorer.from_file(args.lexicon) if args.lexicon else LexiconScorer()
+        rescorer = SentimentRescorer(scorer, mode=args.rescore)
+
+    csv_path = args.csv_path if len(args.csv_path) > 1 else args.csv_path[0]
+    ingest_csv(csv_path, args.out, category=args.category, rescorer=rescorer)
+    print(f"적재 완료: {args.out}")
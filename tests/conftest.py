@@ -0,0 +1,27 @@
+"""
+테스트 공용 설정
+저장소 루트 모듈 import 경로, 고정 데이터셋 분석 객체 fixture, 성능 기준값 갱신 옵션
+"""
+
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(TESTS_DIR))
+sys.path.insert(0, TESTS_DIR)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--update-perf-baseline', action='store_true', default=False,
+        help='성능 테스트 측정값으로 tests/perf_baseline.json 갱신'
+    )
+
+
+@pytest.fixture(scope='session')
+def golden(tmp_path_factory):
+    """고정 합성 데이터셋을 CSV 로드 경로로 읽은 분석 객체"""
+    from golden_data import golden_analysis
+    return golden_analysis(str(tmp_path_factory.mktemp('golden')))
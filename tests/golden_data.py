@@ -0,0 +1,143 @@
+"""
+테스트용 고정 합성 리뷰 데이터셋
+표준 라이브러리 random(시드 고정)으로 생성해 라이브러리 버전과 무관하게 항상 같은 데이터를 만들고,
+분석 결과 기대값은 golden/expected.json에 저장
+
+    python tests/golden_data.py --update   # 분석 로직을 의도적으로 바꾼 뒤 기대값 갱신
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+
+import pandas as pd
+
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+EXPECTED_PATH = os.path.join(TESTS_DIR, 'golden', 'expected.json')
+
+GOLDEN_SEED = 20240601
+GOLDEN_ROWS = 1200
+
+BRANDS = ['라운드랩', '토리든', '아누아']
+SENTIMENTS = ['POSITIVE', 'POSITIVE', 'NEUTRAL', 'NEGATIVE']
+SENTIMENT_COLUMNS = [
+    'OVERALL_SENTIMENT', 'ABSORPTION_SENTIMENT', 'FINISH_SENTIMENT', 'MOISTURE_SENTIMENT',
+    'TEXTURE_SENTIMENT', 'SCENT_SENTIMENT', 'IRRITATION_SENTIMENT', 'SOOTHING_SENTIMENT'
+]
+TEXTURES = ['물같음', '묽음', '점성', '쫀쫀']
+IRRITATIONS = ['없음', '없음', '없음', '따가움', '트러블', None]
+SKIN_TYPES = ['지성', '건성', '복합성', '민감성', None]
+PURCHASE_TYPES = ['첫구매', '신규', '재구매', '재구매', None]
+SUMMARIES = [
+    '흡수가 빨라요', '무난하게 쓰기 좋아요', '가성비 최고', '향이 조금 강해요',
+    '보습이 부족해요', '산뜻하게 마무리돼요', '가성비는 좋은데 무난해요', None
+]
+
+# 검증 단계에서 격리되어야 하는 행 (날짜 파싱 실패 2, REVIEW_ID 중복 1, 감성 사전 위반 1)
+BAD_DATE_ROWS = {7: 'not-a-date', 311: '2024-02-30'}
+DUPLICATE_ROW = (42, 900)
+INVALID_LABEL_ROW = (555, 'FINISH_SENTIMENT', 'GREAT')
+# 정규화 대상 (격리되지 않고 대문자/공백 제거로 보정)
+LOWERCASE_ROWS = {12: ' positive', 13: 'negative '}
+
+
+def build_golden_reviews():
+    """고정 합성 리뷰 DataFrame (원본 CSV와 같은 형태)"""
+    rng = random.Random(GOLDEN_SEED)
+    rows = []
+    for i in range(GOLDEN_ROWS):
+        month = i % 12 + 1
+        day = rng.randint(1, 28)
+        year = 2023 + (i // 12) % 2
+        # 여름에는 보습/마무리 부정이 늘도록 편향
+        summer = month in (6, 7, 8)
+        row = {
+            'REVIEW_ID': 100000 + i,
+            'REVIEWER_ID': 5000 + rng.randint(0, 399),
+            '리뷰등록일': f'{year}-{month:02d}-{day:02d}',
+            '브랜드명': BRANDS[i % len(BRANDS)],
+        }
+        for col in SENTIMENT_COLUMNS:
+            choices = SENTIMENTS + (['NEGATIVE'] if summer and col in ('MOISTURE_SENTIMENT', 'FINISH_SENTIMENT') else [])
+            row[col] = None if rng.random() < 0.08 else rng.choice(choices)
+        row['TEXTURE_VALUE'] = rng.choice(TEXTURES)
+        row['IRRITATION_VALUE'] = rng.choice(IRRITATIONS)
+        row['SKIN_TYPE_FINAL'] = rng.choice(SKIN_TYPES)
+        row['PURCHASE_TYPE'] = rng.choice(PURCHASE_TYPES)
+        row['ONE_LINE_SUMMARY'] = rng.choice(SUMMARIES)
+        rows.append(row)
+
+    for i, value in BAD_DATE_ROWS.items():
+        rows[i]['리뷰등록일'] = value
+    source, target = DUPLICATE_ROW
+    rows[target]['REVIEW_ID'] = rows[source]['REVIEW_ID']
+    i, col, value = INVALID_LABEL_ROW
+    rows[i][col] = value
+    for i, value in LOWERCASE_ROWS.items():
+        rows[i]['OVERALL_SENTIMENT'] = value
+    return pd.DataFrame(rows)
+
+
+def write_golden_csv(path):
+    build_golden_reviews().to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+
+# ===== 기대값 직렬화 =====
+def encode_result(result):
+    """분석 결과(DataFrame/튜플/dict) → JSON 직렬화 가능한 값"""
+    if isinstance(result, tuple):
+        return {'tuple': [encode_result(part) for part in result]}
+    if isinstance(result, dict):
+        return {'dict': {key: (int(value) if hasattr(value, 'item') else value) for key, value in result.items()}}
+    return {
+        'frame': {
+            'index': [float(v) for v in result.index],
+            'columns': [str(c) for c in result.columns],
+            'data': [[None if pd.isna(v) else float(v) for v in row] for row in result.to_numpy()],
+        }
+    }
+
+
+def decode_frame(encoded):
+    frame = encoded['frame']
+    return pd.DataFrame(frame['data'], index=frame['index'], columns=frame['columns'], dtype=float)
+
+
+def golden_analysis(tmp_dir):
+    """고정 데이터셋 CSV를 실제 로드 경로(검증·전처리 포함)로 읽은 분석 객체"""
+    sys.path.insert(0, os.path.dirname(TESTS_DIR))
+    from analysis import ReviewInsightAnalysis
+    return ReviewInsightAnalysis(write_golden_csv(os.path.join(tmp_dir, '올영리뷰_테스트.csv')), category='테스트')
+
+
+def compute_expected(analysis):
+    """전체/브랜드별 × 메서드별 결과"""
+    from analysis import IDEA_METHODS
+    expected = {}
+    for product in ['전체'] + BRANDS:
+        view = analysis.for_product(product)
+        for method in IDEA_METHODS + ['get_monthly_attribute_sentiment_table', 'get_summary']:
+            expected[f'{product}/{method}'] = encode_result(getattr(view, method)())
+    return expected
+
+
+if __name__ == '__main__':
+    import tempfile
+
+    parser = argparse.ArgumentParser(description='고정 합성 데이터셋 기대값 생성')
+    parser.add_argument('--update', action='store_true', help='golden/expected.json 덮어쓰기')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        expected = compute_expected(golden_analysis(tmp_dir))
+    if args.update:
+        os.makedirs(os.path.dirname(EXPECTED_PATH), exist_ok=True)
+        with open(EXPECTED_PATH, 'w', encoding='utf-8') as f:
+            json.dump(expected, f, ensure_ascii=False, indent=1, sort_keys=True)
+        print(f"기대값 갱신: {EXPECTED_PATH} ({len(expected)}개)")
+    else:
+        print(f"{len(expected)}개 결과 계산 (--update로 저장)")
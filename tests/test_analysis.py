@@ -0,0 +1,142 @@
+"""
+분석 결과 정확성 테스트
+고정 합성 데이터셋의 10가지 인사이트·월별 속성 테이블·요약을 저장된 기대값과 비교하고,
+주요 지표는 원본 행에서 직접 다시 세어 확인
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import ReviewInsightAnalysis, IDEA_METHODS
+from masks import mask_cache
+from golden_data import (
+    EXPECTED_PATH, BRANDS, GOLDEN_ROWS, BAD_DATE_ROWS, DUPLICATE_ROW, INVALID_LABEL_ROW, SENTIMENT_COLUMNS,
+    build_golden_reviews, encode_result, decode_frame
+)
+
+
+with open(EXPECTED_PATH, encoding='utf-8') as f:
+    EXPECTED = json.load(f)
+
+METHODS = IDEA_METHODS + ['get_monthly_attribute_sentiment_table', 'get_summary']
+QUARANTINED = set(BAD_DATE_ROWS) | {DUPLICATE_ROW[1], INVALID_LABEL_ROW[0]}
+
+
+def _assert_matches(result, expected):
+    if 'tuple' in expected:
+        assert len(result) == len(expected['tuple'])
+        for part, expected_part in zip(result, expected['tuple']):
+            _assert_matches(part, expected_part)
+    elif 'dict' in expected:
+        assert encode_result(result)['dict'] == expected['dict']
+    else:
+        pd.testing.assert_frame_equal(decode_frame(encode_result(result)), decode_frame(expected), atol=1e-9)
+
+
+@pytest.fixture(scope='module')
+def reference():
+    """검증 단계 이후와 같은 정리 규칙을 pandas로 직접 적용한 원본 (독립 재계산용)"""
+    df = build_golden_reviews().drop(index=sorted(QUARANTINED)).reset_index(drop=True)
+    df['MONTH'] = pd.to_datetime(df['리뷰등록일']).dt.month
+    for col in SENTIMENT_COLUMNS:
+        df[col] = df[col].str.strip().str.upper()
+    for col in ['OVERALL_SENTIMENT', 'ABSORPTION_SENTIMENT', 'FINISH_SENTIMENT', 'MOISTURE_SENTIMENT', 'SCENT_SENTIMENT']:
+        df[col] = df[col].fillna('NEUTRAL')
+    return df
+
+
+@pytest.mark.parametrize('method', METHODS)
+@pytest.mark.parametrize('product', ['전체'] + BRANDS)
+def test_matches_golden(golden, product, method):
+    result = getattr(golden.for_product(product), method)()
+    _assert_matches(result, EXPECTED[f'{product}/{method}'])
+
+
+def test_validation_quarantines_bad_rows(golden):
+    report = golden.quality_report
+    assert report['rows'] == GOLDEN_ROWS
+    assert report['date_parse_failures'] == len(BAD_DATE_ROWS)
+    assert report['duplicate_review_ids'] == 1
+    assert report['invalid_vocabulary'] == {INVALID_LABEL_ROW[1]: 1}
+    assert report['quarantined_rows'] == len(QUARANTINED)
+    assert len(golden.original_df) == GOLDEN_ROWS - len(QUARANTINED)
+    assert set(golden.original_df['OVERALL_SENTIMENT'].unique()) <= {'POSITIVE', 'NEUTRAL', 'NEGATIVE'}
+
+
+def test_lazy_columns_stay_aligned(golden, reference):
+    view = golden.for_product('전체')
+    view.ensure_columns(['ONE_LINE_SUMMARY'])
+    assert view.df['REVIEW_ID'].tolist() == reference['REVIEW_ID'].tolist()
+    assert view.df['ONE_LINE_SUMMARY'].fillna('').tolist() == reference['ONE_LINE_SUMMARY'].fillna('').tolist()
+
+
+def test_idea1_recounted(golden, reference):
+    result = golden.for_product('전체').idea1_absorption_repurchase()
+    repurchase = reference[reference['PURCHASE_TYPE'].fillna('').str.contains('재구매')]
+    for month, group in repurchase.groupby('MONTH'):
+        assert result.loc[month, '총 재구매 리뷰'] == len(group)
+        expected = round((group['ABSORPTION_SENTIMENT'] == 'POSITIVE').sum() / len(group) * 100, 2)
+        assert result.loc[month, '흡수 긍정 비율'] == pytest.approx(expected)
+
+
+def test_idea3_recounted(golden, reference):
+    result = golden.for_product('전체').idea3_moisture_summer_dissatisfaction()
+    for month, group in reference.groupby('MONTH'):
+        negative = ((group['MOISTURE_SENTIMENT'] == 'NEGATIVE') | (group['OVERALL_SENTIMENT'] == 'NEGATIVE')).sum()
+        assert result.loc[month, '보습/전체 부정 리뷰'] == negative
+        assert result.loc[month, '비율'] == pytest.approx(round(negative / len(group) * 100, 2))
+
+
+def test_idea8_ignores_missing_irritation(golden, reference):
+    result = golden.for_product('전체').idea8_irritation_spike()
+    issue = reference['IRRITATION_VALUE'].notna() & (reference['IRRITATION_VALUE'] != '없음')
+    expected = reference[issue].groupby('MONTH').size()
+    assert result['자극이슈'].sum() == issue.sum()
+    assert result['자극이슈'].astype(int).to_dict() == expected.to_dict()
+
+
+def test_idea8_missing_value_is_not_an_issue():
+    df = pd.DataFrame({'MONTH': [1, 1, 1, 2], 'IRRITATION_VALUE': ['없음', None, '따가움', None]})
+    result = ReviewInsightAnalysis.from_frame(df).idea8_irritation_spike()
+    assert result.loc[1, '자극이슈'] == 1
+    assert result.loc[1, '비율'] == pytest.approx(33.33)
+
+
+def test_attribute_table_recounted(golden, reference):
+    table = golden.for_product(BRANDS[0]).get_monthly_attribute_sentiment_table()
+    brand = reference[reference['브랜드명'] == BRANDS[0]]
+    for month in range(1, 13):
+        group = brand[brand['MONTH'] == month]
+        expected = round((group['ABSORPTION_SENTIMENT'] == 'POSITIVE').sum() / len(group) * 100, 2) if len(group) else 0
+        assert table.loc[month, '흡수'] == pytest.approx(expected)
+
+
+def test_summary_recounted(golden, reference):
+    summary = golden.for_product('전체').get_summary()
+    assert summary['total_reviews'] == len(reference)
+    positive = (reference['OVERALL_SENTIMENT'] == 'POSITIVE').mean() * 100
+    assert summary['positive_ratio'] == f"{positive:.2f}%"
+    assert summary['date_range'].startswith('2023-01-')
+
+
+def test_mask_cache_matches_uncached(golden):
+    cached = golden.for_product(BRANDS[1])
+    cached.dataset_version = 'golden-test'
+    uncached = golden.for_product(BRANDS[1])
+    uncached.dataset_version = None
+    try:
+        for _ in range(2):
+            for method in IDEA_METHODS:
+                _assert_matches(getattr(cached, method)(), encode_result(getattr(uncached, method)()))
+        assert mask_cache.stats()['hits'] > 0
+    finally:
+        mask_cache.invalidate(golden.category, 'golden-test')
+
+
+def test_idea_outputs_cover_all_months(golden):
+    result = golden.for_product('전체').idea9_value_for_money_buffering()
+    assert list(result.index) == list(range(1, 13))
+    assert np.all(result.to_numpy() >= 0)
@@ -0,0 +1,129 @@
+"""
+인사이트 API 테스트
+동시에 들어온 같은 요청이 한 번만 계산되어 결과를 공유하는지, 파라미터 검증과 HTTP 응답 코드 확인
+"""
+
+import json
+import asyncio
+import threading
+
+import pytest
+
+from api import MAX_LIMIT, ApiError, InsightServer, InsightService
+from catalog import DatasetCatalog
+from golden_data import BRANDS, write_golden_csv
+from test_analysis import EXPECTED
+
+
+class SlowService:
+    """호출 횟수를 세고, release 전까지 계산을 붙잡아 두는 가짜 서비스"""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def summary(self, params):
+        with self._lock:
+            self.calls += 1
+        self.release.wait(5)
+        if self.fail:
+            raise RuntimeError('계산 실패')
+        return {'product': params.get('product', ['전체'])[0], 'call': self.calls}
+
+
+async def _concurrent(server, service, requests):
+    tasks = [asyncio.ensure_future(server.compute(path, query)) for path, query in requests]
+    # 모든 요청이 진행 중 목록에 등록된 뒤 계산을 풀어 줌
+    while service.calls == 0:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    service.release.set()
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def test_identical_requests_are_coalesced():
+    service = SlowService()
+    server = InsightServer(service, workers=4)
+    requests = [('/summary', 'product=A&category=x')] * 6 + [('/summary/', 'category=x&product=A')]
+    results = asyncio.run(_concurrent(server, service, requests))
+    assert service.calls == 1
+    assert all(result == results[0] for result in results)
+    assert server._inflight == {}
+
+
+def test_distinct_requests_run_separately():
+    service = SlowService()
+    server = InsightServer(service, workers=4)
+    results = asyncio.run(_concurrent(server, service, [('/summary', 'product=A'), ('/summary', 'product=B')]))
+    assert service.calls == 2
+    assert [result['product'] for result in results] == ['A', 'B']
+
+
+def test_failure_is_shared_and_not_cached():
+    service = SlowService(fail=True)
+    server = InsightServer(service, workers=4)
+    results = asyncio.run(_concurrent(server, service, [('/summary', 'product=A')] * 3))
+    assert service.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert server._inflight == {}
+
+    service.fail = False
+    assert asyncio.run(server.compute('/summary', 'product=A'))['call'] == 2
+
+
+@pytest.fixture(scope='module')
+def service(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp('api')
+    write_golden_csv(str(data_dir / '올영리뷰_테스트.csv'))
+    return InsightService(DatasetCatalog(str(data_dir)))
+
+
+def test_summary_matches_analysis(service):
+    result = service.summary({'product': [BRANDS[0]]})
+    assert result['category'] == '테스트' and result['product'] == BRANDS[0]
+    assert result['summary'] == EXPECTED[f'{BRANDS[0]}/get_summary']['dict']
+
+
+@pytest.mark.parametrize('raw, expected', [('0', 1), ('-5', 1), ('7', 7), (str(MAX_LIMIT * 10), MAX_LIMIT)])
+def test_reviews_limit_is_clamped(service, raw, expected):
+    result = service.reviews({'limit': [raw]})
+    assert result['limit'] == expected
+    assert len(result['result']) == min(expected, result['total'])
+
+
+@pytest.mark.parametrize('params', [{'limit': ['many']}, {'offset': ['1.5']}, {'month': ['6,여름']}])
+def test_reviews_rejects_non_integers(service, params):
+    with pytest.raises(ApiError) as error:
+        service.reviews(params)
+    assert error.value.status == 400
+
+
+def test_http_status_codes(service):
+    async def request(port, target, method='GET'):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(f'{method} {target} HTTP/1.1\r\nHost: test\r\n\r\n'.encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, body = response.split(b'\r\n\r\n', 1)
+        return int(head.split()[1]), json.loads(body)
+
+    async def scenario():
+        server = InsightServer(service)
+        listener = await asyncio.start_server(server.handle, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            return [
+                await request(port, '/ideas/1?product=' + BRANDS[1]),
+                await request(port, '/ideas/11'),
+                await request(port, '/reviews?limit=x'),
+                await request(port, '/summary?category=없음'),
+                await request(port, '/summary', method='POST'),
+            ]
+
+    responses = asyncio.run(scenario())
+    assert [status for status, _ in responses] == [200, 404, 400, 404, 405]
+    assert responses[0][1]['method'] == 'idea1_absorption_repurchase'
+    assert 'error' in responses[2][1]
@@ -0,0 +1,116 @@
+"""
+근사 질의 모드 테스트
+층화 표본이 층별 비례 배분을 지키는지, 표본 추정의 95% 오차 범위가 정확한 값을 포함하는지 확인
+"""
+
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import ReviewInsightAnalysis
+from approximate import ApproximateEngine, STRATA_COLUMNS, stratified_sample
+
+
+ROWS = 60_000
+IDEA3 = 'idea3_moisture_summer_dissatisfaction'
+
+
+@pytest.fixture(scope='module')
+def population():
+    """월별로 부정 비율이 다른 합성 모집단 (브랜드 2 × 월 12 × 구매 유형 2 층)"""
+    rng = np.random.default_rng(7)
+    month = rng.integers(1, 13, ROWS)
+    negative_rate = np.where(np.isin(month, [6, 7, 8]), 0.35, 0.15)
+    return pd.DataFrame({
+        '브랜드명': rng.choice(['라운드랩', '토리든'], ROWS, p=[0.7, 0.3]),
+        'MONTH': month,
+        'PURCHASE_TYPE': rng.choice(['재구매', '첫구매'], ROWS),
+        'OVERALL_SENTIMENT': np.where(rng.random(ROWS) < negative_rate, 'NEGATIVE', 'POSITIVE'),
+        'MOISTURE_SENTIMENT': rng.choice(['POSITIVE', 'NEUTRAL', 'NEGATIVE'], ROWS, p=[0.6, 0.3, 0.1]),
+    })
+
+
+def test_stratified_sample_is_proportional(population):
+    fraction = 0.05
+    positions = stratified_sample(population, fraction, seed=3)
+    assert np.all(np.diff(positions) > 0)
+
+    sizes = population.groupby(STRATA_COLUMNS).size()
+    sampled = population.iloc[positions].groupby(STRATA_COLUMNS).size().reindex(sizes.index, fill_value=0)
+    expected = sizes * fraction
+    assert np.all(sampled >= np.floor(expected)) and np.all(sampled <= np.ceil(expected))
+    assert abs(len(positions) - len(population) * fraction) <= len(sizes)
+
+
+def test_stratified_sample_is_seeded(population):
+    first = stratified_sample(population, 0.05, seed=11)
+    np.testing.assert_array_equal(first, stratified_sample(population, 0.05, seed=11))
+    assert not np.array_equal(first, stratified_sample(population, 0.05, seed=12))
+
+
+def _estimate(analysis, seed, method):
+    engine = ApproximateEngine(analysis, seed=seed)
+    # 정확한 결과 계산이 끝나지 않은 상태로 고정해 항상 표본 추정을 받음
+    engine._exact_future = lambda product, method: Future()
+    try:
+        return engine.query('전체', method)
+    finally:
+        engine.close()
+
+
+def test_bounds_cover_exact_values(population):
+    analysis = ReviewInsightAnalysis.from_frame(population, category='근사')
+    exact = analysis.for_product('전체').idea3_moisture_summer_dissatisfaction()
+    exact_summary = analysis.for_product('전체').get_summary()
+
+    covered, total = 0, 0
+    summary_covered = 0
+    seeds = range(20)
+    for seed in seeds:
+        answer = _estimate(analysis, seed, IDEA3)
+        assert not answer.is_exact and 0 < answer.fraction < 1
+        for col in ['보습/전체 부정 리뷰', '비율']:
+            error = (answer.value[col] - exact[col]).abs().reindex(exact.index)
+            covered += int((error <= answer.bounds[col].reindex(exact.index)).sum())
+            total += len(exact)
+
+        summary = _estimate(analysis, seed, 'get_summary')
+        estimate = float(summary.value['positive_ratio'].rstrip('%'))
+        actual = float(exact_summary['positive_ratio'].rstrip('%'))
+        summary_covered += abs(estimate - actual) <= summary.bounds['positive_ratio']
+
+    # 95% 신뢰구간: 월 × 지표 × 시드 단위 포함률이 명목 수준에 가까워야 함
+    assert covered / total >= 0.88
+    assert summary_covered / len(seeds) >= 0.85
+
+
+def test_small_product_uses_full_data(population):
+    small = population[population['브랜드명'] == '토리든'].head(500)
+    analysis = ReviewInsightAnalysis.from_frame(small, category='근사-소형')
+    engine = ApproximateEngine(analysis)
+    try:
+        sample, fraction = engine.sample_frame('전체')
+    finally:
+        engine.close()
+    assert fraction == 1.0 and len(sample) == len(small)
+
+
+def test_queries_reuse_materialized_sample(population):
+    analysis = ReviewInsightAnalysis.from_frame(population, category='근사-재사용')
+    engine = ApproximateEngine(analysis)
+    engine._exact_future = lambda product, method: Future()
+    try:
+        first = engine.query('전체', IDEA3)
+        # 표본을 만든 뒤의 질의는 제품 전체 데이터(for_product 뷰)를 다시 읽지 않음
+        reads = []
+        for_product = analysis.for_product
+        analysis.for_product = lambda product: reads.append(product) or for_product(product)
+        again = engine.query('전체', IDEA3)
+        engine.query('전체', 'get_summary')
+        engine.overview('전체')
+    finally:
+        engine.close()
+    assert reads == []
+    pd.testing.assert_frame_equal(first.value, again.value)
@@ -0,0 +1,131 @@
+"""
+데이터셋 카탈로그 테스트
+상주 한도를 넘으면 가장 오래 안 쓴 카테고리를 해제하면서 그 카테고리의 공유 마스크도 비우는지,
+파일이 바뀌면 refresh로 언로드되는지, 같은 카테고리 동시 요청은 한 번만 로드하는지 확인
+"""
+
+import os
+import time
+import threading
+
+import pytest
+
+from catalog import DatasetCatalog, discover_datasets
+from golden_data import BRANDS, write_golden_csv
+from masks import mask_cache
+
+
+CATEGORIES = ['가', '나', '다']
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    for category in CATEGORIES:
+        write_golden_csv(str(tmp_path / f'올영리뷰_{category}.csv'))
+    return tmp_path
+
+
+def _cached_keys(category):
+    with mask_cache._lock:
+        return [key for key in mask_cache._entries if key[0] == category]
+
+
+def _warm(catalog, category):
+    """인사이트 1개를 계산해 공유 마스크 캐시를 채움"""
+    analysis = catalog.get(category)
+    analysis.for_product(BRANDS[0]).idea1_absorption_repurchase()
+    assert _cached_keys(category)
+    return analysis
+
+
+def test_discover_datasets(data_dir):
+    (data_dir / '올영리뷰_라_1.csv').write_text('x')
+    (data_dir / '올영리뷰_라_2.csv').write_text('x')
+    (data_dir / 'notes.txt').write_text('x')
+    datasets = discover_datasets(str(data_dir))
+    assert list(datasets) == sorted(CATEGORIES + ['라'])
+    assert [os.path.basename(p) for p in datasets['라']] == ['올영리뷰_라_1.csv', '올영리뷰_라_2.csv']
+
+
+def test_lru_eviction_invalidates_masks(data_dir):
+    catalog = DatasetCatalog(str(data_dir), max_resident=2)
+    try:
+        first = _warm(catalog, '가')
+        _warm(catalog, '나')
+        # '가'를 다시 사용해 최근 사용으로 올리면 '나'가 가장 오래된 항목
+        assert catalog.get('가') is first
+        _warm(catalog, '다')
+
+        assert catalog.resident_categories() == ['가', '다']
+        assert _cached_keys('나') == []
+        assert _cached_keys('가') and _cached_keys('다')
+
+        # 해제된 카테고리는 다음 요청에서 새로 로드
+        reloaded = catalog.get('나')
+        assert reloaded is not first and catalog.resident_categories() == ['다', '나']
+        assert _cached_keys('가') == []
+    finally:
+        mask_cache.invalidate()
+
+
+def test_refresh_unloads_changed_files(data_dir):
+    catalog = DatasetCatalog(str(data_dir))
+    try:
+        analysis = _warm(catalog, '가')
+        unchanged = catalog.get('나')
+        path = data_dir / '올영리뷰_가.csv'
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        catalog.refresh()
+        assert catalog.resident_categories() == ['나']
+        assert _cached_keys('가') == []
+        reloaded = catalog.get('가')
+        assert reloaded is not analysis and reloaded.dataset_version != analysis.dataset_version
+        assert catalog.get('나') is unchanged
+    finally:
+        mask_cache.invalidate()
+
+
+def test_concurrent_get_loads_once(data_dir):
+    catalog = DatasetCatalog(str(data_dir))
+    loads = []
+    load = catalog._load
+
+    def slow_load(category, source):
+        loads.append(category)
+        time.sleep(0.2)
+        return load(category, source)
+
+    catalog._load = slow_load
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(catalog.get('가'))) for _ in range(4)]
+    threads.append(threading.Thread(target=lambda: results.append(catalog.get('나'))))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(loads) == ['가', '나']
+    assert len({id(result) for result in results if result.category == '가'}) == 1
+    assert catalog._loading == {}
+
+
+def test_failed_load_is_retried(data_dir):
+    catalog = DatasetCatalog(str(data_dir))
+    load = catalog._load
+    attempts = []
+
+    def flaky_load(category, source):
+        attempts.append(category)
+        if len(attempts) == 1:
+            raise OSError('일시적 읽기 오류')
+        return load(category, source)
+
+    catalog._load = flaky_load
+    with pytest.raises(OSError):
+        catalog.get('가')
+    assert catalog.get('가').category == '가'
+    assert attempts == ['가', '가']
+    with pytest.raises(KeyError):
+        catalog.get('없음')
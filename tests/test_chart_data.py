@@ -0,0 +1,119 @@
+"""
+차트 데이터 레이어 테스트
+LTTB 다운샘플링·구간 집계가 첫/끝 포인트와 포인트 예산을 지키는지, Figure 캐시가 적중 시 Figure를 다시 만들지 않는지 확인
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from chart_data import (
+    MAX_HEATMAP_ROWS, FigureCache, lttb_indices, bin_series, bin_heatmap, bounded_figure, data_fingerprint
+)
+
+
+@pytest.mark.parametrize('n, n_out', [(10_000, 500), (1_001, 3), (5_000, 4_999), (777, 100)])
+def test_lttb_keeps_endpoints_within_budget(n, n_out):
+    rng = np.random.default_rng(n)
+    x = np.sort(rng.random(n)) * 1000
+    y = np.cumsum(rng.normal(size=n))
+    idx = lttb_indices(x, y, n_out)
+    assert len(idx) == n_out
+    assert idx[0] == 0 and idx[-1] == n - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_lttb_keeps_spike():
+    y = np.zeros(10_000)
+    y[4_321] = 100.0
+    idx = lttb_indices(np.arange(len(y)), y, 200)
+    assert 4_321 in idx
+
+
+def test_lttb_small_input_unchanged():
+    assert lttb_indices(np.arange(50), np.arange(50), 100).tolist() == list(range(50))
+
+
+def test_bin_series_respects_budget_and_ignores_nan():
+    x = pd.date_range('2024-01-01', periods=1_000, freq='h').to_numpy()
+    y = np.arange(1_000, dtype=np.float64)
+    y[:5] = np.nan
+    y[10:20] = np.nan
+    bx, by = bin_series(x, y, 100)
+    assert len(bx) == len(by) <= 100
+    assert bx[0] == x[0]
+    # 구간 평균은 결측을 제외하고, 전부 결측인 구간은 NaN
+    assert by[0] == pytest.approx(7.0)
+    assert np.isnan(by[1])
+    assert by[2] == pytest.approx(24.5)
+
+
+def test_bin_series_leaves_categorical_axis():
+    x = np.array([f'브랜드{i}' for i in range(500)], dtype=object)
+    y = np.arange(500, dtype=np.float64)
+    bx, by = bin_series(x, y, 100)
+    assert len(bx) == 500
+    np.testing.assert_array_equal(by, y)
+
+
+def test_bin_heatmap_nanmean_and_budget():
+    z = np.arange(200 * 300, dtype=np.float64).reshape(200, 300)
+    z[:, 0] = np.nan
+    binned, x_labels, y_labels = bin_heatmap(z, np.arange(300), np.arange(200), max_cols=100)
+    assert binned.shape[0] <= MAX_HEATMAP_ROWS and binned.shape[1] <= 100
+    assert x_labels[0] == 0 and y_labels[0] == 0
+    assert not np.isnan(binned).any()
+
+    all_nan = np.full((4, 400), np.nan)
+    assert np.isnan(bin_heatmap(all_nan, None, None, max_cols=100)[0]).all()
+
+
+def test_bounded_figure_reduces_every_trace():
+    n = 20_000
+    fig = go.Figure([
+        go.Scatter(x=np.arange(n), y=np.sin(np.arange(n) / 100)),
+        go.Bar(x=np.arange(n), y=np.ones(n)),
+    ])
+    bounded = bounded_figure(fig, budget=400)
+    assert [len(trace.y) for trace in bounded.data] == [400, 400]
+    assert bounded.data[0].x[0] == 0 and bounded.data[0].x[-1] == n - 1
+    # 원본은 변경하지 않음
+    assert len(fig.data[0].y) == n
+
+
+def test_data_fingerprint_covers_values_index_and_params():
+    table = pd.DataFrame({'비율': [10.0, 20.0, 30.0]}, index=pd.Index([1, 2, 3], name='MONTH'))
+    changed = table.copy()
+    changed.iloc[1, 0] = 21.0
+    reindexed = table.set_axis([1, 2, 4])
+    renamed = table.rename(columns={'비율': '건수'})
+    fingerprints = {
+        data_fingerprint(table), data_fingerprint(changed), data_fingerprint(reindexed),
+        data_fingerprint(renamed), data_fingerprint(table, ['보습']), data_fingerprint((table, table))
+    }
+    assert len(fingerprints) == 6
+    assert data_fingerprint(table, ['보습']) == data_fingerprint(table.copy(), ['보습'])
+
+
+def test_figure_cache_builds_once_and_returns_same_object():
+    cache = FigureCache(max_entries=2)
+    builds = []
+
+    def build(n):
+        def make():
+            builds.append(n)
+            return go.Figure(go.Scatter(x=np.arange(n), y=np.arange(n)))
+        return make
+
+    first = cache.get(('idea1', 'v1'), build(5_000), budget=200)
+    assert len(first.data[0].y) == 200
+    # 적중 시 Figure 생성·JSON 변환 없이 저장된 축소 Figure를 그대로 반환
+    assert cache.get(('idea1', 'v1'), build(5_000), budget=200) is first
+    assert builds == [5_000] and cache.hits == 1
+
+    # 예산이 다르면 별도 항목, 한도를 넘으면 가장 오래 안 쓴 항목부터 해제
+    cache.get(('idea1', 'v1'), build(5_000), budget=300)
+    cache.get(('idea2', 'v1'), build(10), budget=200)
+    cache.get(('idea1', 'v1'), build(5_000), budget=200)
+    assert builds == [5_000, 5_000, 10, 5_000]
@@ -0,0 +1,85 @@
+"""
+재구매 코호트 엔진 테스트
+손으로 계산한 작은 데이터로 재구매 여부, 재구매까지 일수, 코호트 재방문 비율, 첫 리뷰 값별 재구매율 확인
+(한 리뷰어의 두 브랜드 리뷰, 같은 날 작성한 두 번째 리뷰 포함)
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cohort import PurchaseSequences
+
+
+# A: 브랜드 X → 한 달 뒤 브랜드 Y (브랜드별로는 재구매 아님)
+# B: 브랜드 X 같은 날 두 번 (재구매 아님)
+# C: 브랜드 X 같은 날 두 번 → 50일 뒤 재구매
+# D: 브랜드 Y → 10일 뒤 재구매
+# 리뷰어·날짜 결측 행은 제외
+REVIEWS = pd.DataFrame({
+    'reviewer': ['A', 'A', 'B', 'B', 'C', 'C', 'C', 'D', 'D', None, 'E'],
+    'date': ['2024-01-05', '2024-02-10', '2024-01-10', '2024-01-10', '2024-01-20', '2024-01-20',
+             '2024-03-10', '2024-02-03', '2024-02-13', '2024-01-01', None],
+    'brand': ['X', 'Y', 'X', 'X', 'X', 'X', 'X', 'Y', 'Y', 'X', 'X'],
+    'sentiment': ['POSITIVE', 'NEGATIVE', 'POSITIVE', 'NEUTRAL', 'NEGATIVE', 'POSITIVE', 'POSITIVE',
+                  'POSITIVE', 'NEGATIVE', 'NEGATIVE', 'NEGATIVE'],
+})
+
+
+@pytest.fixture
+def by_brand():
+    return PurchaseSequences(REVIEWS['reviewer'], REVIEWS['date'], REVIEWS['brand'])
+
+
+def test_sequences_split_by_brand(by_brand):
+    # 시퀀스 순서: A·X, A·Y, B·X, C·X, D·Y
+    assert by_brand.n_reviewers == 5
+    assert by_brand.n_distinct_reviewers == 4
+    assert by_brand.first_rows().tolist() == [0, 1, 2, 4, 7]
+    assert by_brand.repurchased().tolist() == [False, False, False, True, True]
+    np.testing.assert_array_equal(by_brand.days_to_repurchase(), [np.nan, np.nan, np.nan, 50, 10])
+
+
+def test_without_brand_other_brand_counts_as_repurchase():
+    sequences = PurchaseSequences(REVIEWS['reviewer'], REVIEWS['date'])
+    assert sequences.n_reviewers == 4
+    assert sequences.repurchased().tolist() == [True, False, True, True]
+    np.testing.assert_array_equal(sequences.days_to_repurchase(), [36, np.nan, 50, 10])
+
+
+def test_same_day_review_is_not_repurchase():
+    sequences = PurchaseSequences(['B', 'B', 'B'], ['2024-01-10 09:00', '2024-01-10 21:00', '2024-01-11 08:00'])
+    assert sequences.repurchased().tolist() == [True]
+    # 일수는 날짜 기준 (같은 날 두 번째 리뷰가 아닌 다음 날 리뷰까지)
+    assert sequences.days_to_repurchase().tolist() == [1.0]
+
+    single_day = PurchaseSequences(['B', 'B'], ['2024-01-10', '2024-01-10'])
+    assert single_day.repurchased().tolist() == [False]
+    assert np.isnan(single_day.days_to_repurchase()).all()
+
+
+def test_cohort_retention(by_brand):
+    retention = by_brand.cohort_retention()
+    # 1월 코호트: A·X, B·X, C·X (C·X만 +2개월에 재방문) / 2월 코호트: A·Y, D·Y (D·Y는 같은 달 재방문)
+    expected = pd.DataFrame(
+        {'코호트 리뷰어 수': [3, 2], '+0개월': [100.0, 100.0], '+2개월': [33.33, 0.0]},
+        index=pd.Index(['2024-01', '2024-02'], name='첫 구매 월')
+    )
+    pd.testing.assert_frame_equal(retention, expected, check_dtype=False, check_index_type=False)
+
+
+def test_repurchase_by_first_value(by_brand):
+    table = by_brand.repurchase_by_first_value(REVIEWS['sentiment'].to_numpy())
+    # 첫 리뷰 감성: A·X POSITIVE, A·Y NEGATIVE, B·X POSITIVE, C·X NEGATIVE(50일), D·Y POSITIVE(10일)
+    assert table.index.tolist() == ['NEGATIVE', 'POSITIVE']
+    assert table['리뷰어 수'].tolist() == [2, 3]
+    assert table['재구매 리뷰어 수'].tolist() == [1, 1]
+    assert table['재구매율'].tolist() == [50.0, 33.33]
+    assert table['재구매까지 일수(중앙값)'].tolist() == [50.0, 10.0]
+
+
+def test_empty_input():
+    sequences = PurchaseSequences(pd.Series([None], dtype=object), pd.Series([None], dtype=object))
+    assert sequences.n_reviewers == 0
+    assert sequences.repurchased().tolist() == []
+    assert sequences.cohort_retention().empty
@@ -0,0 +1,89 @@
+"""
+속성 동시발생 행렬 테스트
+희소 행렬 곱으로 계산한 그룹별 동시발생 수·향상도를 피처별 불리언 컬럼의 직접 교차 집계와 비교
+"""
+
+import numpy as np
+import pytest
+
+from cooccurrence import (
+    CATEGORY_FEATURES, SENTIMENT_FEATURES, SENTIMENT_LABELS, SUMMARY_COLUMN, SUMMARY_KEYWORDS,
+    CooccurrenceMatrix, build_feature_matrix, feature_columns
+)
+
+
+@pytest.fixture(scope='module')
+def frame(golden):
+    view = golden.for_product('전체')
+    view.ensure_columns(['MONTH'] + feature_columns())
+    return view.df
+
+
+def _feature_indicators(df):
+    """피처 이름 → 행 단위 불리언 (build_feature_matrix와 독립적으로 pandas로 직접 구성)"""
+    indicators = {}
+    for col, name in SENTIMENT_FEATURES:
+        if col in df.columns:
+            for value, label in SENTIMENT_LABELS.items():
+                indicators[f'{name} {label}'] = (df[col] == value).to_numpy()
+    for col, name in CATEGORY_FEATURES:
+        if col in df.columns:
+            for value in sorted(df[col].dropna().unique()):
+                indicators[f'{name}:{value}'] = (df[col] == value).to_numpy()
+    for label, pattern in SUMMARY_KEYWORDS.items():
+        indicators[f'키워드:{label}'] = df[SUMMARY_COLUMN].str.contains(pattern, na=False, regex=True).to_numpy()
+    return indicators
+
+
+def _crosstab(indicators, features, rows=None):
+    columns = np.column_stack([indicators[name] for name in features]).astype(np.int64)
+    if rows is not None:
+        columns = columns[rows]
+    return columns.T @ columns
+
+
+def test_feature_matrix_is_integer_one_hot(frame):
+    matrix, names, sources = build_feature_matrix(frame)
+    assert matrix.dtype == np.int32
+    assert matrix.shape == (len(frame), len(names)) == (len(frame), len(sources))
+    assert set(np.unique(matrix.data)) == {1}
+    assert set(names) == set(_feature_indicators(frame))
+
+
+def test_counts_match_crosstab(frame):
+    matrix = CooccurrenceMatrix(frame)
+    counts, n = matrix.count_matrix()
+    assert n == len(frame)
+    np.testing.assert_array_equal(counts, _crosstab(_feature_indicators(frame), matrix.features))
+
+
+def test_group_counts_match_crosstab(frame):
+    matrix = CooccurrenceMatrix(frame, group_by=['MONTH'])
+    indicators = _feature_indicators(frame)
+    months = frame['MONTH'].to_numpy()
+    assert matrix.group_sizes.sum() == len(frame)
+    for month in [1, 6, 12]:
+        counts, n = matrix.count_matrix(month)
+        rows = months == month
+        assert n == rows.sum()
+        np.testing.assert_array_equal(counts, _crosstab(indicators, matrix.features, rows))
+
+
+def test_lift_and_conditional_from_counts(frame):
+    matrix = CooccurrenceMatrix(frame)
+    indicators = _feature_indicators(frame)
+    a, b = '전체 부정', '구매:재구매'
+    both = (indicators[a] & indicators[b]).sum()
+    lift = matrix.metric_frame('lift').loc[a, b]
+    conditional = matrix.metric_frame('conditional').loc[a, b]
+    assert lift == pytest.approx(round(both * len(frame) / (indicators[a].sum() * indicators[b].sum()), 3))
+    assert conditional == pytest.approx(round(both / indicators[a].sum() * 100, 3))
+
+
+def test_top_pairs_skip_same_attribute(frame):
+    matrix = CooccurrenceMatrix(frame)
+    pairs = matrix.top_pairs(min_count=1, limit=200)
+    assert len(pairs) > 0
+    source = dict(zip(matrix.features, matrix.sources))
+    assert all(source[a] != source[b] for a, b in zip(pairs['피처 A'], pairs['피처 B']))
+    assert pairs['향상도'].is_monotonic_decreasing
@@ -0,0 +1,168 @@
+"""
+analysis.py 성능 회귀 테스트 (pytest -m perf)
+100만 행 합성 데이터에서 적재 전처리와 메서드별 실행 시간·최대 메모리를 저장된 기준값(perf_baseline.json)과 비교
+실행 시간은 고정 보정 작업의 소요 시간 비율로 머신 속도 차이를 정규화하고, 메모리는 tracemalloc 최대 할당량
+(NumPy/pandas 블록 기준, Arrow 문자열 버퍼는 제외)으로 비교
+
+    pytest -m perf                          # 기준값 대비 검사
+    pytest -m perf --update-perf-baseline   # 현재 측정값을 기준값으로 저장
+"""
+
+import os
+import gc
+import json
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import ReviewInsightAnalysis, IDEA_METHODS
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perf_baseline.json')
+
+PERF_ROWS = 1_000_000
+PERF_SEED = 7
+REPEATS = 3
+
+# 허용 오차 (환경 변수로 조정 가능)
+TIME_TOLERANCE = float(os.environ.get('PERF_TIME_TOLERANCE', 0.5))
+MEMORY_TOLERANCE = float(os.environ.get('PERF_MEMORY_TOLERANCE', 0.25))
+
+PERF_METHODS = ['prepare'] + IDEA_METHODS + ['get_monthly_attribute_sentiment_table', 'get_summary']
+
+pytestmark = pytest.mark.perf
+
+_measured = {}
+
+
+def build_perf_frame(rows=PERF_ROWS, seed=PERF_SEED):
+    """원본 CSV와 같은 형태의 대용량 합성 리뷰 (값 풀에서 벡터 추출)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2023-01-01', '2024-12-31').strftime('%Y-%m-%d').to_numpy(dtype=object)
+    sentiments = np.array(['POSITIVE', 'POSITIVE', 'NEUTRAL', 'NEGATIVE', None], dtype=object)
+
+    def pick(pool):
+        pool = np.asarray(pool, dtype=object)
+        return pool[rng.integers(0, len(pool), rows)]
+
+    df = pd.DataFrame({
+        'REVIEW_ID': np.arange(rows, dtype=np.int64),
+        'REVIEWER_ID': rng.integers(0, rows // 4, rows),
+        '리뷰등록일': pick(dates),
+        '브랜드명': pick([f'브랜드{i:03d}' for i in range(200)]),
+    })
+    for col in ['OVERALL_SENTIMENT', 'ABSORPTION_SENTIMENT', 'FINISH_SENTIMENT', 'MOISTURE_SENTIMENT',
+                'TEXTURE_SENTIMENT', 'SCENT_SENTIMENT', 'IRRITATION_SENTIMENT', 'SOOTHING_SENTIMENT']:
+        df[col] = sentiments[rng.integers(0, len(sentiments), rows)]
+    df['TEXTURE_VALUE'] = pick(['물같음', '묽음', '점성', '쫀쫀'])
+    df['IRRITATION_VALUE'] = pick(['없음', '없음', '따가움', '트러블', None])
+    df['SKIN_TYPE_FINAL'] = pick(['지성', '건성', '복합성', '민감성', None])
+    df['PURCHASE_TYPE'] = pick(['첫구매', '신규', '재구매', None])
+    df['ONE_LINE_SUMMARY'] = pick([f'{word} 리뷰 {i}' for word in ['무난한', '가성비 좋은', '흡수 빠른', '촉촉한'] for i in range(50)])
+    return df
+
+
+def calibrate():
+    """머신 속도 보정용 고정 작업 (정렬·그룹 집계·문자열 검색) 최소 소요 시간"""
+    rng = np.random.default_rng(0)
+    values = rng.random(2_000_000)
+    keys = rng.integers(0, 12, 2_000_000)
+    words = pd.Series(np.array(['재구매 리뷰', '첫구매', '신규 구매', '무난'], dtype=object)[rng.integers(0, 4, 300_000)])
+    best = float('inf')
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        np.sort(values)
+        pd.Series(values).groupby(keys).mean()
+        words.str.contains('재구매', na=False)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure(func, setup=None):
+    """(최소 실행 시간 초, tracemalloc 최대 할당 MB) (시간과 메모리는 별도 실행으로 측정)"""
+    best = float('inf')
+    for _ in range(REPEATS):
+        args = setup() if setup else ()
+        gc.collect()
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+
+    args = setup() if setup else ()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak / (1024 * 1024)
+
+
+@pytest.fixture(scope='module')
+def raw_frame():
+    return build_perf_frame()
+
+
+@pytest.fixture(scope='module')
+def perf_analysis(raw_frame):
+    """전처리를 마친 100만 행 분석 객체 (마스크 캐시를 쓰지 않도록 데이터셋 버전 없음)"""
+    analysis = ReviewInsightAnalysis.from_frame(raw_frame.copy(), category='성능')
+    analysis._prepare_data()
+    analysis.original_df = analysis.df
+    return analysis
+
+
+@pytest.fixture(scope='module')
+def baseline(request):
+    """저장된 기준값 (--update-perf-baseline이면 모듈 종료 시 측정값으로 저장)"""
+    update = request.config.getoption('--update-perf-baseline')
+    calibration = calibrate()
+    stored = None
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding='utf-8') as f:
+            stored = json.load(f)
+
+    yield {'stored': stored, 'calibration_seconds': calibration, 'update': update}
+
+    if update and _measured:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({
+                'rows': PERF_ROWS,
+                'calibration_seconds': round(calibration, 4),
+                'methods': {name: _measured[name] for name in PERF_METHODS if name in _measured},
+            }, f, ensure_ascii=False, indent=2)
+
+
+@pytest.mark.parametrize('method', PERF_METHODS)
+def test_within_budget(raw_frame, perf_analysis, baseline, method):
+    if method == 'prepare':
+        def setup():
+            return (ReviewInsightAnalysis.from_frame(raw_frame.copy(), category='성능'),)
+        seconds, peak_mb = measure(lambda analysis: analysis._prepare_data(), setup)
+    else:
+        seconds, peak_mb = measure(getattr(perf_analysis, method))
+
+    if baseline['update']:
+        _measured[method] = {'seconds': round(seconds, 4), 'peak_mb': round(peak_mb, 2)}
+        return
+
+    stored = baseline['stored']
+    if stored is None or method not in stored['methods'] or stored.get('rows') != PERF_ROWS:
+        pytest.skip('성능 기준값 없음 (pytest -m perf --update-perf-baseline 으로 생성)')
+
+    budget = stored['methods'][method]
+    scale = baseline['calibration_seconds'] / stored['calibration_seconds']
+    time_limit = budget['seconds'] * scale * (1 + TIME_TOLERANCE)
+    memory_limit = budget['peak_mb'] * (1 + MEMORY_TOLERANCE) + 1
+
+    assert seconds <= time_limit, (
+        f"{method}: {seconds:.3f}s > 허용 {time_limit:.3f}s "
+        f"(기준 {budget['seconds']:.3f}s × 보정 {scale:.2f} × {1 + TIME_TOLERANCE:.2f})"
+    )
+    assert peak_mb <= memory_limit, (
+        f"{method}: 최대 메모리 {peak_mb:.1f}MB > 허용 {memory_limit:.1f}MB (기준 {budget['peak_mb']:.1f}MB)"
+    )
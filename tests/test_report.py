@@ -0,0 +1,65 @@
+"""
+리포트 사전 집계 테스트
+브랜드 × 월 × 조건 건수 테이블에서 재구성한 인사이트·속성 테이블·요약이 분석 메서드의 기대값과 같은지,
+섹션 렌더링 오류가 삼켜지지 않고 오류 블록과 오류 목록으로 남는지 확인
+"""
+
+import pytest
+
+import report
+from golden_data import BRANDS
+from test_analysis import EXPECTED, METHODS, _assert_matches
+
+
+@pytest.fixture(scope='module')
+def aggregates(golden):
+    df = golden.full_frame(report.report_columns())
+    return report.monthly_counts(df), report.product_summaries(df)
+
+
+def _product_counts(counts, product):
+    if product == "전체":
+        return counts.groupby(level='MONTH', sort=True).sum()
+    return counts[counts.index.get_level_values('브랜드명') == product].droplevel('브랜드명')
+
+
+@pytest.mark.parametrize('method', METHODS)
+@pytest.mark.parametrize('product', ['전체'] + BRANDS)
+def test_aggregates_match_golden(aggregates, product, method):
+    counts, summaries = aggregates
+    if method == 'get_summary':
+        result = report._format_summary(summaries[product])
+    else:
+        result = getattr(report.MonthlyCounts(_product_counts(counts, product)), method)()
+    _assert_matches(result, EXPECTED[f'{product}/{method}'])
+
+
+def test_section_reports_errors(aggregates, monkeypatch):
+    counts, summaries = aggregates
+    method = 'idea5_scent_seasonality'
+
+    def broken(result):
+        raise ValueError('차트 생성 실패')
+
+    monkeypatch.setitem(report.IDEA_FIGURES, method, broken)
+    product, _, section, errors = report.render_product_section(
+        BRANDS[0], report._format_summary(summaries[BRANDS[0]]), _product_counts(counts, BRANDS[0]), 'section-0'
+    )
+    assert product == BRANDS[0]
+    assert 'class="error"' in section and '차트 생성 실패' in section
+    assert errors == [f'{BRANDS[0]} / {report.IDEA_LABELS[method]}: ValueError: 차트 생성 실패']
+
+
+def test_missing_columns_render_note(aggregates):
+    counts, summaries = aggregates
+    counts = _product_counts(counts, "전체").drop(columns=['oily_skin', 'oily_skin&finish_negative'])
+    _, _, section, errors = report.render_product_section("전체", report._format_summary(summaries["전체"]), counts, 's')
+    assert '필요한 컬럼 데이터가 부족합니다.' in section
+    assert errors == []
+
+
+def test_unlisted_combination_is_an_error(aggregates):
+    # 공통 구현이 REPORT_COUNTS에 없는 조합을 요청하면 컬럼 부족 안내로 숨기지 않고 오류로 드러냄
+    counts, _ = aggregates
+    with pytest.raises(ValueError):
+        report.MonthlyCounts(_product_counts(counts, "전체")).total('repurchase', 'oily_skin')
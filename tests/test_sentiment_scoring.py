@@ -0,0 +1,97 @@
+"""
+감성 재채점 테스트
+fill/rescore 모드별로 어떤 라벨이 바뀌는지, REVIEW_ID + 텍스트 해시 캐시의 적중·무효화,
+처리 보고서의 채점/캐시/채움/변경 건수 확인
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sentiment_scoring import LexiconScorer, SentimentRescorer
+
+
+LEXICON = {
+    'OVERALL_SENTIMENT': {'aspect': [], 'positive': ['좋'], 'negative': ['별로']},
+    'MOISTURE_SENTIMENT': {'aspect': ['촉촉', '건조'], 'positive': ['촉촉'], 'negative': ['건조']},
+}
+
+
+def _reviews():
+    return pd.DataFrame({
+        'REVIEW_ID': [1, 2, 3, 4],
+        'OVERALL_SENTIMENT': [None, 'NEGATIVE', None, 'POSITIVE'],
+        'MOISTURE_SENTIMENT': [None, None, 'NEGATIVE', 'POSITIVE'],
+        'ONE_LINE_SUMMARY': ['좋아요 촉촉', '좋아요', '별로 건조', '별로'],
+    })
+
+
+@pytest.fixture
+def rescorer(tmp_path):
+    def make(mode):
+        return SentimentRescorer(LexiconScorer(LEXICON), mode=mode, workers=1, cache_dir=str(tmp_path))
+    return make
+
+
+def _apply(rescorer, df, keys=True):
+    return rescorer.apply(df, df['ONE_LINE_SUMMARY'], df['REVIEW_ID'] if keys else None, cache_key='테스트')
+
+
+def test_fill_mode_only_fills_missing_labels(rescorer):
+    df = _reviews()
+    report = _apply(rescorer('fill'), df)
+    assert df['OVERALL_SENTIMENT'].tolist() == ['POSITIVE', 'NEGATIVE', 'NEGATIVE', 'POSITIVE']
+    assert df['MOISTURE_SENTIMENT'].tolist() == ['POSITIVE', 'NEUTRAL', 'NEGATIVE', 'POSITIVE']
+    # 라벨이 모두 있는 4번 리뷰는 채점 대상이 아님
+    assert report['target_reviews'] == 3 and report['scored_reviews'] == 3 and report['cached_reviews'] == 0
+    assert report['filled_labels'] == 4 and report['changed_labels'] == 0
+
+
+def test_rescore_mode_replaces_every_label(rescorer):
+    df = _reviews()
+    report = _apply(rescorer('rescore'), df)
+    assert df['OVERALL_SENTIMENT'].tolist() == ['POSITIVE', 'POSITIVE', 'NEGATIVE', 'NEGATIVE']
+    assert df['MOISTURE_SENTIMENT'].tolist() == ['POSITIVE', 'NEUTRAL', 'NEGATIVE', 'NEUTRAL']
+    assert report['target_reviews'] == 4 and report['scored_reviews'] == 4
+    # 2번 전체, 4번 전체·보습이 기존 라벨과 달라짐 (3번 보습은 같은 값)
+    assert report['filled_labels'] == 4 and report['changed_labels'] == 3
+
+
+def test_cache_hits_and_invalidation(rescorer):
+    _apply(rescorer('rescore'), _reviews())
+
+    df = _reviews()
+    report = _apply(rescorer('rescore'), df)
+    assert report['scored_reviews'] == 0 and report['cached_reviews'] == 4
+    assert df['OVERALL_SENTIMENT'].tolist() == ['POSITIVE', 'POSITIVE', 'NEGATIVE', 'NEGATIVE']
+
+    # 텍스트가 바뀐 리뷰와 새 REVIEW_ID(같은 텍스트)는 캐시를 쓰지 않고 다시 채점
+    df = _reviews()
+    df.loc[1, 'ONE_LINE_SUMMARY'] = '별로'
+    df.loc[3, 'REVIEW_ID'] = 5
+    report = _apply(rescorer('rescore'), df)
+    assert report['scored_reviews'] == 2 and report['cached_reviews'] == 2
+    assert df['OVERALL_SENTIMENT'].tolist() == ['POSITIVE', 'NEGATIVE', 'NEGATIVE', 'NEGATIVE']
+
+    # 다시 채점한 결과도 캐시에 병합되어 다음 로드에서 적중
+    report = _apply(rescorer('rescore'), df.assign(OVERALL_SENTIMENT=None))
+    assert report['scored_reviews'] == 0 and report['cached_reviews'] == 4
+
+
+def test_without_keys_cache_is_not_used(rescorer):
+    _apply(rescorer('fill'), _reviews())
+    report = _apply(rescorer('fill'), _reviews(), keys=False)
+    assert report['scored_reviews'] == 3 and report['cached_reviews'] == 0
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        SentimentRescorer(mode='replace')
+
+
+def test_lexicon_change_changes_cache_name():
+    changed = {**LEXICON, 'OVERALL_SENTIMENT': {'aspect': [], 'positive': ['최고'], 'negative': []}}
+    assert LexiconScorer(LEXICON).cache_name != LexiconScorer(changed).cache_name
+    labels = LexiconScorer(LEXICON).score(np.array(['좋은데 별로', None], dtype=object), 'OVERALL_SENTIMENT')
+    # 긍정·부정이 함께 나오거나 텍스트가 없으면 중립
+    assert labels.tolist() == ['NEUTRAL', 'NEUTRAL']
@@ -0,0 +1,111 @@
+"""
+메모리 매핑 공유 저장소 테스트
+전처리 결과를 컬럼별 .npy로 기록했다 다시 읽었을 때 값·결측·날짜가 그대로인지, 브랜드/연월 필터와
+버전 교체가 동작하는지, 저장소 모드 분석 결과가 CSV 모드 기대값과 같은지 확인
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from analysis import ReviewInsightAnalysis, IDEA_METHODS
+from golden_data import BRANDS, write_golden_csv
+from shared_store import META_FILE, SharedReviewStore, open_shared_store, write_shared
+from test_analysis import EXPECTED, _assert_matches
+
+
+CATEGORY = '테스트'
+
+
+@pytest.fixture(scope='module')
+def source(tmp_path_factory):
+    root = tmp_path_factory.mktemp('shared')
+    csv_path = write_golden_csv(str(root / f'올영리뷰_{CATEGORY}.csv'))
+    prepared = ReviewInsightAnalysis(csv_path, category=CATEGORY, projection=False).original_df
+    return root, csv_path, prepared
+
+
+@pytest.fixture(scope='module')
+def store(source):
+    root, csv_path, _ = source
+    return open_shared_store([csv_path], CATEGORY, str(root / 'store'))
+
+
+def _comparable(series):
+    values = pd.Series(series).astype(object)
+    return values.where(pd.Series(series).notna(), None).tolist()
+
+
+def test_round_trip_preserves_values(store, source):
+    _, _, prepared = source
+    restored = store.read()
+    assert list(restored.columns) == list(prepared.columns)
+    assert len(restored) == len(prepared)
+    for col in prepared.columns:
+        assert _comparable(restored[col]) == _comparable(prepared[col]), col
+    assert restored['리뷰등록일'].dtype == prepared['리뷰등록일'].dtype
+    assert str(restored['YEAR_MONTH'].dtype) == str(prepared['YEAR_MONTH'].dtype)
+
+
+def test_read_filters_brand_and_month(store, source):
+    _, _, prepared = source
+    brand = BRANDS[1]
+    months = ['2023-06', '2024-01']
+    restored = store.read(brand=brand, columns=['REVIEW_ID', 'YEAR_MONTH'], year_months=months)
+    expected = prepared[(prepared['브랜드명'] == brand) & prepared['YEAR_MONTH'].astype(str).isin(months)]
+    assert list(restored.columns) == ['REVIEW_ID', 'YEAR_MONTH']
+    assert restored['REVIEW_ID'].tolist() == expected['REVIEW_ID'].tolist()
+    assert store.brands() == sorted(BRANDS)
+
+
+def test_numeric_columns_are_memory_mapped(store):
+    mapped = store._load('REVIEW_ID', 'values')
+    assert isinstance(mapped, np.memmap)
+    # 필터 없이 읽으면 매핑 배열을 복사하지 않음
+    assert np.shares_memory(store.read(columns=['REVIEW_ID'])['REVIEW_ID'].to_numpy(), mapped)
+    assert np.shares_memory(store.read(columns=['리뷰등록일'])['리뷰등록일'].to_numpy(), store._load('리뷰등록일', 'values'))
+
+
+def test_text_columns_wrap_mapped_bytes(tmp_path):
+    df = pd.DataFrame({'TEXT': ['촉촉해요', None, '끈적임 없음', '가성비'], 'N': [1, 2, 3, 4]})
+    store = SharedReviewStore(write_shared(df, str(tmp_path / 'store')))
+    assert store.meta['columns']['TEXT']['kind'] == 'text'
+
+    restored = store.read()['TEXT']
+    # CSV 로드와 같은 기본 문자열 dtype이면서 UTF-8 바이트는 매핑 파일을 그대로 참조
+    assert restored.dtype == pd.Series(['가']).dtype
+    assert _comparable(restored) == ['촉촉해요', None, '끈적임 없음', '가성비']
+    data = pa.array(restored.array).buffers()[2]
+    assert data.address == store._load('TEXT', 'data').ctypes.data
+    assert _comparable(store._column('TEXT', np.array([2, 1]))) == ['끈적임 없음', None]
+
+
+@pytest.mark.parametrize('method', IDEA_METHODS + ['get_monthly_attribute_sentiment_table', 'get_summary'])
+def test_store_mode_matches_golden(store, method):
+    analysis = ReviewInsightAnalysis(category=CATEGORY, store=store).for_product(BRANDS[0])
+    _assert_matches(getattr(analysis, method)(), EXPECTED[f'{BRANDS[0]}/{method}'])
+
+
+def test_reopen_reuses_and_new_version_replaces(source, store):
+    root, csv_path, _ = source
+    shared_dir = str(root / 'store')
+    meta_mtime = os.stat(os.path.join(store.root, META_FILE)).st_mtime_ns
+    assert open_shared_store([csv_path], CATEGORY, shared_dir).root == store.root
+    assert os.stat(os.path.join(store.root, META_FILE)).st_mtime_ns == meta_mtime
+
+    # 원본이 바뀌면 새 버전을 만들고 이전 버전 디렉터리는 정리
+    os.utime(csv_path, ns=(meta_mtime, meta_mtime + 1_000_000_000))
+    replaced = open_shared_store([csv_path], CATEGORY, shared_dir)
+    assert replaced.root != store.root
+    assert os.listdir(shared_dir) == [os.path.basename(replaced.root)]
+
+
+def test_write_shared_handles_empty_text(tmp_path):
+    df = pd.DataFrame({'TEXT': [None, None, '가'], 'N': [1.5, np.nan, 3.0]})
+    store = SharedReviewStore(write_shared(df, str(tmp_path / 'store')))
+    restored = store.read()
+    assert _comparable(restored['TEXT']) == [None, None, '가']
+    assert np.isnan(restored['N'][1]) and restored['N'][2] == 3.0
@@ -0,0 +1,78 @@
+"""
+브랜드 × 연월 파티션 저장소 테스트
+요청한 컬럼만 읽는지, 브랜드/연월 조건이 파티션 단위로 적용되어 다른 파티션 파일을 열지 않는지 확인
+"""
+
+import os
+import glob
+import shutil
+from urllib.parse import unquote
+
+import pandas as pd
+import pytest
+
+from analysis import ReviewInsightAnalysis
+from golden_data import BRANDS, write_golden_csv
+from storage import (
+    BRAND_COLUMN, QUALITY_REPORT_FILE, PartitionedReviewStore, ingest_csv, is_partitioned_store
+)
+from test_analysis import EXPECTED, _assert_matches
+
+
+@pytest.fixture(scope='module')
+def store_root(tmp_path_factory):
+    root = tmp_path_factory.mktemp('partitioned')
+    csv_path = write_golden_csv(str(root / '올영리뷰_테스트.csv'))
+    return ingest_csv(csv_path, str(root / 'store'), category='테스트')
+
+
+@pytest.fixture(scope='module')
+def prepared(store_root):
+    return PartitionedReviewStore(store_root).read()
+
+
+def test_layout_and_quality_report(store_root):
+    assert is_partitioned_store(store_root)
+    assert os.path.exists(os.path.join(store_root, QUALITY_REPORT_FILE))
+    store = PartitionedReviewStore(store_root)
+    assert store.brands() == sorted(BRANDS)
+    assert store.quality_report['quarantined_rows'] > 0
+
+
+def test_column_pushdown(store_root, prepared):
+    df = PartitionedReviewStore(store_root).read(columns=['REVIEW_ID', 'OVERALL_SENTIMENT', '없는컬럼'])
+    assert list(df.columns) == ['REVIEW_ID', 'OVERALL_SENTIMENT']
+    assert sorted(df['REVIEW_ID']) == sorted(prepared['REVIEW_ID'])
+
+
+def test_partition_pushdown_skips_other_partitions(tmp_path, store_root, prepared):
+    # 저장소를 복사한 뒤 다른 브랜드 파티션 파일을 손상시켜도 대상 브랜드/연월만 읽으면 성공해야 함 (합성 데이터의 첫 브랜드는 1·4·7·10월)
+    root = str(tmp_path / 'store')
+    shutil.copytree(store_root, root)
+    store = PartitionedReviewStore(root)
+    brand = BRANDS[0]
+    for path in glob.glob(os.path.join(root, '*', '*', '*.parquet')):
+        if unquote(os.path.relpath(path, root)).split(os.sep)[0] != f'{BRAND_COLUMN}={brand}':
+            with open(path, 'wb') as f:
+                f.write(b'not parquet')
+
+    df = store.read(brand=brand, columns=['REVIEW_ID', 'YEAR_MONTH'], year_months=['2023-04', '2024-07'])
+    expected = prepared[
+        (prepared[BRAND_COLUMN] == brand) & prepared['YEAR_MONTH'].astype(str).isin(['2023-04', '2024-07'])
+    ]
+    assert sorted(df['REVIEW_ID']) == sorted(expected['REVIEW_ID'])
+    assert set(df['YEAR_MONTH'].astype(str)) == {'2023-04', '2024-07'}
+    assert isinstance(df['YEAR_MONTH'].dtype, pd.PeriodDtype)
+
+    with pytest.raises(Exception):
+        store.read(brand=BRANDS[1], columns=['REVIEW_ID'])
+
+
+@pytest.mark.parametrize('method', ['idea1_absorption_repurchase', 'idea9_value_for_money_buffering', 'get_summary'])
+def test_store_mode_matches_golden(store_root, method):
+    analysis = ReviewInsightAnalysis(category='테스트', store=PartitionedReviewStore(store_root))
+    view = analysis.for_product(BRANDS[2])
+    _assert_matches(getattr(view, method)(), EXPECTED[f'{BRANDS[2]}/{method}'])
+    # 저장소 모드 뷰는 선택 브랜드 파티션만 읽음
+    view.ensure_columns([BRAND_COLUMN])
+    assert set(view.df[BRAND_COLUMN]) == {BRANDS[2]}
@@ -0,0 +1,74 @@
+"""
+요약 텍스트 피처 테스트
+증분 토큰화로 붙인 단어 행렬이 전체 재생성과 같은지, 디스크 캐시가 버전 디렉터리 + CURRENT로 교체되는지 확인
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from text_features import CURRENT_FILE, SUMMARY_COLUMN, TermMatrix, load_term_matrix, row_hashes
+
+
+@pytest.fixture(scope='module')
+def summaries(golden):
+    view = golden.for_product('전체')
+    view.ensure_columns([SUMMARY_COLUMN])
+    return view.df[['REVIEW_ID', SUMMARY_COLUMN]].reset_index(drop=True)
+
+
+def _by_term(matrix):
+    """단어 순서와 무관하게 비교할 수 있도록 열을 단어 사전순으로 정렬한 밀집 행렬"""
+    order = np.argsort(np.asarray(matrix.vocabulary, dtype=object))
+    return np.asarray(matrix.vocabulary, dtype=object)[order], matrix.counts.toarray()[:, order]
+
+
+def test_extend_matches_full_build(summaries):
+    texts = summaries[SUMMARY_COLUMN].to_numpy()
+    hashes = row_hashes(summaries)
+    split = len(texts) * 2 // 3
+
+    full = TermMatrix.build(texts, hashes)
+    incremental = TermMatrix.build(texts[:split], hashes[:split]).extend(texts[split:], hashes[split:])
+
+    full_terms, full_counts = _by_term(full)
+    incremental_terms, incremental_counts = _by_term(incremental)
+    np.testing.assert_array_equal(full_terms, incremental_terms)
+    np.testing.assert_array_equal(full_counts, incremental_counts)
+    assert incremental.version == full.version
+
+
+def test_batched_build_matches_single_batch(summaries):
+    texts = summaries[SUMMARY_COLUMN].to_numpy()
+    hashes = row_hashes(summaries)
+    single = _by_term(TermMatrix.build(texts, hashes))
+    batched = _by_term(TermMatrix.build(texts, hashes, batch_size=97))
+    np.testing.assert_array_equal(single[0], batched[0])
+    np.testing.assert_array_equal(single[1], batched[1])
+
+
+def test_cache_appends_and_swaps_current(summaries, tmp_path):
+    split = len(summaries) // 2
+    first = load_term_matrix(summaries.iloc[:split], '테스트', cache_dir=str(tmp_path))
+    cache = tmp_path / '테스트'
+    assert (cache / CURRENT_FILE).read_text() == first.version
+
+    appended = load_term_matrix(summaries, '테스트', cache_dir=str(tmp_path))
+    rebuilt = TermMatrix.build(summaries[SUMMARY_COLUMN].to_numpy(), row_hashes(summaries))
+    assert (cache / CURRENT_FILE).read_text() == appended.version == rebuilt.version
+    # 이전 버전 디렉터리와 임시 디렉터리는 정리
+    assert sorted(os.listdir(cache)) == sorted([CURRENT_FILE, appended.version])
+    np.testing.assert_array_equal(_by_term(appended)[1], _by_term(rebuilt)[1])
+
+    loaded = TermMatrix.load(str(cache))
+    assert loaded.version == appended.version
+    assert (loaded.counts != appended.counts).nnz == 0
+
+
+def test_load_rejects_mismatched_files(summaries, tmp_path):
+    matrix = TermMatrix.build(summaries[SUMMARY_COLUMN].to_numpy(), row_hashes(summaries))
+    matrix.save(str(tmp_path))
+    np.save(tmp_path / matrix.version / 'hashes.npy', matrix.hashes[:-1])
+    assert TermMatrix.load(str(tmp_path)) is None
+    assert TermMatrix.load(str(tmp_path / '없음')) is None
@@ -0,0 +1,80 @@
+"""
+품질 검증 단계 테스트
+격리 사유(날짜 파싱 실패·REVIEW_ID 중복·값 사전 위반)와 사유 조합, 감성 라벨 정규화, 품질 리포트 집계 확인
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import validation
+from validation import REASON_COLUMN, quality_table, register_vocabulary, validate_reviews
+
+
+def _reviews():
+    return pd.DataFrame({
+        'REVIEW_ID': [1, 2, 3, 3, 5, 6, 6, None],
+        '리뷰등록일': ['2024-01-05', 'not-a-date', '2024-02-01', '2024-02-02', '2024-02-30', '2024-03-01',
+                   '어제', None],
+        '브랜드명': ['A', 'A', 'B', 'B', 'A', 'B', 'B', 'A'],
+        'OVERALL_SENTIMENT': ['POSITIVE', 'NEGATIVE', ' positive', 'NEUTRAL', 'NEGATIVE', 'GREAT', 'POSITIVE', None],
+        'TEXTURE_VALUE': ['묽음', '점성', '묽음', '묽음', '묽음', '묽음', '묽음', '묽음'],
+    })
+
+
+def test_quarantine_reasons():
+    clean, quarantine, report, kept = validate_reviews(_reviews())
+
+    assert quarantine[REASON_COLUMN].tolist() == [
+        'date_parse_failure',
+        'duplicate_review_id',
+        'date_parse_failure',
+        'invalid_OVERALL_SENTIMENT',
+        # 날짜 파싱 실패와 중복이 겹친 행은 사유를 모두 기록
+        'date_parse_failure;duplicate_review_id',
+    ]
+    assert quarantine['REVIEW_ID'].tolist() == [2, 3, 5, 6, 6]
+    assert kept.tolist() == [True, False, True, False, False, False, False, True]
+    assert clean['REVIEW_ID'].tolist()[:2] == [1, 3]
+    assert len(clean) == report['kept_rows']
+
+
+def test_report_counts_and_normalization():
+    clean, _, report, _ = validate_reviews(_reviews())
+    assert report['rows'] == 8
+    assert report['kept_rows'] == 3 and report['quarantined_rows'] == 5
+    assert report['date_parse_failures'] == 3
+    assert report['duplicate_review_ids'] == 2
+    assert report['invalid_vocabulary'] == {'OVERALL_SENTIMENT': 1}
+    assert report['missing_columns'] == []
+    assert report['null_rates']['리뷰등록일'] == pytest.approx(0.125)
+
+    # 날짜는 datetime으로, 감성 라벨은 공백 제거·대문자로 정규화 (결측은 그대로)
+    assert pd.api.types.is_datetime64_any_dtype(clean['리뷰등록일'])
+    assert clean['OVERALL_SENTIMENT'].tolist()[:2] == ['POSITIVE', 'POSITIVE']
+    assert pd.isna(clean['OVERALL_SENTIMENT'].iloc[2])
+    assert pd.isna(clean['리뷰등록일'].iloc[2])
+
+
+def test_registered_vocabulary(monkeypatch):
+    monkeypatch.setattr(validation, 'VOCABULARIES', {})
+    register_vocabulary('TEXTURE_VALUE', ['묽음'])
+    _, quarantine, report, _ = validate_reviews(_reviews())
+    assert report['invalid_vocabulary']['TEXTURE_VALUE'] == 1
+    assert quarantine.set_index('REVIEW_ID').loc[2, REASON_COLUMN] == 'date_parse_failure;invalid_TEXTURE_VALUE'
+
+
+def test_missing_required_columns_and_clean_input():
+    df = pd.DataFrame({'REVIEW_ID': [1, 2], 'OVERALL_SENTIMENT': ['POSITIVE', 'NEUTRAL']})
+    clean, quarantine, report, kept = validate_reviews(df)
+    assert report['missing_columns'] == ['리뷰등록일', '브랜드명']
+    assert len(quarantine) == 0 and kept.all()
+    assert clean is df
+
+
+def test_quality_table():
+    _, _, report, _ = validate_reviews(_reviews())
+    table = quality_table(report)
+    assert table.loc['OVERALL_SENTIMENT', '사전 위반'] == 1
+    assert table.loc['리뷰등록일', '결측률 (%)'] == pytest.approx(12.5)
+    assert np.all(table['사전 위반'].drop('OVERALL_SENTIMENT') == 0)
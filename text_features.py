@@ -0,0 +1,259 @@
+"""
+한 줄 요약 텍스트 피처 파이프라인
+ONE_LINE_SUMMARY를 어절 + 한글 문자 n-gram 단위로 배치 토큰화하여 희소 단어 행렬을 만들고,
+데이터셋 버전별로 디스크에 캐시하며 추가된 리뷰만 증분 토큰화
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+
+SUMMARY_COLUMN = 'ONE_LINE_SUMMARY'
+KEY_COLUMNS = ['REVIEW_ID']
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'text_features')
+
+# 토큰화 설정
+TOKEN_PATTERN = r'[가-힣A-Za-z0-9]+'
+NGRAM_SIZES = (2, 3)
+MAX_NGRAM_POSITIONS = 8
+BATCH_SIZE = 100_000
+
+# 캐시 디렉터리에서 현재 버전 디렉터리 이름을 가리키는 파일
+CURRENT_FILE = 'CURRENT'
+
+
+def row_hashes(df):
+    """리뷰 키 + 요약 텍스트 행 해시 (데이터셋 버전 및 증분 판단용)"""
+    columns = [col for col in KEY_COLUMNS if col in df.columns] + [SUMMARY_COLUMN]
+    return pd.util.hash_pandas_object(df[columns].astype(str), index=False).to_numpy()
+
+
+def dataset_version(hashes):
+    """행 해시 배열의 버전 문자열"""
+    return hashlib.blake2b(np.ascontiguousarray(hashes).tobytes(), digest_size=12).hexdigest()
+
+
+def tokenize_batch(texts):
+    """텍스트 배치 → (문서 위치, 단어) 배열 (어절 + 어절 내부 문자 n-gram)"""
+    words = pd.Series(texts, dtype=object).fillna('').str.findall(TOKEN_PATTERN).explode().dropna()
+    words = words[words.str.len() > 0]
+    doc_index = [words.index.to_numpy()]
+    terms = [words.to_numpy()]
+
+    # 위치별 슬라이스로 문자 n-gram을 벡터 연산 생성 (어절 길이 이내 위치만)
+    lengths = words.str.len().to_numpy()
+    for size in NGRAM_SIZES:
+        for start in range(MAX_NGRAM_POSITIONS):
+            # 어절 전체와 같은 n-gram은 어절 토큰과 중복이므로 제외
+            keep = (lengths >= start + size) & (lengths > size)
+            if not keep.any():
+                break
+            sliced = words[keep].str.slice(start, start + size)
+            doc_index.append(sliced.index.to_numpy())
+            terms.append(sliced.to_numpy())
+
+    return np.concatenate(doc_index).astype(np.int64), np.concatenate(terms)
+
+
+class TermMatrix:
+    """리뷰 × 단어 희소 빈도 행렬과 단어 사전"""
+
+    def __init__(self, counts, vocabulary, hashes):
+        self.counts = counts.tocsr()
+        self.vocabulary = list(vocabulary)
+        self.hashes = hashes
+        self.version = dataset_version(hashes)
+
+    @classmethod
+    def build(cls, texts, hashes, vocabulary=None, batch_size=BATCH_SIZE):
+        """텍스트를 배치 단위로 토큰화하여 행렬 생성 (vocabulary가 있으면 이어서 확장)"""
+        vocab_index = pd.Index(vocabulary if vocabulary is not None else [], dtype=object)
+        blocks = []
+        texts = np.asarray(texts, dtype=object)
+
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            docs, terms = tokenize_batch(batch)
+
+            codes = vocab_index.get_indexer(terms)
+            new_terms = pd.unique(terms[codes < 0])
+            if len(new_terms):
+                vocab_index = vocab_index.append(pd.Index(new_terms, dtype=object))
+                codes = vocab_index.get_indexer(terms)
+
+            blocks.append((docs, codes, len(batch)))
+
+        width = len(vocab_index)
+        matrices = [
+            sp.csr_matrix((np.ones(len(docs), dtype=np.int32), (docs, codes)), shape=(n_docs, width))
+            for docs, codes, n_docs in blocks
+        ]
+        counts = sp.vstack(matrices, format='csr') if matrices else sp.csr_matrix((0, width), dtype=np.int32)
+        return cls(counts, vocab_index.tolist(), hashes)
+
+    def extend(self, texts, hashes):
+        """추가된 리뷰만 토큰화하여 행렬 뒤에 붙인 새 TermMatrix"""
+        appended = TermMatrix.build(texts, hashes, vocabulary=self.vocabulary)
+        width = len(appended.vocabulary)
+        old = self.counts
+        old = sp.csr_matrix((old.data, old.indices, old.indptr), shape=(old.shape[0], width))
+        return TermMatrix(
+            sp.vstack([old, appended.counts], format='csr'),
+            appended.vocabulary,
+            np.concatenate([self.hashes, hashes])
+        )
+
+    # ----- 저장/로드 -----
+    def save(self, cache_dir):
+        """버전 디렉터리에 모든 파일을 쓴 뒤 CURRENT를 원자적으로 교체 (이전 버전 디렉터리는 정리)
+
+        버전 디렉터리는 임시 디렉터리에 쓰고 이름을 바꿔 만들며, 읽는 쪽은 CURRENT가 가리키는 한 디렉터리만 읽으므로
+        동시에 저장하는 다른 프로세스와 서로 다른 시점의 행렬·사전·해시를 섞지 않음
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        suffix = f'.tmp-{os.getpid()}-{threading.get_ident()}'
+        target = os.path.join(cache_dir, self.version)
+        if not os.path.exists(os.path.join(target, 'meta.json')):
+            tmp = target + suffix
+            shutil.rmtree(tmp, ignore_errors=True)
+            os.makedirs(tmp)
+            sp.save_npz(os.path.join(tmp, 'counts.npz'), self.counts)
+            np.save(os.path.join(tmp, 'hashes.npy'), self.hashes)
+            with open(os.path.join(tmp, 'vocabulary.json'), 'w', encoding='utf-8') as f:
+                json.dump(self.vocabulary, f, ensure_ascii=False)
+            with open(os.path.join(tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'rows': int(self.counts.shape[0])}, f)
+            try:
+                os.rename(tmp, target)
+            except OSError:
+                # 다른 작업자가 먼저 같은 버전을 기록한 경우 그 결과를 사용
+                shutil.rmtree(tmp, ignore_errors=True)
+                if not os.path.exists(os.path.join(target, 'meta.json')):
+                    raise
+
+        pointer = os.path.join(cache_dir, CURRENT_FILE)
+        with open(pointer + suffix, 'w', encoding='utf-8') as f:
+            f.write(self.version)
+        os.replace(pointer + suffix, pointer)
+
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            if name in (self.version, CURRENT_FILE) or '.tmp-' in name:
+                continue
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @classmethod
+    def load(cls, cache_dir):
+        """CURRENT가 가리키는 버전 디렉터리에서 로드 (없거나 파일 구성이 맞지 않으면 None)"""
+        try:
+            with open(os.path.join(cache_dir, CURRENT_FILE), encoding='utf-8') as f:
+                root = os.path.join(cache_dir, f.read().strip())
+            counts = sp.load_npz(os.path.join(root, 'counts.npz'))
+            hashes = np.load(os.path.join(root, 'hashes.npy'))
+            with open(os.path.join(root, 'vocabulary.json'), encoding='utf-8') as f:
+                vocabulary = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if counts.shape != (len(hashes), len(vocabulary)):
+            return None
+        return cls(counts, vocabulary, hashes)
+
+    # ----- 지표 -----
+    def tfidf(self, rows=None):
+        """TF-IDF 행렬 (행 L2 정규화, idf는 전체 코퍼스 기준)"""
+        n = self.counts.shape[0]
+        df = np.bincount(self.counts.indices, minlength=self.counts.shape[1])
+        idf = np.log((1 + n) / (1 + df)) + 1
+        counts = self.counts if rows is None else self.counts[rows]
+        weighted = counts.multiply(idf).tocsr()
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1))).ravel()
+        norms[norms == 0] = 1
+        return sp.diags(1 / norms) @ weighted
+
+    def top_terms(self, rows=None, limit=20, min_length=2):
+        """행 집합의 평균 TF-IDF 상위 단어"""
+        tfidf = self.tfidf(rows)
+        if tfidf.shape[0] == 0:
+            return pd.DataFrame(columns=['단어', 'TF-IDF'])
+        scores = pd.Series(np.asarray(tfidf.mean(axis=0)).ravel(), index=self.vocabulary)
+        scores = scores[scores.index.str.len() >= min_length]
+        return scores.nlargest(limit).round(4).rename_axis('단어').reset_index(name='TF-IDF')
+
+    def monthly_share(self, months, rows=None, min_length=2):
+        """월별 단어 언급 리뷰 비율(%) (월 × 단어)"""
+        months = np.asarray(months)
+        if rows is not None:
+            months = months[rows]
+        counts = self.counts if rows is None else self.counts[rows]
+
+        valid = ~pd.isna(months)
+        month_codes, month_labels = pd.factorize(months[valid], sort=True)
+        # 빈도 대신 언급 여부(0/1)로 집계
+        present = counts[np.flatnonzero(valid)].copy()
+        present.data = np.ones_like(present.data)
+
+        indicator = sp.csr_matrix(
+            (np.ones(len(month_codes)), (month_codes, np.arange(len(month_codes)))),
+            shape=(len(month_labels), len(month_codes))
+        )
+        doc_freq = (indicator @ present).toarray()
+        month_sizes = np.bincount(month_codes, minlength=len(month_labels))
+        share = doc_freq / np.maximum(month_sizes, 1)[:, None] * 100
+
+        frame = pd.DataFrame(share, index=month_labels, columns=self.vocabulary)
+        keep = frame.columns.str.len() >= min_length
+        return frame.loc[:, keep]
+
+    def trending_terms(self, months, rows=None, limit=5, min_share=0.5):
+        """월별 전월 대비 언급 비율 증가 상위 단어 (월, 순위, 단어, 비율, 증감)"""
+        share = self.monthly_share(months, rows)
+        if share.empty:
+            return pd.DataFrame(columns=['월', '순위', '단어', '언급 비율(%)', '전월 대비(%p)'])
+
+        delta = share.diff()
+        records = []
+        for month in share.index[1:]:
+            candidates = delta.loc[month][share.loc[month] >= min_share]
+            for rank, (term, change) in enumerate(candidates.nlargest(limit).items(), start=1):
+                records.append({
+                    '월': month,
+                    '순위': rank,
+                    '단어': term,
+                    '언급 비율(%)': round(share.loc[month, term], 2),
+                    '전월 대비(%p)': round(change, 2)
+                })
+        return pd.DataFrame(records)
+
+
+def load_term_matrix(df, cache_key, cache_dir=DEFAULT_CACHE_DIR):
+    """캐시된 단어 행렬 로드 (버전 일치 시 그대로, 기존 행 뒤에 리뷰가 추가된 경우 증분, 그 외 재생성)"""
+    hashes = row_hashes(df)
+    path = os.path.join(cache_dir, cache_key)
+    cached = TermMatrix.load(path)
+
+    if cached is not None and cached.version == dataset_version(hashes):
+        return cached
+
+    texts = df[SUMMARY_COLUMN].to_numpy()
+    n_cached = 0 if cached is None else len(cached.hashes)
+    if cached is not None and n_cached <= len(hashes) and np.array_equal(cached.hashes, hashes[:n_cached]):
+        matrix = cached.extend(texts[n_cached:], hashes[n_cached:])
+    else:
+        matrix = TermMatrix.build(texts, hashes)
+
+    matrix.save(path)
+    return matrix
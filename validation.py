@@ -0,0 +1,148 @@
+"""
+리뷰 데이터 품질 검증 단계
+적재 시 스키마·값 사전·날짜 파싱 실패·REVIEW_ID 중복·컬럼별 결측률을 한 번에 벡터 연산으로 검사하고
+품질 리포트 생성 및 불량 행 격리 (컬럼별 고유값 단위로 파싱/정규화해 수백만 행에서도 빠르게 동작)
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+
+DATE_COLUMN = '리뷰등록일'
+ID_COLUMN = 'REVIEW_ID'
+
+# 스키마: 없으면 리포트에 기록하는 필수 컬럼
+REQUIRED_COLUMNS = [DATE_COLUMN, '브랜드명', 'OVERALL_SENTIMENT']
+
+# 검증을 위해 초기 로드에 포함하는 컬럼
+VALIDATION_COLUMNS = [DATE_COLUMN, ID_COLUMN]
+
+SENTIMENT_VOCABULARY = ['POSITIVE', 'NEUTRAL', 'NEGATIVE']
+
+# 컬럼별 허용 값 사전 {컬럼: [값, ...]} (*_SENTIMENT 컬럼은 자동으로 감성 사전 적용)
+VOCABULARIES = {}
+
+# 격리 사유 컬럼
+REASON_COLUMN = 'QUARANTINE_REASON'
+
+
+def register_vocabulary(column, values):
+    """컬럼 허용 값 사전 등록 (사전 밖의 값이 있는 행은 격리)"""
+    VOCABULARIES[column] = list(values)
+
+
+def vocabulary_for(column):
+    if column in VOCABULARIES:
+        return VOCABULARIES[column]
+    if column.endswith('_SENTIMENT'):
+        return SENTIMENT_VOCABULARY
+    return None
+
+
+def _factorized(series):
+    """(코드 배열, 고유값 Index) (결측은 코드 -1)"""
+    codes, uniques = pd.factorize(series)
+    return codes, pd.Index(uniques)
+
+
+def _take(values, codes):
+    """고유값 단위 결과를 행 단위로 펼침 (코드 -1은 결측)"""
+    if len(values) == 0:
+        return pd.Index(np.full(len(codes), None), dtype=values.dtype)
+    return values.take(np.maximum(codes, 0)).where(codes >= 0)
+
+
+def _check_dates(raw):
+    """고유값 단위 날짜 파싱 → (변환된 날짜, 파싱 실패 마스크)"""
+    codes, uniques = _factorized(raw)
+    parsed = pd.Index(pd.to_datetime(uniques, errors='coerce'))
+    failed_unique = np.asarray(parsed.isna())
+    failed = (codes >= 0) & failed_unique[codes] if len(uniques) else np.zeros(len(raw), dtype=bool)
+    return pd.Series(_take(parsed, codes), index=raw.index, name=raw.name), failed
+
+
+def _check_vocabulary(raw, vocabulary, normalize):
+    """고유값 단위 정규화(공백 제거·대문자) 후 사전 검사 → (정규화된 값, 사전 밖 값 마스크)"""
+    codes, uniques = _factorized(raw)
+    values = raw
+    if normalize:
+        normalized = pd.Index(uniques.astype(str).str.strip().str.upper())
+        # 이미 정규화된 라벨이면 컬럼을 다시 만들지 않음
+        if not normalized.equals(uniques):
+            values = pd.Series(_take(normalized, codes), index=raw.index, name=raw.name)
+        uniques = normalized
+    invalid_unique = ~np.asarray(uniques.isin(vocabulary))
+    invalid = (codes >= 0) & invalid_unique[codes] if len(uniques) else np.zeros(len(raw), dtype=bool)
+    return values, invalid
+
+
+def validate_reviews(df):
+    """리뷰 DataFrame 검증 → (정상 DataFrame, 격리 DataFrame, 품질 리포트 dict, 정상 행 마스크)
+
+    정상 DataFrame은 날짜가 datetime으로 변환되고 감성 라벨이 정규화된 상태로 반환
+    격리 사유: 날짜 파싱 실패, REVIEW_ID 중복(첫 행만 유지), 값 사전 밖의 라벨
+    """
+    started = time.perf_counter()
+    n = len(df)
+    reasons = {}
+
+    # 컬럼별 결측률 (원본 기준)
+    null_rates = {col: round(float(rate), 4) for col, rate in df.isna().mean().items()} if n else {}
+
+    if DATE_COLUMN in df.columns:
+        df[DATE_COLUMN], reasons['date_parse_failure'] = _check_dates(df[DATE_COLUMN])
+
+    if ID_COLUMN in df.columns:
+        ids = df[ID_COLUMN]
+        reasons['duplicate_review_id'] = (ids.duplicated(keep='first') & ids.notna()).to_numpy()
+
+    invalid_vocabulary = {}
+    for col in df.columns:
+        vocabulary = vocabulary_for(col)
+        if vocabulary is None:
+            continue
+        normalize = col.endswith('_SENTIMENT')
+        df[col], invalid = _check_vocabulary(df[col], vocabulary, normalize)
+        invalid_vocabulary[col] = invalid
+        reasons[f'invalid_{col}'] = invalid
+
+    bad = np.zeros(n, dtype=bool)
+    for mask in reasons.values():
+        bad |= mask
+    kept = ~bad
+
+    quarantine = df[bad].copy()
+    if len(quarantine):
+        # 사유 조합을 비트 코드로 만든 뒤 고유 조합별로 한 번만 문자열 생성
+        labels = list(reasons)
+        bits = np.zeros(len(quarantine), dtype=np.int64)
+        for i, mask in enumerate(reasons.values()):
+            bits |= mask[bad].astype(np.int64) << i
+        codes, uniques = pd.factorize(bits)
+        names = np.array([';'.join(label for i, label in enumerate(labels) if code >> i & 1) for code in uniques])
+        quarantine[REASON_COLUMN] = names[codes]
+    clean = df[kept].reset_index(drop=True) if bad.any() else df
+
+    report = {
+        'rows': int(n),
+        'kept_rows': int(kept.sum()),
+        'quarantined_rows': int(bad.sum()),
+        'missing_columns': [col for col in REQUIRED_COLUMNS if col not in df.columns],
+        'date_parse_failures': int(reasons.get('date_parse_failure', np.zeros(0, dtype=bool)).sum()),
+        'duplicate_review_ids': int(reasons.get('duplicate_review_id', np.zeros(0, dtype=bool)).sum()),
+        'invalid_vocabulary': {col: int(mask.sum()) for col, mask in invalid_vocabulary.items() if mask.any()},
+        'null_rates': null_rates,
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+    return clean, quarantine, report, kept
+
+
+def quality_table(report):
+    """품질 리포트의 컬럼별 결측률·사전 위반 건수 표"""
+    columns = list(report['null_rates'])
+    return pd.DataFrame({
+        '결측률 (%)': [report['null_rates'][col] * 100 for col in columns],
+        '사전 위반': [report['invalid_vocabulary'].get(col, 0) for col in columns],
+    }, index=pd.Index(columns, name='컬럼')).round(2)